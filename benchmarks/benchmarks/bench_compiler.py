@@ -0,0 +1,96 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+# ------------------------------------------------------------------------------
+"""Benchmarks of the steps needed to import an enaml module.
+
+"""
+import marshal
+import os
+import shutil
+import tempfile
+import types
+
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.import_hooks import EnamlImporter, make_file_info
+from enaml.core.parser import parse
+
+from .corpus import KINDS, generate_source
+
+#: Number of repeated units in the generated sources.
+SIZES = (10, 50, 100)
+
+
+class _CorpusBenchmark:
+    """Base class for the benchmarks parametrized over the corpora."""
+
+    params = (KINDS, SIZES)
+    param_names = ("corpus", "size")
+    timeout = 300
+
+    def setup(self, kind, size):
+        self.filename = f"{kind}_{size}.enaml"
+        self.source = generate_source(size, kind)
+
+
+class Parse(_CorpusBenchmark):
+    """Parsing of the source into an enaml ast."""
+
+    def time_parse(self, kind, size):
+        parse(self.source, self.filename)
+
+    def peakmem_parse(self, kind, size):
+        parse(self.source, self.filename)
+
+
+class Compile(_CorpusBenchmark):
+    """Compilation of an enaml ast into a code object."""
+
+    def setup(self, kind, size):
+        super().setup(kind, size)
+        self.ast = parse(self.source, self.filename)
+
+    def time_compile(self, kind, size):
+        EnamlCompiler.compile(self.ast, self.filename)
+
+
+class _ModuleBenchmark(_CorpusBenchmark):
+    """Base class for the benchmarks using a module written on disk."""
+
+    def setup(self, kind, size):
+        super().setup(kind, size)
+        self.tmpdir = tempfile.mkdtemp()
+        src_path = os.path.join(self.tmpdir, self.filename)
+        with open(src_path, "w") as f:
+            f.write(self.source)
+        self.importer = EnamlImporter(make_file_info(src_path, False))
+        # Compile the module once to write the .enamlc file.
+        self.code, _ = self.importer.get_code()
+
+    def teardown(self, kind, size):
+        shutil.rmtree(self.tmpdir)
+
+
+class LoadCache(_ModuleBenchmark):
+    """Loading of the code object from a .enamlc file."""
+
+    def setup(self, kind, size):
+        super().setup(kind, size)
+        self.data = marshal.dumps(self.code)
+
+    def time_get_code(self, kind, size):
+        self.importer.get_code()
+
+    def time_marshal_loads(self, kind, size):
+        marshal.loads(self.data)
+
+
+class ExecModule(_ModuleBenchmark):
+    """Execution of the module code object."""
+
+    def time_exec_module(self, kind, size):
+        module = types.ModuleType(f"{kind}_{size}")
+        self.importer.exec_module(module, self.code)
@@ -0,0 +1,142 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+# ------------------------------------------------------------------------------
+"""Generation of synthetic enaml sources used by the benchmarks.
+
+Each kind of corpus repeats a unit of code a given number of times so that
+the size of the sources grows linearly with the requested size.
+
+"""
+HEADER = """\
+from enaml.core.api import Conditional, Looper
+from enaml.widgets.api import Window, Container, Field, Label, PushButton
+
+
+def format_value(value, precision=2):
+    if isinstance(value, float):
+        return "{:.{}f}".format(value, precision)
+    return str(value)
+
+"""
+
+FOOTER = """\
+enamldef Main(Window):
+    Container:
+        Label:
+            text = "main"
+"""
+
+#: Many independent enamldef blocks mixing most constructs.
+ENAMLDEFS = """\
+enamldef Form{index}(Container):
+    attr model
+    attr count: int = {index}
+    alias title: lbl.text
+    Label: lbl:
+        text = "Form {index}"
+    Field: fld:
+        text << format_value(model.value if model is not None else count)
+        text ::
+            if model is not None:
+                model.value = change["value"]
+    Looper:
+        iterable << range(count % 5)
+        PushButton:
+            text = "Button %d" % loop.index
+            clicked :: print(lbl.text, loop.item)
+    func reset(value=0):
+        self.count = value
+        return [x * 2 for x in range(value) if x % 3]
+
+"""
+
+#: Deeply nested children declared in a single enamldef.
+NESTED = """\
+enamldef Nested{index}(Container):
+    attr depth = {index}
+    Container:
+        padding = 0
+        Container:
+            enabled << depth > 0
+            Container:
+                Conditional:
+                    condition << depth % 2 == 0
+                    Container:
+                        Container:
+                            Label:
+                                text << str(depth)
+                            Field:
+                                text := parent.parent.objectName
+
+"""
+
+#: Templates with specializations and their instantiations.
+TEMPLATES = """\
+template Control{index}(Text, Kind):
+    Label:
+        text = Text
+
+template Control{index}(Text, Kind: int):
+    Field:
+        text = Text
+
+template Pair{index}(Text, Kind):
+    Control{index}(Text, Kind):
+        pass
+    Control{index}(Text + "!", int):
+        pass
+
+enamldef Templated{index}(Container):
+    Pair{index}("first", str):
+        pass
+    Pair{index}("second", int):
+        pass
+
+"""
+
+#: Every operator on many attributes of a single enamldef.
+OPERATORS = """\
+enamldef Operators{index}(Container):
+    attr a{index} = {index}
+    attr b{index} << a{index} * 2 + len(str(a{index}))
+    attr c{index}: int
+    attr d{index}
+    c{index} := a{index}
+    d{index} >> a{index}
+    a{index} ::
+        print(change["name"], change["value"])
+        self.c{index} = change["value"]
+    attr e{index} <<
+        value = a{index}
+        if value > 10:
+            return [v for v in range(value) if v % 2]
+        return {{"value": value, "double": 2 * value}}
+
+"""
+
+#: The units of code repeated in each corpus kind.
+UNITS = {
+    "enamldefs": ENAMLDEFS,
+    "nested": NESTED,
+    "templates": TEMPLATES,
+    "operators": OPERATORS,
+}
+
+#: The available corpus kinds.
+KINDS = tuple(UNITS)
+
+
+def generate_source(n_items, kind="enamldefs"):
+    """Generate an enaml source made of a small Python header followed by
+    n_items repetitions of the unit of the given kind.
+
+    """
+    unit = UNITS[kind]
+    parts = [HEADER]
+    parts.extend(unit.format(index=i) for i in range(n_items))
+    parts.append(FOOTER)
+    return "".join(parts)
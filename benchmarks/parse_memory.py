@@ -0,0 +1,65 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+# ------------------------------------------------------------------------------
+"""Measure the time and peak memory needed to parse enaml sources of
+increasing size.
+
+Run with ``python benchmarks/parse_memory.py`` from the root of the
+repository. Passing ``--unbounded`` disables the release of the parser
+memoization cache between items to compare against the old behavior.
+
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from enaml.core.parser import parse
+from enaml.core.parser.base_enaml_parser import BaseEnamlParser
+
+from benchmarks.corpus import generate_source
+
+
+def measure(source):
+    """Parse the source and return the elapsed time and peak memory."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    parse(source, "<benchmark>", fast_python=False)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1, 10, 50, 100, 200],
+        help="Number of enamldef blocks in the generated sources.",
+    )
+    parser.add_argument(
+        "--unbounded",
+        action="store_true",
+        help="Keep the memoization cache for the whole file.",
+    )
+    args = parser.parse_args()
+
+    BaseEnamlParser.BOUNDED_MEMO = not args.unbounded
+    print(f"{'blocks':>8} {'lines':>8} {'time (s)':>10} {'peak (MiB)':>11}")
+    for size in args.sizes:
+        source = generate_source(size)
+        elapsed, peak = measure(source)
+        lines = source.count("\n")
+        print(f"{size:>8} {lines:>8} {elapsed:>10.3f} {peak / 2**20:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+# ------------------------------------------------------------------------------
+"""Run the asv benchmarks in the current environment without asv.
+
+The benchmarks are meant to be run using ``asv run`` from this directory
+which tracks the results across commits. This script provides a quick way
+to run them against the installed version of enaml, for example::
+
+    python benchmarks/run.py -b Parse --sizes 10
+
+"""
+import argparse
+import importlib
+import inspect
+import itertools
+import pkgutil
+import re
+import timeit
+
+import benchmarks
+
+
+def iter_benchmarks(pattern):
+    """Iterate over the (name, class, method) of the matching benchmarks."""
+    for info in pkgutil.iter_modules(benchmarks.__path__):
+        module = importlib.import_module(f"benchmarks.{info.name}")
+        for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__ or cls_name.startswith("_"):
+                continue
+            for name in dir(cls):
+                if not name.startswith("time_"):
+                    continue
+                full_name = f"{info.name}.{cls_name}.{name}"
+                if re.search(pattern, full_name):
+                    yield full_name, cls, name
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-b", "--bench", default="", help="Regex selecting the benchmarks to run."
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", help="Override the corpus sizes."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of timing repetitions."
+    )
+    args = parser.parse_args()
+
+    for full_name, cls, method in iter_benchmarks(args.bench):
+        print(full_name)
+        params = list(cls.params)
+        if args.sizes and "size" in cls.param_names:
+            params[cls.param_names.index("size")] = args.sizes
+        for values in itertools.product(*params):
+            bench = cls()
+            bench.setup(*values)
+            try:
+                func = getattr(bench, method)
+                timer = timeit.Timer(lambda: func(*values))
+                number, _ = timer.autorange()
+                best = min(timer.repeat(args.repeat, number)) / number
+            finally:
+                if hasattr(bench, "teardown"):
+                    bench.teardown(*values)
+            label = ", ".join(str(v) for v in values)
+            print(f"    {label:<24} {best * 1e3:>12.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,8 +8,10 @@
 """ Command-line tool to compile .py and .enaml files.
 
 """
+import argparse
 import os
 import sys
+import time
 import compileall
 
 from enaml.core.import_hooks import EnamlImporter, make_file_info
@@ -18,6 +20,11 @@ from enaml.core.import_hooks import EnamlImporter, make_file_info
 # We redefine this so create a local reference
 compile_py_file = compileall.compile_file
 
+# When not None, compile_file only records the requested compilations in
+# this list so that they can be dispatched to a pool of worker processes
+# once compileall has finished walking the requested destinations.
+_deferred_jobs = None
+
 
 def compile_enaml_file(fullname, ddir=None, force=0, rx=None, quiet=0,
                        *args, **kwargs):
@@ -26,6 +33,8 @@ def compile_enaml_file(fullname, ddir=None, force=0, rx=None, quiet=0,
     """
     fullname = os.path.abspath(fullname)
     importer = EnamlImporter(make_file_info(fullname))
+    if kwargs.get('invalidation_mode') is not None:
+        importer.invalidation_mode = kwargs['invalidation_mode']
     if not quiet:
         print('Compiling {}...'.format(fullname))
     try:
@@ -64,7 +73,12 @@ def compile_file(fullname, ddir=None, force=0, rx=None, quiet=0,
     name = os.path.basename(fullname)
     if os.path.isfile(fullname):
         head, tail = os.path.splitext(name)
-        if tail == '.py':
+        if _deferred_jobs is not None and tail in ('.py', '.enaml'):
+            _deferred_jobs.append(
+                (fullname, ddir, force, rx, quiet, args, kwargs)
+            )
+            return True
+        elif tail == '.py':
             return compile_py_file(fullname, ddir, force, rx, quiet,
                                    *args, **kwargs)
         elif tail == '.enaml':
@@ -78,9 +92,107 @@ if compileall.compile_file != compile_file:
     compileall.compile_file = compile_file
 
 
+def _run_job(job):
+    """Compile the file described by a deferred job and time it.
+
+    This is the function executed in the worker processes.
+
+    """
+    fullname, ddir, force, rx, quiet, args, kwargs = job
+    start = time.perf_counter()
+    success = compile_file(fullname, ddir, force, rx, quiet, *args, **kwargs)
+    return (fullname, bool(success), time.perf_counter() - start)
+
+
+def compile_jobs(jobs, workers=1):
+    """Compile the files described by a list of deferred jobs.
+
+    Parameters
+    ----------
+    jobs : list
+        List of (fullname, ddir, force, rx, quiet, args, kwargs) tuples
+        as recorded by compile_file.
+    workers : int
+        Number of worker processes to use. 1 compiles the files in the
+        current process, 0 uses as many processes as there are CPUs.
+
+    Returns
+    -------
+    results : list
+        List of (fullname, success, elapsed) tuples in the order of jobs.
+
+    """
+    if workers < 0:
+        raise ValueError('workers must be greater or equal to 0')
+
+    if workers != 1 and len(jobs) > 1:
+        # Check if this is a system where ProcessPoolExecutor can function.
+        from concurrent.futures.process import _check_system_limits
+        try:
+            _check_system_limits()
+        except NotImplementedError:
+            pass
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers or None) as executor:
+                return list(executor.map(_run_job, jobs))
+
+    return [_run_job(job) for job in jobs]
+
+
+def print_timings(results, elapsed, workers):
+    """Print a per-file timing summary, slowest files first.
+
+    """
+    print('\nCompilation timings (slowest first):')
+    for fullname, success, duration in sorted(results, key=lambda r: -r[2]):
+        status = '' if success else ' (failed)'
+        print('{:10.3f}s  {}{}'.format(duration, fullname, status))
+    total = sum(r[2] for r in results)
+    print('Compiled {} files in {:.3f}s ({:.3f}s cumulative, {} workers)'
+          .format(len(results), elapsed, total, workers or os.cpu_count()))
+
+
 def main():
-    exit_status = int(not compileall.main())
-    sys.exit(exit_status)
+    # Parse the options specific to enaml-compileall and let compileall
+    # handle all the other ones.
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('-j', '--workers', default=1, type=int)
+    parser.add_argument('--timings', action='store_true')
+    options, remaining = parser.parse_known_args()
+    if '-h' in remaining or '--help' in remaining:
+        print('enaml-compileall specific options:\n'
+              '  -j WORKERS, --workers WORKERS\n'
+              '                        compile files using WORKERS processes, '
+              '0 uses one per CPU\n'
+              '  --timings             print a per-file timing summary\n')
+
+    # Let compileall walk the destinations while only recording the files
+    # to compile and then compile them, possibly in parallel.
+    global _deferred_jobs
+    argv = sys.argv
+    _deferred_jobs = jobs = []
+    try:
+        sys.argv = argv[:1] + remaining
+        success = compileall.main()
+    finally:
+        sys.argv = argv
+        _deferred_jobs = None
+
+    start = time.perf_counter()
+    try:
+        results = compile_jobs(jobs, options.workers)
+    except KeyboardInterrupt:
+        print("\n[interrupted]")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    quiet = min((job[4] for job in jobs), default=0)
+    if results and not quiet and (options.timings or options.workers != 1):
+        print_timings(results, elapsed, options.workers)
+
+    success = success and all(r[1] for r in results)
+    sys.exit(int(not success))
 
 
 if __name__ == '__main__':
@@ -8,6 +8,8 @@
 from .conditional import Conditional
 from .declarative import Declarative, d_, d_func
 from .dynamic_template import DynamicTemplate
+from .expression_engine import batch_updates
 from .include import Include
 from .looper import Looper
 from .object import Object
+from .virtual_looper import VirtualLooper
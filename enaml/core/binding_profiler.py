@@ -0,0 +1,229 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from collections import Counter
+
+from atom.api import Atom, atomref
+
+from .profiling import Profiler
+from .subscription_observer import current_change
+
+
+#: The operators associated to the standard handler types.
+HANDLER_OPERATORS = {
+    'StandardReadHandler': '=',
+    'StandardConstantReadHandler': '=',
+    'StandardTracedReadHandler': '<<',
+    'StandardWriteHandler': '::',
+    'StandardInvertedWriteHandler': '>>',
+}
+
+
+def binding_location(handler):
+    """ Get the file and line of the code of a handler.
+
+    Returns
+    -------
+    result : tuple
+        The (filename, lineno) pair, or ('<unknown>', 0) if the handler
+        has no code.
+
+    """
+    func = getattr(handler, 'func', None)
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return ('<unknown>', 0)
+    # Expression code objects start at the first line of the module so
+    # use the first line of actual code instead.
+    lines = [line for _, _, line in code.co_lines() if line]
+    return (code.co_filename, min(lines) if lines else code.co_firstlineno)
+
+
+def binding_scope(owner, handler):
+    """ Get the name of the enamldef in which a binding is declared.
+
+    The enamldef is the closest ancestor of the owner, including the owner,
+    whose compiler node holds the scope key of the handler. If none is
+    found, the name of the owner type is returned.
+
+    """
+    scope_key = getattr(handler, 'scope_key', None)
+    obj = owner
+    while obj is not None:
+        node = getattr(type(obj), '__node__', None)
+        if node is not None and node.scope_key is scope_key:
+            return type(obj).__name__
+        obj = getattr(obj, 'parent', None)
+    return type(owner).__name__
+
+
+class BindingProfiler(Profiler):
+    """ A profiler recording the evaluations of the bound expressions.
+
+    For each binding, identified by the enamldef in which it is declared,
+    the bound attribute, the operator and its location, the profiler
+    records the number of evaluations, the time spent evaluating it
+    ('own', excluding the evaluations of other bindings it triggers) and
+    the cumulative time. For subscriptions it also records which member
+    changes triggered the re-evaluations.
+
+    Each kind of evaluation is recorded separately: 'read' when the value
+    of an attribute is first computed, 'update' when a subscription is
+    re-evaluated and 'write' when a change is pushed to a '::' or '>>'
+    binding. The number of updates is also counted for each edge of the
+    subscription graph, see `enaml.core.dependency_graph`.
+
+    The profiler is enabled using enable_binding_profiler or by setting the
+    ENAML_BINDING_PROFILE environment variable before importing enaml, see
+    Profiler. The report method can be called at any time to inspect a
+    running application. The records are keyed by (handler, kind) pairs,
+    in evaluation order.
+
+    """
+    #: The profiler currently recording evaluations.
+    active = None
+
+    #: The prefix of the lines printed by the report.
+    REPORT_PREFIX = 'enaml binding time (ms)'
+
+    def __init__(self):
+        """ Initialize the profiler.
+
+        """
+        super(BindingProfiler, self).__init__()
+
+        #: Number of updates by (atomref(object), member, atomref(owner),
+        #: name) edges of the subscription graph.
+        self.edges = Counter()
+
+    def record(self, owner, name, handler, kind):
+        """ Get the record of a binding, creating it if needed.
+
+        """
+        key = (handler, kind)
+        record = self.records.get(key)
+        if record is None:
+            filename, lineno = binding_location(handler)
+            handler_type = type(handler).__name__
+            record = self.records[key] = {
+                'enamldef': binding_scope(owner, handler),
+                'attribute': name,
+                'operator': HANDLER_OPERATORS.get(handler_type, handler_type),
+                'kind': kind,
+                'file': filename,
+                'line': lineno,
+                'count': 0,
+                'own': 0.0,
+                'cumulative': 0.0,
+                'triggers': Counter(),
+            }
+        return record
+
+    def evaluation(self, owner, name, handler, kind):
+        """ Get a context manager timing the evaluation of a binding.
+
+        """
+        record = self.record(owner, name, handler, kind)
+        if kind == 'update':
+            change = current_change()
+            if change is not None:
+                obj = change.get('object')
+                member = change.get('name')
+                record['triggers']['%s.%s' % (type(obj).__name__, member)] += 1
+                if isinstance(obj, Atom):
+                    edge = (atomref(obj), member, atomref(owner), name)
+                    self.edges[edge] += 1
+        record['count'] += 1
+        return self.section(record, 'own')
+
+    def clear(self):
+        """ Discard all the records.
+
+        """
+        self.records.clear()
+        self.edges.clear()
+
+    def report(self, sort='own', limit=20, file=None):
+        """ Print a table of the most expensive bindings.
+
+        Parameters
+        ----------
+        sort : str, optional
+            The column by which to sort the bindings in decreasing order.
+            It can be 'own', 'cumulative' or 'count'.
+
+        limit : int, optional
+            The maximal number of bindings to report. None reports all the
+            bindings.
+
+        file : file-like, optional
+            The file to write to, defaults to sys.stderr.
+
+        """
+        super(BindingProfiler, self).report(sort, limit, file)
+
+    def report_header(self):
+        """ Get the header line of the report.
+
+        """
+        return '%8s | %11s | %11s | %6s | binding' % (
+            'count', 'own', 'cumulative', 'kind'
+        )
+
+    def report_row(self, row):
+        """ Get the line of the report of a binding.
+
+        """
+        triggers = row['triggers']
+        top = ' <- %s' % triggers[0][0] if triggers else ''
+        return '%8d | %11.3f | %11.3f | %6s | %s.%s %s %s:%d%s' % (
+            row['count'], row['own'] * 1e3, row['cumulative'] * 1e3,
+            row['kind'], row['enamldef'], row['attribute'], row['operator'],
+            row['file'], row['line'], top,
+        )
+
+    def to_json(self):
+        """ Get the records as a list of JSON serializable dictionaries.
+
+        The triggers are reported as a list of [member, count] pairs sorted
+        by decreasing count.
+
+        """
+        rows = []
+        for record in self.records.values():
+            row = dict(record)
+            row['triggers'] = [list(t) for t in record['triggers'].most_common()]
+            rows.append(row)
+        return rows
+
+
+def enable_binding_profiler():
+    """ Start recording the evaluations of the bound expressions.
+
+    Returns
+    -------
+    profiler : BindingProfiler
+        The active profiler. If a profiler was already active, it is
+        returned.
+
+    """
+    return BindingProfiler.enable()
+
+
+def disable_binding_profiler():
+    """ Stop recording the evaluations of the bound expressions.
+
+    Returns
+    -------
+    profiler : BindingProfiler or None
+        The profiler that was active if any.
+
+    """
+    return BindingProfiler.disable()
+
+
+BindingProfiler.setup_from_env('ENAML_BINDING_PROFILE')
@@ -9,7 +9,7 @@ from atom.api import Bool, List
 
 from .compiler_nodes import new_scope
 from .declarative import d_
-from .pattern import Pattern
+from .pattern import Pattern, hide_items, restore_items
 
 
 class Conditional(Pattern):
@@ -17,7 +17,7 @@ class Conditional(Pattern):
 
     When the `condition` attribute is True, the conditional will create
     its child items and insert them into its parent; when False, the old
-    items will be destroyed.
+    items will be destroyed, or hidden if `keep_alive` is True.
 
     """
     #: The condition variable. If this is True, a copy of the children
@@ -25,10 +25,22 @@ class Conditional(Pattern):
     #: be destroyed.
     condition = d_(Bool(True))
 
+    #: Whether to hide the items instead of destroying them when the
+    #: condition becomes False. The items which have a `visible`
+    #: attribute are hidden and are shown again when the condition
+    #: becomes True, instead of being created again.
+    keep_alive = d_(Bool(False))
+
     #: The list of items created by the conditional. This list should
     #: not be manipulated directly by user code.
     items = List()
 
+    #: The (item, visible) pairs of the items hidden by keep alive.
+    _hidden = List()
+
+    #: Whether the items are kept alive while the condition is False.
+    _kept_alive = Bool(False)
+
     #--------------------------------------------------------------------------
     # Lifetime API
     #--------------------------------------------------------------------------
@@ -54,6 +66,17 @@ class Conditional(Pattern):
         if change['type'] == 'update' and self.is_initialized:
             self.refresh_items()
 
+    def _observe_keep_alive(self, change):
+        """ A private observer for the `keep_alive` attribute.
+
+        If keep alive is disabled while the items are hidden, they are
+        destroyed.
+
+        """
+        if (change['type'] == 'update' and self.is_initialized and
+                self._kept_alive and not self.keep_alive):
+            self.refresh_items()
+
     #--------------------------------------------------------------------------
     # Pattern API
     #--------------------------------------------------------------------------
@@ -67,9 +90,25 @@ class Conditional(Pattern):
         """ Refresh the items of the pattern.
 
         This method destroys the old items and creates and initializes
-        the new items.
+        the new items. When keep alive is enabled, the items are hidden
+        and shown instead.
 
         """
+        if self._kept_alive:
+            if self.condition:
+                restore_items(self._hidden)
+                self._hidden = []
+                self._kept_alive = False
+                return
+            elif self.keep_alive:
+                return
+            self._hidden = []
+            self._kept_alive = False
+        elif not self.condition and self.keep_alive and self.items:
+            self._hidden = hide_items(self.items)
+            self._kept_alive = True
+            return
+
         items = []
         if self.condition:
             for nodes, key, f_locals in self.pattern_nodes:
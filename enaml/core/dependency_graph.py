@@ -0,0 +1,162 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import atomref
+
+from .binding_profiler import BindingProfiler
+from .declarative import Declarative
+
+
+#: The suffix of the keys under which the tracers store their subscriptions.
+TRACE_SUFFIX = '|trace]'
+
+
+def node_id(obj, member):
+    """ Get the identifier of the node of a member of an object.
+
+    """
+    return '%s@%x.%s' % (type(obj).__name__, id(obj), member)
+
+
+class DependencyGraph(object):
+    """ A snapshot of the subscription graph of a view tree.
+
+    The nodes are the members of the objects and there is an edge from a
+    member to every attribute bound with '<<' whose expression read it
+    during its last evaluation. Each edge holds the number of times its
+    source triggered a re-evaluation of its target, as counted by the
+    active binding profiler when the snapshot was taken (0 if no profiler
+    was active).
+
+    The graph can be exported as a networkx graph, as node-link data (as
+    produced by networkx.node_link_data) or in the DOT format.
+
+    """
+    def __init__(self):
+        """ Initialize the graph.
+
+        """
+        #: Attributes of the nodes by node identifier.
+        self.nodes = {}
+
+        #: Attributes of the edges by (source, target) identifiers.
+        self.edges = {}
+
+    def add_node(self, obj, member):
+        """ Add the node of a member of an object, if not already present.
+
+        Returns
+        -------
+        result : str
+            The identifier of the node.
+
+        """
+        key = node_id(obj, member)
+        if key not in self.nodes:
+            self.nodes[key] = {
+                'type': type(obj).__name__,
+                'name': getattr(obj, 'name', ''),
+                'member': member,
+            }
+        return key
+
+    def add_edge(self, source, target, triggers=0):
+        """ Add an edge between two nodes.
+
+        """
+        self.edges[(source, target)] = {'triggers': triggers}
+
+    def to_node_link(self):
+        """ Get the graph as JSON serializable node-link data.
+
+        The result can be converted to a graph using
+        networkx.node_link_graph(data, edges='links').
+
+        """
+        return {
+            'directed': True,
+            'multigraph': False,
+            'graph': {},
+            'nodes': [dict(attrs, id=key) for key, attrs in self.nodes.items()],
+            'links': [
+                dict(attrs, source=source, target=target)
+                for (source, target), attrs in self.edges.items()
+            ],
+        }
+
+    def to_networkx(self):
+        """ Get the graph as a networkx DiGraph.
+
+        This requires networkx to be installed.
+
+        """
+        import networkx
+        graph = networkx.DiGraph()
+        graph.add_nodes_from(self.nodes.items())
+        graph.add_edges_from(
+            (source, target, attrs)
+            for (source, target), attrs in self.edges.items()
+        )
+        return graph
+
+    def to_dot(self, name='subscriptions'):
+        """ Get the graph in the DOT format.
+
+        The edges are labelled by their number of triggers.
+
+        """
+        lines = ['digraph "%s" {' % name]
+        for key, attrs in self.nodes.items():
+            label = '%s%s.%s' % (
+                attrs['type'],
+                '(%s)' % attrs['name'] if attrs['name'] else '',
+                attrs['member'],
+            )
+            lines.append('    "%s" [label="%s"];' % (key, label))
+        for (source, target), attrs in self.edges.items():
+            lines.append('    "%s" -> "%s" [label="%d"];'
+                         % (source, target, attrs['triggers']))
+        lines.append('}')
+        return '\n'.join(lines) + '\n'
+
+
+def subscription_graph(root):
+    """ Snapshot the subscription graph of a view tree.
+
+    Parameters
+    ----------
+    root : Object
+        The root of the tree. The subscriptions of all the declarative
+        objects of the tree are included, while the dependencies may be
+        members of any object.
+
+    Returns
+    -------
+    graph : DependencyGraph
+        The snapshot of the graph.
+
+    """
+    profiler = BindingProfiler.active
+    counts = profiler.edges if profiler is not None else {}
+    graph = DependencyGraph()
+    for obj in root.traverse():
+        if not isinstance(obj, Declarative):
+            continue
+        owner_ref = atomref(obj)
+        for key, value in obj._d_storage.items():
+            if not (isinstance(key, str) and key.endswith(TRACE_SUFFIX)):
+                continue
+            name = key[2:-len(TRACE_SUFFIX)]
+            target = graph.add_node(obj, name)
+            for ref, member in value.items:
+                dep = ref()
+                if dep is None:
+                    continue
+                source = graph.add_node(dep, member)
+                triggers = counts.get((ref, member, owner_ref, name), 0)
+                graph.add_edge(source, target, triggers)
+    return graph
@@ -11,7 +11,7 @@ from enaml.application import ScheduledTask, schedule
 from enaml.objectdict import ObjectDict
 
 from .declarative import Declarative, d_, observe
-from .template import Template
+from .template import Template, TemplateInstance
 
 
 class Tagged(ObjectDict):
@@ -95,6 +95,12 @@ class DynamicTemplate(Declarative):
     #: The internal list of items generated by the template.
     _items = List(Declarative)
 
+    #: The internal template instance which generated the items.
+    _instance = Typed(TemplateInstance)
+
+    #: The internal copy of the data applied to the items.
+    _applied_data = Dict()
+
     def initialize(self):
         """ A reimplemented initializer.
 
@@ -127,6 +133,8 @@ class DynamicTemplate(Declarative):
             self._update_task.unschedule()
             del self._update_task
         del self._items
+        del self._instance
+        del self._applied_data
 
     #--------------------------------------------------------------------------
     # Private API
@@ -143,23 +151,43 @@ class DynamicTemplate(Declarative):
     def _refresh(self):
         """ Refresh the template instantiation.
 
-        This method will destroy the old items, build the new items,
-        and then update the parent object and tagged object.
+        If the template instance is unchanged, that is the base and the
+        args are the same, the existing items are kept and only the data
+        values which changed are applied to them. Otherwise, this method
+        will destroy the old items and build the new items. In both cases
+        the tagged object is then updated.
 
         """
         self._update_task = None
 
+        instance = None
         if self.base is not None:
-            items = self.base(*self.args)(**self.data)
+            instance = self.base(*self.args)
+        data = self.data
+        applied = self._applied_data
+        old_items = self._items
+
+        # Removed data keys cannot be undone on the items, so they
+        # require new items.
+        if (instance is not None and instance is self._instance and
+                all(key in data for key in applied) and
+                not any(item.is_destroyed for item in old_items)):
+            items = old_items
+            for key, value in data.items():
+                if key not in applied or applied[key] is not value:
+                    for item in items:
+                        setattr(item, key, value)
         else:
-            items = []
+            items = instance(**data) if instance is not None else []
 
-        for old in self._items:
-            if not old.is_destroyed:
-                old.destroy()
+            for old in old_items:
+                if not old.is_destroyed:
+                    old.destroy()
 
-        if len(items) > 0:
-            self.parent.insert_children(self, items)
+            if len(items) > 0:
+                self.parent.insert_children(self, items)
 
+        self._instance = instance
+        self._applied_data = dict(data)
         self._items = items
         self.tagged = make_tagged(items, self.tags, self.startag)
@@ -136,7 +136,9 @@ from ..compat import PY313
 #      them with their scope of definition. This allows to handle properly
 #      comprehensions and lambdas. Also ensure that we compile the body of the
 #      :: operator as a function to properly handle closure.
-COMPILER_VERSION = 26
+# 27 : Use a 16 bytes header for .enamlc files following PEP 552 to support
+#      hash based validation of the cached files.
+COMPILER_VERSION = 27
 
 
 # Code that will be executed at the top of every enaml module
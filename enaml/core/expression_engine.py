@@ -5,9 +5,136 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Atom, List, Typed
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from atom.api import Atom, Bool, List, Typed, Value
 from atom.datastructures.api import sortedmap
 
+from .binding_profiler import BindingProfiler
+from .standard_tracer import trace_key
+
+
+#: The updates deferred by the active batch, mapping (owner, name) pairs to
+#: the engine which should perform the update. None when no batch is active.
+_pending_updates = None
+
+
+@contextmanager
+def batch_updates():
+    """ A context manager batching the updates of bound expressions.
+
+    While a batch is active, the updates requested to the expression
+    engines, which happen when a dependency of a subscription ('<<')
+    changes, are deferred. When the outermost batch exits, the pending
+    expressions are re-evaluated in dependency order: the expressions on
+    which an expression depends are updated before it, so that each one
+    is evaluated once and never sees an intermediate value. Nested
+    batches are merged into the outermost one.
+
+    """
+    global _pending_updates
+    if _pending_updates is not None:
+        yield
+        return
+
+    pending = _pending_updates = OrderedDict()
+    try:
+        yield
+    finally:
+        # The updates cascading from the flushed ones are queued as well,
+        # so that they are performed once all their dependencies are.
+        try:
+            clean = set()
+            active = set()
+            while pending:
+                _flush_update(pending, next(iter(pending)), clean, active)
+        finally:
+            _pending_updates = None
+
+
+def _flush_update(pending, key, clean, active):
+    """ Perform a pending update after the pending updates it depends on.
+
+    Parameters
+    ----------
+    pending : OrderedDict
+        The pending updates of the batch being flushed.
+
+    key : tuple
+        The (owner, name) pair of the update to perform.
+
+    clean : set
+        The (owner, name) pairs known not to depend on a pending update.
+
+    active : set
+        The (owner, name) pairs of the updates waiting for this one, which
+        are ignored to break the dependency cycles.
+
+    """
+    # The update stays pending while its dependencies are updated so that
+    # the changes they cause do not queue it again. Updating them may
+    # queue other dependencies, which are hence looked up again until
+    # none is pending.
+    active.add(key)
+    try:
+        while True:
+            upstream = _pending_upstream(pending, key, clean, active, set())
+            if upstream is None:
+                break
+            _flush_update(pending, upstream, clean, active)
+    finally:
+        active.discard(key)
+    engine = pending.pop(key)
+    owner, name = key
+    if not owner.is_destroyed:
+        engine._update(owner, name)
+        # The dependencies of the expression may have changed.
+        clean.discard(key)
+
+
+def _pending_upstream(pending, key, clean, active, visited):
+    """ Find a pending update on which an expression depends.
+
+    The dependencies are looked up through the subscriptions of the
+    expressions. The expressions which do not depend on a pending or
+    active update are added to the clean set.
+
+    Returns
+    -------
+    result : tuple or None
+        The (owner, name) pair of a pending update on which the given
+        expression transitively depends, or None if there is none.
+
+    """
+    owner, name = key
+    storage = getattr(owner, '_d_storage', None)
+    observer = storage.get(trace_key(name)) if storage is not None else None
+    is_clean = True
+    if observer is not None:
+        for ref, member in observer.items:
+            dep = (ref(), member)
+            if dep[0] is None:
+                continue
+            if dep in active:
+                is_clean = False
+                continue
+            if dep in pending:
+                return dep
+            if dep in clean:
+                continue
+            if dep in visited:
+                is_clean = False
+                continue
+            visited.add(dep)
+            upstream = _pending_upstream(pending, dep, clean, active, visited)
+            if upstream is not None:
+                return upstream
+            is_clean = is_clean and dep in clean
+    if is_clean:
+        clean.add(key)
+    return None
+
 
 class ReadHandler(Atom):
     """ A base class for defining expression read handlers.
@@ -117,13 +244,28 @@ class HandlerSet(Atom):
 class ExpressionEngine(Atom):
     """ A class which manages reading and writing bound expressions.
 
+    Copies of an engine share their handler table and handler sets until
+    a pair is added to one of them, at which point only the modified
+    parts are copied (copy-on-write).
+
     """
     #: A private mapping of string attribute name to HandlerSet.
     _handlers = Typed(sortedmap, ())
 
+    #: Whether the handler table is shared with other engines.
+    _shared = Bool(False)
+
+    #: The names of the handler sets which are not shared with other
+    #: engines and can be modified in place.
+    _owned = Typed(set, ())
+
     #: A private set of guard tuples for preventing feedback loops.
     _guards = Typed(set, ())
 
+    #: A private mapping of the (owner, name) pairs of the suspended
+    #: attributes to their suspension count, or None if there are none.
+    _suspended = Value()
+
     def __bool__(self):
         """ Get the boolean value for the engine.
 
@@ -145,15 +287,39 @@ class ExpressionEngine(Atom):
             The pair to bind to the expression.
 
         """
+        if self._shared:
+            self._handlers = self._handlers.copy()
+            self._shared = False
+        owned = self._owned
         handler = self._handlers.get(name)
         if handler is None:
             handler = self._handlers[name] = HandlerSet()
+            owned.add(name)
+        elif name not in owned:
+            handler = self._handlers[name] = handler.copy()
+            owned.add(name)
         handler.all_pairs.append(pair)
         if pair.reader is not None:
             handler.read_pair = pair
         if pair.writer is not None:
             handler.write_pairs.append(pair)
 
+    def readers(self):
+        """ Get the read handlers of the engine.
+
+        Returns
+        -------
+        result : list
+            The (name, ReadHandler) pairs of the attributes which have a
+            read handler.
+
+        """
+        return [
+            (name, handler.read_pair.reader)
+            for name, handler in self._handlers.items()
+            if handler.read_pair is not None
+        ]
+
     def read(self, owner, name):
         """ Compute and return the value of an expression.
 
@@ -169,13 +335,22 @@ class ExpressionEngine(Atom):
         -------
         result : object or NotImplemented
             The evaluated value of the expression, or NotImplemented
-            if there is no readable expression in the engine.
+            if there is no readable expression in the engine or if
+            the attribute is suspended.
 
         """
+        suspended = self._suspended
+        if suspended is not None and (owner, name) in suspended:
+            return NotImplemented
         handler = self._handlers.get(name)
         if handler is not None:
             pair = handler.read_pair
             if pair is not None:
+                profiler = BindingProfiler.active
+                if profiler is not None:
+                    reader = pair.reader
+                    with profiler.evaluation(owner, name, reader, 'read'):
+                        return reader(owner, name)
                 return pair.reader(owner, name)
         return NotImplemented
 
@@ -183,8 +358,9 @@ class ExpressionEngine(Atom):
         """ Write a change to an expression.
 
         This method will not run the handler if its paired read handler
-        is actively updating the owner attribute. This behavior protects
-        against feedback loops and saves useless computation.
+        is actively updating the owner attribute, or if the attribute is
+        suspended. This behavior protects against feedback loops and saves
+        useless computation.
 
         Parameters
         ----------
@@ -199,6 +375,9 @@ class ExpressionEngine(Atom):
             which owns the engine.
 
         """
+        suspended = self._suspended
+        if suspended is not None and (owner, name) in suspended:
+            return
         handler = self._handlers.get(name)
         if handler is not None:
             guards = self._guards
@@ -207,7 +386,14 @@ class ExpressionEngine(Atom):
                 if key not in guards:
                     guards.add(key)
                     try:
-                        pair.writer(owner, name, change)
+                        profiler = BindingProfiler.active
+                        if profiler is not None:
+                            writer = pair.writer
+                            with profiler.evaluation(owner, name, writer,
+                                                     'write'):
+                                writer(owner, name, change)
+                        else:
+                            pair.writer(owner, name, change)
                     finally:
                         guards.remove(key)
 
@@ -220,6 +406,9 @@ class ExpressionEngine(Atom):
         updating the owner attribute. This behavior protects against
         feedback loops and saves useless computation.
 
+        When a batch of updates is active, the update is deferred until
+        the end of the batch. See `batch_updates`.
+
         Parameters
         ----------
         owner : Declarative
@@ -229,6 +418,18 @@ class ExpressionEngine(Atom):
             The name of the relevant bound expression.
 
         """
+        if _pending_updates is not None:
+            _pending_updates.setdefault((owner, name), self)
+        else:
+            self._update(owner, name)
+
+    def _update(self, owner, name):
+        """ Update the named attribute of the owner immediately.
+
+        """
+        suspended = self._suspended
+        if suspended is not None and (owner, name) in suspended:
+            return
         handler = self._handlers.get(name)
         if handler is not None:
             pair = handler.read_pair
@@ -238,22 +439,92 @@ class ExpressionEngine(Atom):
                 if key not in guards:
                     guards.add(key)
                     try:
-                        setattr(owner, name, pair.reader(owner, name))
+                        profiler = BindingProfiler.active
+                        if profiler is not None:
+                            reader = pair.reader
+                            with profiler.evaluation(owner, name, reader,
+                                                     'update'):
+                                setattr(owner, name, reader(owner, name))
+                        else:
+                            setattr(owner, name, pair.reader(owner, name))
                     finally:
                         guards.remove(key)
 
+    def suspend(self, owner, name):
+        """ Suspend the expressions bound to the named attribute.
+
+        The expressions of a suspended attribute are neither read nor
+        written until they are resumed, which allows to temporarily set
+        the attribute to another value. The suspensions are counted, the
+        expressions being resumed by the last call to 'resume'.
+
+        Parameters
+        ----------
+        owner : Declarative
+            The declarative object which owns the engine.
+
+        name : str
+            The name of the attribute to suspend.
+
+        """
+        if name in self._handlers:
+            suspended = self._suspended
+            if suspended is None:
+                suspended = self._suspended = {}
+            key = (owner, name)
+            suspended[key] = suspended.get(key, 0) + 1
+
+    def resume(self, owner, name):
+        """ Resume the expressions bound to the named attribute.
+
+        When the last suspension is lifted and a read expression is bound
+        to the attribute, the attribute is updated with its current value.
+
+        Parameters
+        ----------
+        owner : Declarative
+            The declarative object which owns the engine.
+
+        name : str
+            The name of the attribute to resume.
+
+        Returns
+        -------
+        result : bool
+            Whether the attribute is bound to a read expression, in which
+            case its value is managed by the expression.
+
+        """
+        key = (owner, name)
+        suspended = self._suspended
+        if suspended is None or key not in suspended:
+            return False
+        count = suspended.pop(key) - 1
+        if count:
+            suspended[key] = count
+        elif not suspended:
+            self._suspended = None
+        if self._handlers[name].read_pair is None:
+            return False
+        if not count:
+            self.update(owner, name)
+        return True
+
     def copy(self):
         """ Create a copy of the expression engine.
 
+        The copy shares the handler table of this engine, which is only
+        copied by the first engine to which a pair is added.
+
         Returns
         -------
         result : ExpressionEngine
-            A copy of the engine with independent handler sets.
+            A copy of the engine behaving as if its handler sets were
+            independent.
 
         """
         new = ExpressionEngine()
-        handlers = sortedmap()
-        for key, value in self._handlers.items():
-            handlers[key] = value.copy()
-        new._handlers = handlers
+        new._handlers = self._handlers
+        new._shared = self._shared = True
+        self._owned.clear()
         return new
@@ -6,19 +6,25 @@
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
 import marshal
+import mmap
 import os
 import io
 import struct
 import sys
+import tokenize
+import warnings
 from abc import ABCMeta, abstractmethod, abstractclassmethod
 from collections import defaultdict, namedtuple
+from contextlib import nullcontext
 from zipfile import ZipFile
 
 from importlib.machinery import ModuleSpec
-from importlib.util import MAGIC_NUMBER
+from py_compile import PycInvalidationMode
+from importlib.util import MAGIC_NUMBER, source_hash
 
 from .enaml_compiler import EnamlCompiler, COMPILER_VERSION
 from .parser import parse
+from .profiling import Profiler
 from ..compat import read_source, detect_encoding, update_code_co_filename
 
 
@@ -28,6 +34,42 @@ MAGIC_TAG = 'enaml-%s-cv%s' % (sys.implementation.cache_tag, COMPILER_VERSION)
 
 CACHEDIR = '__enamlcache__'
 
+# The header of .enamlc files follows the layout of .pyc files (PEP 552):
+# the magic number, a bit field and either the source timestamp followed by
+# 4 reserved bytes or the hash of the source.
+CACHE_HEADER = struct.Struct('<4sL8s')
+
+# Bit field flags of the header of .enamlc files.
+CACHE_HASH_BASED = 0b01
+
+CACHE_CHECK_SOURCE = 0b10
+
+
+def get_default_invalidation_mode():
+    """ Get the default invalidation mode of the .enamlc files.
+
+    The mode can be selected using the ENAML_CACHE_INVALIDATION_MODE
+    environment variable whose value can be 'timestamp', 'checked-hash' or
+    'unchecked-hash' (see the documentation of py_compile). The default
+    is to use the source timestamp.
+
+    Returns
+    -------
+    mode : py_compile.PycInvalidationMode
+        The mode to use to validate the cached files.
+
+    """
+    value = os.environ.get('ENAML_CACHE_INVALIDATION_MODE')
+    if not value:
+        return PycInvalidationMode.TIMESTAMP
+    try:
+        return PycInvalidationMode[value.replace('-', '_').upper()]
+    except KeyError:
+        msg = ("Invalid value '%s' for ENAML_CACHE_INVALIDATION_MODE, "
+               "falling back to 'timestamp'.")
+        warnings.warn(msg % value, RuntimeWarning)
+        return PycInvalidationMode.TIMESTAMP
+
 
 #------------------------------------------------------------------------------
 # Import Helpers
@@ -35,7 +77,46 @@ CACHEDIR = '__enamlcache__'
 EnamlFileInfo = namedtuple('EnamlFileInfo', 'src_path, cache_path, cache_dir')
 
 
-def make_file_info(src_path):
+# The root directory of a separate tree in which the cached files are
+# written, equivalent of sys.pycache_prefix. None to write the cached files
+# in a __enamlcache__ directory next to the sources.
+_cache_prefix = (os.environ.get('ENAML_CACHE_PREFIX') or
+                 sys.pycache_prefix or None)
+
+
+def get_cache_prefix():
+    """ Get the root of the tree in which the .enamlc files are written.
+
+    The default value is taken from the ENAML_CACHE_PREFIX environment
+    variable if set or sys.pycache_prefix (PYTHONPYCACHEPREFIX) otherwise.
+
+    Returns
+    -------
+    prefix : str or None
+        The root of the cache tree or None if the cached files are
+        written in __enamlcache__ directories next to the sources.
+
+    """
+    return _cache_prefix
+
+
+def set_cache_prefix(prefix):
+    """ Set the root of the tree in which the .enamlc files are written.
+
+    Parameters
+    ----------
+    prefix : str or None
+        The root of the cache tree. The cached file of a source is written
+        in the directory obtained by appending the absolute path of the
+        directory of the source to the prefix. None to write the cached
+        files in __enamlcache__ directories next to the sources.
+
+    """
+    global _cache_prefix
+    _cache_prefix = os.path.abspath(prefix) if prefix else None
+
+
+def make_file_info(src_path, use_cache_prefix=True):
     """ Create an EnamlFileInfo object for the given src_path.
 
     Parameters
@@ -43,6 +124,11 @@ def make_file_info(src_path):
     src_path : string
         The full path to the .enaml file.
 
+    use_cache_prefix : bool, optional
+        Whether to honour the cache prefix. If False or if no prefix is
+        set, the cached file is located in the __enamlcache__ directory
+        next to the source.
+
     Returns
     -------
     result : FileInfo
@@ -51,12 +137,161 @@ def make_file_info(src_path):
     """
     root, tail = os.path.split(src_path)
     fnroot, _ = os.path.splitext(tail)
-    cache_dir = os.path.join(root, CACHEDIR)
+    if use_cache_prefix and _cache_prefix:
+        # Mirror the absolute path of the source directory under the
+        # prefix as done by importlib for sys.pycache_prefix.
+        _, root = os.path.splitdrive(os.path.abspath(root))
+        cache_dir = os.path.join(_cache_prefix, root.lstrip('\\/'))
+    else:
+        cache_dir = os.path.join(root, CACHEDIR)
     fn = ''.join((fnroot, '.', MAGIC_TAG, os.path.extsep, 'enamlc'))
     cache_path = os.path.join(cache_dir, fn)
     return EnamlFileInfo(src_path, cache_path, cache_dir)
 
 
+#------------------------------------------------------------------------------
+# Import Profiler
+#------------------------------------------------------------------------------
+class ImportProfiler(Profiler):
+    """ A profiler recording the time spent in each phase of the import of
+    Enaml modules.
+
+    The recorded phases are: reading the source ('read'), tokenizing it
+    ('tokenize'), parsing it ('parse'), compiling the ast ('compile'),
+    reading and writing the cached file ('cache_read', 'cache_write') and
+    executing the module code ('exec'). The time of each phase excludes the
+    time spent in the phases of the modules imported during that phase, so
+    that the exec time of a module does not include the time needed to
+    compile the Enaml modules it imports. The cumulative time of a module
+    includes the time spent in the phases of the modules it imports.
+
+    The profiler is enabled using enable_import_profiler or by setting the
+    ENAML_IMPORT_PROFILE environment variable before importing enaml, see
+    Profiler. The records are keyed by source path, in import order.
+
+    """
+    #: The phases in the order in which they occur during an import.
+    PHASES = ('read', 'tokenize', 'parse', 'compile', 'cache_read',
+              'cache_write', 'exec')
+
+    #: The profiler currently recording imports.
+    active = None
+
+    #: The prefix of the lines printed by the report.
+    REPORT_PREFIX = 'enaml import time (ms)'
+
+    def record(self, src_path):
+        """ Get the record for a given module source path, creating it if
+        needed.
+
+        """
+        record = self.records.get(src_path)
+        if record is None:
+            record = self.records[src_path] = {
+                'module': None, 'path': src_path, 'cache': None,
+                'cumulative': 0.0,
+            }
+            record.update(dict.fromkeys(self.PHASES, 0.0))
+        return record
+
+    def phase(self, src_path, phase):
+        """ Get a context manager timing a phase of the import of a module.
+
+        """
+        return self.section(self.record(src_path), phase)
+
+    def report(self, sort='cumulative', limit=None, file=None):
+        """ Print a table summarizing the recorded imports.
+
+        Parameters
+        ----------
+        sort : str, optional
+            The column by which to sort the modules in decreasing order.
+            It can be any of the phases, 'total' or 'cumulative'.
+
+        limit : int, optional
+            The maximal number of modules to report.
+
+        file : file-like, optional
+            The file to write to, defaults to sys.stderr.
+
+        """
+        super(ImportProfiler, self).report(sort, limit, file)
+
+    def report_header(self):
+        """ Get the header line of the report.
+
+        """
+        columns = self.PHASES + ('total', 'cumulative')
+        return '%s | cache | module' % ' | '.join('%11s' % c for c in columns)
+
+    def report_row(self, row):
+        """ Get the line of the report of a module.
+
+        """
+        columns = self.PHASES + ('total', 'cumulative')
+        times = ' | '.join('%11.3f' % (row[c] * 1e3) for c in columns)
+        return '%s | %5s | %s' % (
+            times, row['cache'] or '-', row['module'] or row['path']
+        )
+
+    def to_json(self):
+        """ Get the records as a list of JSON serializable dictionaries.
+
+        Each record has a 'total' entry which is the sum of the time spent
+        in the different phases of the module import.
+
+        """
+        rows = []
+        for record in self.records.values():
+            row = dict(record)
+            row['total'] = sum(record[p] for p in self.PHASES)
+            rows.append(row)
+        return rows
+
+
+_NULL_PHASE = nullcontext()
+
+
+def profile_phase(src_path, phase):
+    """ Get a context manager timing a phase of the import of a module if
+    an import profiler is active.
+
+    """
+    profiler = ImportProfiler.active
+    if profiler is None:
+        return _NULL_PHASE
+    return profiler.phase(src_path, phase)
+
+
+def enable_import_profiler():
+    """ Start recording the time spent importing Enaml modules.
+
+    Returns
+    -------
+    profiler : ImportProfiler
+        The active profiler. If a profiler was already active, it is
+        returned.
+
+    """
+    return ImportProfiler.enable()
+
+
+def disable_import_profiler():
+    """ Stop recording the time spent importing Enaml modules.
+
+    Returns
+    -------
+    profiler : ImportProfiler or None
+        The profiler that was active if any.
+
+    """
+    return ImportProfiler.disable()
+
+
+ImportProfiler.setup_from_env('ENAML_IMPORT_PROFILE')
+
+
 #------------------------------------------------------------------------------
 # Abstract Enaml Importer
 #------------------------------------------------------------------------------
@@ -136,12 +371,16 @@ class AbstractEnamlImporter(object, metaclass=ABCMeta):
         if code is None:
             code, _ = self.get_code()
 
+        src_path = self.file_info.src_path
+        if ImportProfiler.active is not None:
+            ImportProfiler.active.record(src_path)['module'] = module.__name__
+
         # Even though the import hook is already installed, this is a
         # safety net to avoid potentially hard to find bugs if code has
         # manually installed and removed a hook. The contract here is
         # that the import hooks are always installed when executing the
         # module code of an Enaml file.
-        with imports():
+        with imports(), profile_phase(src_path, 'exec'):
             exec(code, module.__dict__)
 
     #--------------------------------------------------------------------------
@@ -201,6 +440,18 @@ class EnamlImporter(AbstractEnamlImporter):
     http://www.mail-archive.com/python-dev@python.org/msg45203.html
 
     """
+    #: Cache of the directory listings used to locate modules. Maps the
+    #: directory path to a (mtime, entries) tuple.
+    _path_cache = {}
+
+    #: How the cached files written by the importer are validated. With
+    #: TIMESTAMP the cache is valid if the source was not modified since
+    #: the cache was written, with CHECKED_HASH the cache is valid if the
+    #: source hash matches the one stored in the cache and with
+    #: UNCHECKED_HASH the cache is always considered valid. Cached files are
+    #: always validated according to the mode they were written with.
+    invalidation_mode = get_default_invalidation_mode()
+
     @classmethod
     def locate_module(cls, fullname, path=None):
         """ Searches for the given Enaml module and returns an instance
@@ -226,13 +477,6 @@ class EnamlImporter(AbstractEnamlImporter):
         # We're looking inside a package and 'path' the package path
         if path is not None:
             modname = fullname.rsplit('.', 1)[-1]
-            leaf = ''.join((modname, os.path.extsep, 'enaml'))
-            for stem in path:
-                enaml_path = os.path.join(stem, leaf)
-                file_info = make_file_info(enaml_path)
-                if (os.path.exists(file_info.src_path) or
-                        os.path.exists(file_info.cache_path)):
-                    return cls(file_info)
 
         # We're trying a load a package
         elif '.' in fullname:
@@ -240,13 +484,72 @@ class EnamlImporter(AbstractEnamlImporter):
 
         # We're doing a direct import
         else:
-            leaf = fullname + os.path.extsep + 'enaml'
-            for stem in sys.path:
-                enaml_path = os.path.join(stem, leaf)
-                file_info = make_file_info(enaml_path)
-                if (os.path.exists(file_info.src_path) or
-                        os.path.exists(file_info.cache_path)):
-                    return cls(file_info)
+            modname = fullname
+            path = sys.path
+
+        leaf = ''.join((modname, os.path.extsep, 'enaml'))
+        cache_leaf = ''.join((modname, '.', MAGIC_TAG, os.path.extsep,
+                              'enamlc'))
+        for stem in path:
+            entries = cls._list_directory(stem)
+            if leaf in entries:
+                return cls(make_file_info(os.path.join(stem, leaf)))
+            # Modules distributed without their sources are only looked
+            # up next to their expected source location.
+            if CACHEDIR in entries:
+                cache_dir = os.path.join(stem, CACHEDIR)
+                if cache_leaf in cls._list_directory(cache_dir):
+                    return cls(EnamlFileInfo(
+                        os.path.join(stem, leaf),
+                        os.path.join(cache_dir, cache_leaf),
+                        cache_dir,
+                    ))
+
+    @classmethod
+    def _list_directory(cls, path):
+        """ Get the names of the entries of a directory.
+
+        The listing is cached and only refreshed when the modification
+        time of the directory changes or invalidate_caches is called.
+        This limits the number of system calls performed on each import
+        to a single stat of the directory.
+
+        Parameters
+        ----------
+        path : str
+            Path of the directory to list. An empty string stands for the
+            current working directory.
+
+        Returns
+        -------
+        entries : frozenset
+            The names of the entries of the directory. If the directory
+            cannot be read, the set is empty.
+
+        """
+        try:
+            mtime = os.stat(path or os.curdir).st_mtime
+        except OSError:
+            return frozenset()
+        cached = cls._path_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            entries = frozenset(os.listdir(path or os.curdir))
+        except OSError:
+            entries = frozenset()
+        cls._path_cache[path] = (mtime, entries)
+        return entries
+
+    @classmethod
+    def invalidate_caches(cls):
+        """ Clear the cached directory listings.
+
+        This is called by importlib.invalidate_caches when the importer is
+        installed on sys.meta_path.
+
+        """
+        cls._path_cache.clear()
 
     def __init__(self, file_info):
         """ Initialize an importer object.
@@ -276,17 +579,22 @@ class EnamlImporter(AbstractEnamlImporter):
 
         """
         with open(file_info.cache_path, 'rb') as cache_file:
-            cache_file.read(8)
+            cache_file.read(CACHE_HEADER.size)
             code = marshal.load(cache_file)
         if set_src:
             code = update_code_co_filename(code, file_info.src_path)
         return code
 
-    def _write_cache(self, code, ts, file_info):
+    def _write_cache(self, code, ts, file_info, src_hash=None):
         """ Write the cached file for then given info, creating the
         cache directory if needed. This call will suppress any
         IOError or OSError exceptions.
 
+        The file is first written under a temporary name and then moved
+        in place so that concurrent readers and writers (for example
+        several processes run by enaml-compileall) never observe a
+        partially written cache file.
+
         Parameters
         ----------
         code : types.CodeType
@@ -298,16 +606,31 @@ class EnamlImporter(AbstractEnamlImporter):
         file_info : EnamlFileInfo
             The file info object for the file.
 
+        src_hash : bytes, optional
+            The hash of the source. If provided a hash based cache file is
+            written and the timestamp is ignored.
+
         """
+        if src_hash is None:
+            flags = 0
+            data = struct.pack('<LL', ts & 0xFFFF_FFFF, 0)
+        else:
+            flags = CACHE_HASH_BASED
+            if self.invalidation_mode == PycInvalidationMode.CHECKED_HASH:
+                flags |= CACHE_CHECK_SOURCE
+            data = src_hash
+        tmp_path = '%s.%d.tmp' % (file_info.cache_path, os.getpid())
         try:
-            if not os.path.exists(file_info.cache_dir):
-                os.mkdir(file_info.cache_dir)
-            with open(file_info.cache_path, 'w+b') as cache_file:
-                cache_file.write(MAGIC_NUMBER)
-                cache_file.write(struct.pack('<L', ts & 0xFFFF_FFFF))
+            os.makedirs(file_info.cache_dir, exist_ok=True)
+            with open(tmp_path, 'w+b') as cache_file:
+                cache_file.write(CACHE_HEADER.pack(MAGIC_NUMBER, flags, data))
                 marshal.dump(code, cache_file)
+            os.replace(tmp_path, file_info.cache_path)
         except (OSError, IOError):
-            pass
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
     def _get_magic_info(self, file_info):
         """ Loads and returns the magic info for the given path.
@@ -319,14 +642,16 @@ class EnamlImporter(AbstractEnamlImporter):
 
         Returns
         -------
-        result : (magic, timestamp)
-            The magic string and integer timestamp for the file.
+        result : (magic, flags, data)
+            The magic string, the integer bit field and the validation
+            data (the packed timestamp or the source hash) of the file.
 
         """
         with open(file_info.cache_path, 'rb') as cache_file:
-            magic = cache_file.read(4)
-            timestamp = struct.unpack('<L', cache_file.read(4))[0]
-        return (magic, timestamp)
+            header = cache_file.read(CACHE_HEADER.size)
+        if len(header) != CACHE_HEADER.size:
+            return (b'', 0, b'')
+        return CACHE_HEADER.unpack(header)
 
     def read_source(self):
         """ Read the source code for the Enaml module.
@@ -345,6 +670,13 @@ class EnamlImporter(AbstractEnamlImporter):
         """
         return int(os.path.getmtime(self.file_info.src_path))
 
+    def get_source_hash(self):
+        """ Get the hash of the source for the Enaml module.
+
+        """
+        with open(self.file_info.src_path, 'rb') as src_file:
+            return source_hash(src_file.read())
+
     def compile_code(self):
         """ Compile the code object for the Enaml module and
         the full path to the module for use as the __file__ attribute
@@ -358,11 +690,31 @@ class EnamlImporter(AbstractEnamlImporter):
 
         """
         file_info = self.file_info
-        src_mod_time = self.get_source_modified_time()
-        ast = parse(self.read_source(), file_info.src_path)
-        code = EnamlCompiler.compile(ast, file_info.src_path)
-        self._write_cache(code, src_mod_time, file_info)
-        return (code, file_info.src_path)
+        src_path = file_info.src_path
+        with profile_phase(src_path, 'read'):
+            src_mod_time = self.get_source_modified_time()
+            src_hash = None
+            if self.invalidation_mode != PycInvalidationMode.TIMESTAMP:
+                src_hash = self.get_source_hash()
+            source = self.read_source()
+
+        # When profiling, tokenize the source upfront to time it separately
+        # from the parsing.
+        token_stream_factory = None
+        if ImportProfiler.active is not None:
+            with profile_phase(src_path, 'tokenize'):
+                readline = io.StringIO(source).readline
+                tokens = list(tokenize.generate_tokens(readline))
+            token_stream_factory = lambda readline: iter(tokens)
+
+        with profile_phase(src_path, 'parse'):
+            ast = parse(source, src_path,
+                        token_stream_factory=token_stream_factory)
+        with profile_phase(src_path, 'compile'):
+            code = EnamlCompiler.compile(ast, src_path)
+        with profile_phase(src_path, 'cache_write'):
+            self._write_cache(code, src_mod_time, file_info, src_hash)
+        return (code, src_path)
 
     def get_code(self):
         """ Loads and returns the code object for the Enaml module and
@@ -382,19 +734,35 @@ class EnamlImporter(AbstractEnamlImporter):
         # it was deleted between then and now, an IOError is more
         # informative than an ImportError.
         file_info = self.file_info
+        profiler = ImportProfiler.active
+        if profiler is not None:
+            record = profiler.record(file_info.src_path)
+            record['cache'] = 'hit'
+
         if not os.path.exists(file_info.src_path):
-            code = self._load_cache(file_info)
+            with profile_phase(file_info.src_path, 'cache_read'):
+                code = self._load_cache(file_info)
             return (code, file_info.src_path)
 
         # Use the cached file if it exists and is current
-        src_mod_time = self.get_source_modified_time()
-        if os.path.exists(file_info.cache_path):
-            magic, ts = self._get_magic_info(file_info)
-            if magic == MAGIC_NUMBER and src_mod_time <= ts:
-                code = self._load_cache(file_info, set_src=True)
-                return (code, file_info.src_path)
+        with profile_phase(file_info.src_path, 'cache_read'):
+            if os.path.exists(file_info.cache_path):
+                magic, flags, data = self._get_magic_info(file_info)
+                if magic != MAGIC_NUMBER:
+                    valid = False
+                elif flags & CACHE_HASH_BASED:
+                    valid = (not flags & CACHE_CHECK_SOURCE or
+                             data == self.get_source_hash())
+                else:
+                    ts = struct.unpack('<L', data[:4])[0]
+                    valid = self.get_source_modified_time() <= ts
+                if valid:
+                    code = self._load_cache(file_info, set_src=True)
+                    return (code, file_info.src_path)
 
         # Otherwise, compile from source and attempt to cache
+        if profiler is not None:
+            record['cache'] = 'miss'
         return self.compile_code()
 
 
@@ -408,6 +776,10 @@ class EnamlZipImporter(EnamlImporter):
         '.zip': ZipFile,
     }
 
+    #: Cache of the opened archives. Maps the archive path to a
+    #: (mtime, archive, names) tuple.
+    _archives = {}
+
     @classmethod
     def locate_module(cls, fullname, path=None):
         """ Searches for the given Enaml module within a zip and returns an
@@ -441,30 +813,31 @@ class EnamlZipImporter(EnamlImporter):
             leaf = ''.join((modname, os.path.extsep, 'enaml'))
             for stem in path:
                 enaml_path = os.path.join(stem, leaf)
-                file_info = make_file_info(enaml_path)
+                file_info = make_file_info(enaml_path, False)
 
                 # Strip package off path to get the archive name
                 archive_path = stem
                 for p in pkgpath:
                     archive_path = os.path.dirname(archive_path)
 
-                # To check if cache file is in zip file
-                cache_path = os.path.relpath(file_info.cache_path,
-                                             archive_path).replace("\\", "/")
-
-                if (cls._is_supported(archive_path) and
-                        os.path.exists(archive_path)):
-
-                    # Path where code should be within the archive
-                    code_path = '/'.join(pkgpath + [leaf])
+                if cls._is_supported(archive_path):
                     try:
-                        with ZipFile(archive_path, 'r') as archive:
-                            name_list = archive.namelist()
-                            if ((code_path in name_list) or
-                                    (cache_path in name_list)):
-                                return cls(file_info, archive_path)
+                        index = cls._get_archive(archive_path)
                     except IOError:
                         return
+                    if index is None:
+                        continue
+                    _, name_list = index
+
+                    # Path where code should be within the archive
+                    code_path = '/'.join(pkgpath + [leaf])
+                    # To check if cache file is in zip file
+                    cache_path = os.path.relpath(
+                        file_info.cache_path, archive_path
+                    ).replace("\\", "/")
+                    if ((code_path in name_list) or
+                            (cache_path in name_list)):
+                        return cls(file_info, archive_path)
 
         # We're trying a load a package
         elif '.' in fullname:
@@ -474,20 +847,68 @@ class EnamlZipImporter(EnamlImporter):
         else:
             leaf = fullname + os.path.extsep + 'enaml'
             for stem in sys.path:
-                enaml_path = os.path.join(stem, leaf)
-                file_info = make_file_info(enaml_path)
-                # To check if cache file is in zip file
-                cache_path = os.path.relpath(file_info.cache_path,
-                                             stem).replace("\\", "/")
-                if cls._is_supported(stem) and os.path.exists(stem):
+                if cls._is_supported(stem):
                     try:
-                        with ZipFile(stem, 'r') as archive:
-                            name_list = archive.namelist()
-                            if ((leaf in name_list) or
-                                    (cache_path in name_list)):
-                                return cls(file_info, stem)
+                        index = cls._get_archive(stem)
                     except IOError:
                         return
+                    if index is None:
+                        continue
+                    _, name_list = index
+
+                    enaml_path = os.path.join(stem, leaf)
+                    file_info = make_file_info(enaml_path, False)
+                    # To check if cache file is in zip file
+                    cache_path = os.path.relpath(file_info.cache_path,
+                                                 stem).replace("\\", "/")
+                    if (leaf in name_list) or (cache_path in name_list):
+                        return cls(file_info, stem)
+
+    @classmethod
+    def _get_archive(cls, archive_path):
+        """ Get the opened archive and the names of its members.
+
+        Archives are opened once and kept open along with the names of
+        their members so that their central directory is parsed only once.
+        An archive is re-opened when its modification time changes.
+
+        Parameters
+        ----------
+        archive_path : str
+            The full path to the archive.
+
+        Returns
+        -------
+        result : (archive, names) or None
+            The opened archive and the frozenset of the names of its
+            members or None if the archive does not exist.
+
+        """
+        try:
+            mtime = os.stat(archive_path).st_mtime
+        except OSError:
+            return None
+        cached = cls._archives.get(archive_path)
+        if cached is not None:
+            if cached[0] == mtime:
+                return cached[1:]
+            del cls._archives[archive_path]
+            cached[1].close()
+        file_type = os.path.splitext(archive_path)[-1].lower()
+        archive = cls.supported_archives[file_type](archive_path, 'r')
+        names = frozenset(archive.namelist())
+        cls._archives[archive_path] = (mtime, archive, names)
+        return (archive, names)
+
+    @classmethod
+    def invalidate_caches(cls):
+        """ Close the cached archives and clear their index.
+
+        """
+        super(EnamlZipImporter, cls).invalidate_caches()
+        archives = cls._archives
+        while archives:
+            archives.popitem()[1][1].close()
 
     @classmethod
     def _is_supported(cls, archive_path):
@@ -548,7 +969,14 @@ class EnamlZipImporter(EnamlImporter):
 
         return src
 
-    def _write_cache(self, code, ts, file_info):
+    def get_source_hash(self):
+        """ Overridden to hash the source read from the currently opened
+        archive instead of the source file.
+
+        """
+        return source_hash(self.archive.read(self.code_path))
+
+    def _write_cache(self, code, ts, file_info, src_hash=None):
         """ Overridden to because cache files cannot be written into
         the archive.
 
@@ -569,24 +997,219 @@ class EnamlZipImporter(EnamlImporter):
         """
         # Load it from the archive as no cache can exist outside
         file_info = self.file_info
-        with ZipFile(self.archive_path, 'r') as archive:
-            # Path within the archive that should contain the cached module
-            code_cache_path = os.path.relpath(
-                file_info.cache_path, self.archive_path).replace("\\", "/")
-
-            # Try to use the cached file embedded in the archive
-            if code_cache_path in archive.namelist():
-                # Compile the cached code
+        index = self._get_archive(self.archive_path)
+        if index is None:
+            raise IOError('No such archive: %r' % self.archive_path)
+        archive, name_list = index
+
+        # Path within the archive that should contain the cached module
+        code_cache_path = os.path.relpath(
+            file_info.cache_path, self.archive_path).replace("\\", "/")
+
+        # Try to use the cached file embedded in the archive
+        profiler = ImportProfiler.active
+        if code_cache_path in name_list:
+            if profiler is not None:
+                profiler.record(file_info.src_path)['cache'] = 'hit'
+            # Compile the cached code
+            with profile_phase(file_info.src_path, 'cache_read'):
                 cache = archive.read(code_cache_path)
-                code = marshal.loads(cache[8:])
-                return (code, code_cache_path)
+                code = marshal.loads(cache[CACHE_HEADER.size:])
+            return (code, code_cache_path)
+
+        #: Save reference
+        self.archive = archive
+
+        # Otherwise, compile from source and attempt
+        # to cache it on the system
+        if profiler is not None:
+            profiler.record(file_info.src_path)['cache'] = 'miss'
+        return self.compile_code()
+
+
+#------------------------------------------------------------------------------
+# Enaml Bundle Importer
+#------------------------------------------------------------------------------
+BUNDLE_MAGIC = b'ENAMLBDL'
+
+# Bundle header: bundle magic, interpreter magic number, compiler version,
+# offset and size of the marshalled index.
+BUNDLE_HEADER = struct.Struct('<8s4sLQQ')
+
 
-            #: Save reference
-            self.archive = archive
+def write_bundle(bundle_path, modules):
+    """ Compile Enaml modules into a single bundle file.
 
-            # Otherwise, compile from source and attempt
-            # to cache it on the system
-            return self.compile_code()
+    The bundle starts with a header followed by the marshalled code
+    objects of the modules and ends with a marshalled index mapping each
+    module name to an (offset, size, source hash, source path) tuple.
+
+    Parameters
+    ----------
+    bundle_path : str
+        The path of the bundle file to create. An existing file is
+        atomically replaced.
+
+    modules : iterable
+        An iterable of (fullname, src_path) tuples describing the
+        modules to include in the bundle.
+
+    """
+    index = {}
+    tmp_path = '%s.%d.tmp' % (bundle_path, os.getpid())
+    try:
+        with open(tmp_path, 'wb') as bundle:
+            bundle.write(b'\0' * BUNDLE_HEADER.size)
+            for fullname, src_path in modules:
+                with open(src_path, 'rb') as src_file:
+                    src_hash = source_hash(src_file.read())
+                ast = parse(read_source(src_path), src_path)
+                code = EnamlCompiler.compile(ast, src_path)
+                data = marshal.dumps(code)
+                index[fullname] = (bundle.tell(), len(data), src_hash, src_path)
+                bundle.write(data)
+            data = marshal.dumps(index)
+            offset = bundle.tell()
+            bundle.write(data)
+            bundle.seek(0)
+            bundle.write(BUNDLE_HEADER.pack(BUNDLE_MAGIC, MAGIC_NUMBER,
+                                            COMPILER_VERSION, offset,
+                                            len(data)))
+        os.replace(tmp_path, bundle_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class EnamlBundleImporter(EnamlImporter):
+    """ An importer loading Enaml modules from precompiled bundles.
+
+    Bundles are created using write_bundle and must be registered using
+    add_bundle. Each bundle is memory-mapped once and its index is kept
+    in memory so that locating and loading a module does not require
+    any access to the file system.
+
+    """
+    #: The memory-mapped bundles currently registered, by bundle path.
+    _bundles = {}
+
+    #: Index of the modules available in the registered bundles. Maps the
+    #: module name to a (bundle_path, offset, size, hash, src_path) tuple.
+    _modules = {}
+
+    #: Whether to compile a module from its source instead of using the
+    #: bundle if the source file exists and does not match the source the
+    #: bundle was generated from.
+    check_source = False
+
+    @classmethod
+    def add_bundle(cls, bundle_path):
+        """ Register a bundle. Its modules take precedence over the ones
+        of the previously registered bundles.
+
+        Parameters
+        ----------
+        bundle_path : str
+            The path to a bundle created by write_bundle.
+
+        """
+        bundle_path = os.path.abspath(bundle_path)
+        cls.remove_bundle(bundle_path)
+        with open(bundle_path, 'rb') as bundle_file:
+            try:
+                data = mmap.mmap(bundle_file.fileno(), 0,
+                                 access=mmap.ACCESS_READ)
+            except ValueError:
+                data = None
+        try:
+            header = BUNDLE_HEADER.unpack_from(data)
+        except (TypeError, struct.error):
+            header = None
+        if header is None or header[:3] != (BUNDLE_MAGIC, MAGIC_NUMBER,
+                                            COMPILER_VERSION):
+            if data is not None:
+                data.close()
+            msg = '%s is not an Enaml bundle compatible with this interpreter'
+            raise ImportError(msg % bundle_path)
+        offset, size = header[3:]
+        index = marshal.loads(data[offset:offset + size])
+        cls._bundles[bundle_path] = data
+        for fullname, entry in index.items():
+            cls._modules[fullname] = (bundle_path,) + entry
+
+    @classmethod
+    def remove_bundle(cls, bundle_path):
+        """ Unregister a bundle. If the bundle is not registered, this is
+        a no-op.
+
+        """
+        bundle_path = os.path.abspath(bundle_path)
+        data = cls._bundles.pop(bundle_path, None)
+        if data is not None:
+            modules = cls._modules
+            for fullname in [n for n, e in modules.items()
+                             if e[0] == bundle_path]:
+                del modules[fullname]
+            data.close()
+
+    @classmethod
+    def locate_module(cls, fullname, path=None):
+        """ Searches for the given Enaml module in the registered bundles
+        and returns an instance of this class on success.
+
+        """
+        entry = cls._modules.get(fullname)
+        if entry is not None:
+            return cls(entry)
+
+    def __init__(self, entry):
+        """ Initialize an importer object.
+
+        Parameters
+        ----------
+        entry : tuple
+            The (bundle_path, offset, size, hash, src_path) index entry
+            of the module.
+
+        """
+        bundle_path, _, _, _, src_path = entry
+        super(EnamlBundleImporter, self).__init__(
+            EnamlFileInfo(src_path, bundle_path, os.path.dirname(bundle_path))
+        )
+        self.entry = entry
+
+    def _write_cache(self, code, ts, file_info, src_hash=None):
+        """ Overridden because bundled modules are never cached.
+
+        """
+        pass
+
+    def get_code(self):
+        """ Loads and returns the code object for the Enaml module and
+        the full path to the module for use as the __file__ attribute
+        of the module.
+
+        Returns
+        -------
+        result : (code, path)
+            The Python code object for the .enaml module, and the full
+            path to the module as a string.
+
+        """
+        bundle_path, offset, size, src_hash, src_path = self.entry
+        profiler = ImportProfiler.active
+        if self.check_source and os.path.isfile(src_path):
+            with open(src_path, 'rb') as src_file:
+                if source_hash(src_file.read()) != src_hash:
+                    if profiler is not None:
+                        profiler.record(src_path)['cache'] = 'miss'
+                    return self.compile_code()
+        if profiler is not None:
+            profiler.record(src_path)['cache'] = 'hit'
+        with profile_phase(src_path, 'cache_read'):
+            data = self._bundles[bundle_path]
+            code = marshal.loads(data[offset:offset + size])
+        return (code, src_path)
 
 
 #------------------------------------------------------------------------------
@@ -601,7 +1224,7 @@ class imports(object):
     """
     #: The framework-wide importers in use. We always have the default
     #: importer available, unless it is explicitly removed.
-    __importers = [EnamlImporter, EnamlZipImporter]
+    __importers = [EnamlImporter, EnamlZipImporter, EnamlBundleImporter]
 
     @classmethod
     def get_importers(cls):
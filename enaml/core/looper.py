@@ -8,12 +8,15 @@
 from abc import ABCMeta
 from collections.abc import Iterable, Iterator
 
-from atom.api import Atom, Int, Coerced, List, Typed, Value
+from atom.api import Atom, Callable, Int, Coerced, ContainerList, List, Value
 from atom.datastructures.api import sortedmap
 
 from .compiler_nodes import new_scope
 from .declarative import d_
-from .pattern import Pattern
+from .expression_engine import batch_updates
+from .pattern import Pattern, hide_items, restore_items
+from .standard_handlers import StandardConstantReadHandler
+from .standard_tracer import trace_key
 
 
 def coerce_iterable(iterable):
@@ -56,6 +59,12 @@ class Iteration(Atom):
     #: Nodes generated by the Looper
     nodes = List()
 
+    #: The local scopes in which the nodes were generated.
+    _scopes = List()
+
+    #: The (item, visible) pairs of the hidden items of a pooled iteration.
+    _hidden = List()
+
 
 class Looper(Pattern):
     """ A pattern object that repeats its children over an iterable.
@@ -74,8 +83,17 @@ class Looper(Pattern):
     which have changed. When an item in the iterable is moved the
     `loop.index` will be updated to reflect the new index.
 
-    The Looper works under the assumption that the values stored in the
-    iterable are unique.
+    The iterations are matched to the items of the iterable by key, which
+    is the item itself unless a `key` function is provided. A key function
+    allows to reuse the iterations of unhashable items, or of items which
+    are replaced by equivalent objects. Items with duplicate keys are
+    matched in order of appearance.
+
+    When the iterable is bound with '<<' to a `ContainerList` member of an
+    atom object, the looper observes the operations on the list (append,
+    insert, extend, remove, pop, del and item assignment) and only creates
+    and destroys the iterations of the affected items. Other operations,
+    such as sort, refresh all the items.
 
     The `loop_item` and `loop_index` scope variables are depreciated in favor
     of `loop.item` and `loop.index` respectively. This is because the old
@@ -83,21 +101,37 @@ class Looper(Pattern):
 
     """
     #: The iterable to use when creating the items for the looper.
-    #: The items in the iterable must be unique. This allows the
-    #: Looper to optimize the creation and destruction of widgets.
     #: If the iterable is an Iterator it is first coerced to a tuple.
     iterable = d_(Coerced(LooperIterable, coercer=coerce_iterable))
 
+    #: An optional function computing the key of an item of the iterable.
+    #: When the iterable changes, the iterations of the items whose key
+    #: is unchanged are kept and their `loop.item` is updated.
+    key = d_(Callable())
+
+    #: The maximum number of released iterations whose items are kept
+    #: hidden for reuse. When an iteration is needed for a new item, a
+    #: released iteration is rebound to it (as by a VirtualLooper) rather
+    #: than creating new items. Zero disables recycling.
+    pool_size = d_(Int(0))
+
     #: The list of items created by the conditional. Each item in the
     #: list represents one iteration of the loop and is a list of the
     #: items generated during that iteration. This list should not be
     #: manipulated directly by user code.
     items = List()
 
-    #: Private data storage which maps the user iterable data to the
-    #: list of items created for that iteration. This allows the looper
-    #: to only create and destroy the items which have changed.
-    _iter_data = Typed(sortedmap, ())
+    #: Private data storage holding the (key, Iteration) pairs of the
+    #: iterations in order. This allows the looper to only create and
+    #: destroy the items which have changed.
+    _iter_data = List()
+
+    #: The released iterations kept for reuse.
+    _pool = List()
+
+    #: The (atomref(object), member name) pair holding the iterable when
+    #: it is a ContainerList observed for granular updates.
+    _iterable_source = Value()
 
     #--------------------------------------------------------------------------
     # Lifetime API
@@ -108,10 +142,12 @@ class Looper(Pattern):
         The looper will release the owned items on destruction.
 
         """
+        self._unbind_iterable_source()
         super(Looper, self).destroy()
         del self.iterable
         del self.items
         del self._iter_data
+        del self._pool
 
     #--------------------------------------------------------------------------
     # Observers
@@ -132,62 +168,369 @@ class Looper(Pattern):
     def pattern_items(self):
         """ Get a list of items created by the pattern.
 
+        The items of the pooled iterations are included since they are
+        hidden children of the parent.
+
         """
-        return sum(self.items, [])
+        items = sum(self.items, [])
+        for iter_data in self._pool:
+            items.extend(iter_data.nodes)
+        return items
 
     def refresh_items(self):
         """ Refresh the items of the pattern.
 
-        This method destroys the old items and creates and initializes
-        the new items.
+        The iterations of the items of the new iterable are matched to
+        the existing ones by key. Only the iterations which are not
+        matched are destroyed or created, and only the children of the
+        iterations which are not in the same relative order as before are
+        moved in the parent.
 
         """
-        old_items = self.items[:]
         old_iter_data = self._iter_data
         iterable = self.iterable
         pattern_nodes = self.pattern_nodes
-        new_iter_data = sortedmap()
-        new_items = []
-
+        entries = []
         if iterable is not None and len(pattern_nodes) > 0:
-            for loop_index, loop_item in enumerate(iterable):
-                iter_data = old_iter_data.get(loop_item)
-                if iter_data is not None:
-                    new_iter_data[loop_item] = iter_data
-                    iteration = iter_data.nodes
-                    new_items.append(iteration)
-                    old_items.remove(iteration)
+            key = self.key
+            if key is None:
+                entries = [(item, item) for item in iterable]
+            else:
+                entries = [(key(item), item) for item in iterable]
+
+        # Unhashable keys are supported using an ordered map.
+        try:
+            matches, pool = match_iterations(old_iter_data, entries, {})
+        except TypeError:
+            matches, pool = match_iterations(
+                old_iter_data, entries, sortedmap()
+            )
+
+        # When recycling, the unmatched iterations are directly rebound to
+        # the new items.
+        released = [it for its in pool.values() for it in its]
+        recycled = released if self.pool_size > 0 else []
+
+        new_iter_data = []
+        new_iterations = []
+        for loop_index, ((key, loop_item), iter_data) in enumerate(
+            zip(entries, matches)
+        ):
+            if iter_data is not None:
+                # A key may match an iteration to another item object.
+                if iter_data.item is not loop_item:
+                    rebind_iteration(iter_data, loop_index, loop_item)
+                else:
                     iter_data.index = loop_index
-                    continue
-                iter_data = Iteration(index=loop_index, item=loop_item)
-                iteration = iter_data.nodes
-                new_iter_data[loop_item] = iter_data
-                new_items.append(iteration)
-                for nodes, key, f_locals in pattern_nodes:
-                    with new_scope(key, f_locals) as f_locals:
-                        # Retain for compatibility reasons
-                        f_locals['loop_index'] = loop_index
-                        f_locals['loop_item'] = loop_item
-                        f_locals['loop'] = iter_data
-                        for node in nodes:
-                            child = node(None)
-                            if isinstance(child, list):
-                                iteration.extend(child)
-                            else:
-                                iteration.append(child)
-
-        for iteration in old_items:
-            for old in iteration:
-                if not old.is_destroyed:
-                    old.destroy()
-
-        if len(new_items) > 0:
+            elif recycled:
+                iter_data = recycled.pop()
+                rebind_iteration(iter_data, loop_index, loop_item)
+            else:
+                iter_data = self._acquire_iteration(loop_index, loop_item)
+            new_iter_data.append((key, iter_data))
+            new_iterations.append(iter_data)
+
+        for iter_data in (recycled if self.pool_size > 0 else released):
+            self._release_iteration(iter_data)
+
+        self._place_iterations(new_iterations)
+        self.items = [iter_data.nodes for iter_data in new_iterations]
+        self._iter_data = new_iter_data
+        self._bind_iterable_source()
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _acquire_iteration(self, index, item):
+        """ Get an iteration for a new item.
+
+        The iteration is taken from the pool if possible and is created
+        otherwise.
+
+        """
+        if self._pool:
+            iter_data = self._pool.pop()
+            restore_items(iter_data._hidden)
+            iter_data._hidden = []
+            rebind_iteration(iter_data, index, item)
+        else:
+            iter_data = Iteration(index=index, item=item)
+            self._create_iteration(iter_data)
+        return iter_data
+
+    def _release_iteration(self, iter_data):
+        """ Release an iteration which is not needed anymore.
+
+        The iteration is pooled if the pool is not full and is destroyed
+        otherwise.
+
+        """
+        if len(self._pool) < self.pool_size:
+            iter_data._hidden = hide_items(iter_data.nodes)
+            self._pool.append(iter_data)
+        else:
+            destroy_iteration(iter_data)
+
+    def _place_iterations(self, iterations):
+        """ Place the items of the iterations in the parent.
+
+        The items are placed in order just before the looper using a
+        single call to 'replace_children()', so that only the items which
+        are not in the same relative order as before are moved.
+
+        Parameters
+        ----------
+        iterations : list
+            The iterations of the looper in order.
+
+        """
+        parent = self.parent
+        expanded = []
+        for iter_data in iterations:
+            recursive_expand(iter_data.nodes, expanded)
+        placed = set(expanded)
+        children = []
+        for child in parent.children:
+            if child is self:
+                children.extend(expanded)
+                children.append(child)
+            elif child not in placed:
+                children.append(child)
+        parent.replace_children(children)
+
+    def _bind_iterable_source(self):
+        """ Observe the ContainerList member providing the iterable.
+
+        The member is looked up among the dependencies traced during the
+        last evaluation of the iterable.
+
+        """
+        iterable = self.iterable
+        source = self._iterable_source
+        if source is not None:
+            obj = source[0]()
+            if obj is not None and getattr(obj, source[1]) is iterable:
+                return
+            self._unbind_iterable_source()
+        traced = self._d_storage.get(trace_key('iterable'))
+        if traced is None:
+            return
+        for ref, name in traced.items:
+            obj = ref()
+            if obj is None:
+                continue
+            member = obj.get_member(name)
+            if (isinstance(member, ContainerList) and
+                    getattr(obj, name) is iterable):
+                obj.observe(name, self._on_iterable_operation)
+                self._iterable_source = (ref, name)
+                return
+
+    def _unbind_iterable_source(self):
+        """ Stop observing the ContainerList member providing the iterable.
+
+        """
+        source = self._iterable_source
+        if source is not None:
+            obj = source[0]()
+            if obj is not None:
+                obj.unobserve(source[1], self._on_iterable_operation)
+            self._iterable_source = None
+
+    def _on_iterable_operation(self, change):
+        """ Apply an operation on the iterable to the iterations.
+
+        """
+        if (change['type'] != 'container' or not self.is_initialized or
+                change['value'] is not self.iterable or
+                not self.pattern_nodes):
+            return
+        # The subscription to the iterable may already have refreshed the
+        # iterations for this change, e.g. when an equal list had been
+        # assigned to the source member.
+        iterable = change['value']
+        count = len(self._iter_data)
+        if count == len(iterable) and all(
+            iter_data.item is item
+            for (_, iter_data), item in zip(self._iter_data, iterable)
+        ):
+            return
+        op = change['operation']
+        index = change.get('index')
+        if op == 'append':
+            self._insert_iterations(count, [change['item']])
+        elif op in ('extend', '__iadd__'):
+            self._insert_iterations(count, change['items'])
+        elif op == 'insert':
+            # Normalize the index as list.insert does.
+            if index < 0:
+                index = max(index + count, 0)
+            self._insert_iterations(min(index, count), [change['item']])
+        elif op == 'remove':
+            item = change['item']
+            for index, (_, iter_data) in enumerate(self._iter_data):
+                if iter_data.item == item:
+                    self._remove_iteration(index)
+                    break
+        elif op in ('pop', '__delitem__') and isinstance(index, int):
+            self._remove_iteration(index % count)
+        elif op == '__setitem__' and isinstance(index, int):
+            index %= count
+            item = change['newitem']
+            key = self.key(item) if self.key is not None else item
+            old_key, iter_data = self._iter_data[index]
+            if key == old_key:
+                self._iter_data[index] = (key, iter_data)
+                if iter_data.item is not item:
+                    rebind_iteration(iter_data, index, item)
+            else:
+                self._remove_iteration(index)
+                self._insert_iterations(index, [item])
+        else:
+            self.refresh_items()
+
+    def _insert_iterations(self, index, items):
+        """ Create the iterations of new items inserted at an index.
+
+        """
+        if not self.pattern_nodes:
+            return
+        iter_data_list = self._iter_data
+        key = self.key
+        if index < len(iter_data_list):
             expanded = []
-            recursive_expand(sum(new_items, []), expanded)
-            self.parent.insert_children(self, expanded)
+            recursive_expand(iter_data_list[index][1].nodes, expanded)
+            before = expanded[0] if expanded else self
+        else:
+            before = self
+        entries = []
+        created = []
+        for offset, item in enumerate(items):
+            iter_data = self._acquire_iteration(index + offset, item)
+            entries.append((key(item) if key is not None else item, iter_data))
+            created.append(iter_data.nodes)
+        iter_data_list[index:index] = entries
+        self.items[index:index] = created
+        for position in range(index + len(entries), len(iter_data_list)):
+            iter_data_list[position][1].index = position
+        expanded = []
+        recursive_expand(sum(created, []), expanded)
+        if expanded:
+            self.parent.insert_children(before, expanded)
+
+    def _remove_iteration(self, index):
+        """ Destroy the iteration at an index.
 
-        self.items = new_items
-        self._iter_data = new_iter_data
+        """
+        iter_data_list = self._iter_data
+        _, iter_data = iter_data_list.pop(index)
+        del self.items[index]
+        for position in range(index, len(iter_data_list)):
+            iter_data_list[position][1].index = position
+        self._release_iteration(iter_data)
+
+    def _create_iteration(self, iter_data):
+        """ Create the items of an iteration from the pattern nodes.
+
+        """
+        iteration = iter_data.nodes
+        for nodes, key, f_locals in self.pattern_nodes:
+            with new_scope(key, f_locals) as f_locals:
+                iter_data._scopes.append(f_locals)
+                # Retain for compatibility reasons
+                f_locals['loop_index'] = iter_data.index
+                f_locals['loop_item'] = iter_data.item
+                f_locals['loop'] = iter_data
+                for node in nodes:
+                    child = node(None)
+                    if isinstance(child, list):
+                        iteration.extend(child)
+                    else:
+                        iteration.append(child)
+
+
+def rebind_iteration(iter_data, index, item):
+    """ Bind the items of an existing iteration to a new item.
+
+    The read bindings of the items, except the constant ones, are
+    re-evaluated since they may depend on the legacy `loop_index` and
+    `loop_item` locals which are not traced. The updates are batched so
+    that the subscriptions to `loop` are evaluated only once.
+
+    Parameters
+    ----------
+    iter_data : Iteration
+        The iteration to rebind.
+
+    index : int
+        The new index of the iteration.
+
+    item : object
+        The new item of the iteration.
+
+    """
+    with batch_updates():
+        iter_data.index = index
+        iter_data.item = item
+        for f_locals in iter_data._scopes:
+            f_locals['loop_index'] = index
+            f_locals['loop_item'] = item
+        expanded = []
+        recursive_expand(iter_data.nodes, expanded)
+        for child in expanded:
+            for obj in child.traverse():
+                engine = getattr(obj, '_d_engine', None)
+                if engine is None:
+                    continue
+                for name, reader in engine.readers():
+                    if not isinstance(reader, StandardConstantReadHandler):
+                        engine.update(obj, name)
+
+
+def destroy_iteration(iter_data):
+    """ Destroy the items created for an iteration.
+
+    """
+    for old in iter_data.nodes:
+        if not old.is_destroyed:
+            old.destroy()
+
+
+def match_iterations(iter_data, entries, pool):
+    """ Match the existing iterations to the new entries of a looper.
+
+    Parameters
+    ----------
+    iter_data : list
+        The (key, Iteration) pairs of the existing iterations.
+
+    entries : list
+        The (key, item) pairs of the new iterable.
+
+    pool : mapping
+        An empty mapping used to index the iterations by key.
+
+    Returns
+    -------
+    result : tuple
+        The list of the Iteration matched to each entry (None for the
+        entries without a match) and the pool mapping the keys to the
+        lists of unmatched iterations.
+
+    """
+    # The lists are reversed so that the first iterations with a given
+    # key are popped first.
+    for key, iteration in reversed(iter_data):
+        iterations = pool.get(key)
+        if iterations is None:
+            pool[key] = [iteration]
+        else:
+            iterations.append(iteration)
+    matches = []
+    for key, _ in entries:
+        iterations = pool.get(key)
+        matches.append(iterations.pop() if iterations else None)
+    return matches, pool
 
 
 def recursive_expand(items, expanded):
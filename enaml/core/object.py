@@ -5,11 +5,14 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
+from bisect import bisect_left
 from collections import deque
 import re
 
 from atom.api import Atom, Str, Value, List, Event
 
+from ._dynamicscope import invalidate_resolution_cache
+
 
 def flag_generator():
     """ A generator which yields success bit flags.
@@ -29,6 +32,45 @@ flag_generator = flag_generator()
 DESTROYED_FLAG = next(flag_generator)
 
 
+def increasing_subsequence(values):
+    """ Get the positions of a longest increasing subsequence.
+
+    Parameters
+    ----------
+    values : list
+        The values to consider. None values are skipped.
+
+    Returns
+    -------
+    result : set
+        The positions in values of the items of a longest subsequence of
+        strictly increasing values.
+
+    """
+    # Patience sorting, tails holds the positions of the last value of the
+    # best subsequence of each length.
+    tails = []
+    tail_values = []
+    previous = {}
+    for position, value in enumerate(values):
+        if value is None:
+            continue
+        length = bisect_left(tail_values, value)
+        if length == len(tails):
+            tails.append(position)
+            tail_values.append(value)
+        else:
+            tails[length] = position
+            tail_values[length] = value
+        previous[position] = tails[length - 1] if length > 0 else None
+    result = set()
+    position = tails[-1] if tails else None
+    while position is not None:
+        result.add(position)
+        position = previous[position]
+    return result
+
+
 def flag_property(flag):
     """ A factory function which creates a flag accessor property.
 
@@ -63,7 +105,8 @@ class Object(Atom):
 
     #: A read-only property which returns the object children. This is
     #: a list of Object instances. User code should not modify the list
-    #: directly. Instead, use 'set_parent()' or 'insert_children()'.
+    #: directly. Instead, use 'set_parent()', 'insert_children()' or
+    #: 'replace_children()'.
     children = property(lambda self: self._children)
 
     #: A property which gets and sets the destroyed flag. This should
@@ -80,6 +123,9 @@ class Object(Atom):
     _parent = Value()   # Object or None
     _children = List()  # list of Object
     _flags = Value(0)   # object flags
+    _resolution_cache = Value()  # dict or None, see _dynamicscope
+    _resolution_stamp = Value(0)  # generation of the last cache validation
+    _parent_stamp = Value(0)  # generation of the last parent change
 
     def __init__(self, parent=None, **kwargs):
         """ Initialize an Object.
@@ -117,6 +163,7 @@ class Object(Atom):
         if parent is not None:
             if parent.is_destroyed:
                 self._parent = None
+                del self._resolution_cache
             else:
                 self.set_parent(None)
 
@@ -151,6 +198,7 @@ class Object(Atom):
         if parent is not None and not isinstance(parent, Object):
             raise TypeError('parent must be an Object or None')
         self._parent = parent
+        invalidate_resolution_cache(self)
         self.parent_changed(old_parent, parent)
         if old_parent is not None:
             old_parent._children.remove(self)
@@ -216,6 +264,7 @@ class Object(Atom):
             old_parent = child._parent
             if old_parent is not self:
                 child._parent = self
+                invalidate_resolution_cache(child)
                 child.parent_changed(old_parent, self)
                 if old_parent is not None:
                     old_parent.child_removed(child)
@@ -229,6 +278,71 @@ class Object(Atom):
             else:
                 child_moved(child)
 
+    def replace_children(self, children):
+        """ Replace the children of this object in a single operation.
+
+        The children list is rebuilt once, which makes this method the
+        efficient way to add, move and remove many children at once. The
+        current children which are not in the new children are unparented,
+        and the new children are parented, being removed from their old
+        parent if needed. Only the children which are not in the same
+        relative order as before are reported as moved. The changes are
+        then reported as a whole using 'children_replaced()'.
+
+        Parameters
+        ----------
+        children : iterable
+            An iterable of Object instances which should be the children
+            of this object, in order.
+
+        Notes
+        -----
+        It is the responsibility of the caller to initialize and activate
+        the object as needed, if it is reparented dynamically at runtime.
+
+        """
+        new = list(children)
+        new_set = set(new)
+        if self in new_set:
+            raise ValueError('cannot use `self` as Object child')
+        if len(new) != len(new_set):
+            raise ValueError('cannot insert duplicate children')
+        if not all(isinstance(child, Object) for child in new):
+            raise TypeError('children must be an Object instances')
+
+        old = self._children
+        positions = {child: index for index, child in enumerate(old)}
+        old_positions = [positions.get(child) for child in new]
+        stationary = increasing_subsequence(old_positions)
+
+        removed = [child for child in old if child not in new_set]
+        added = []
+        moved = []
+        for position, child in enumerate(new):
+            if old_positions[position] is None:
+                added.append(child)
+            elif position not in stationary:
+                moved.append(child)
+
+        if not (added or moved or removed):
+            return
+
+        for child in removed:
+            child._parent = None
+            invalidate_resolution_cache(child)
+            child.parent_changed(self, None)
+        for child in added:
+            old_parent = child._parent
+            child._parent = self
+            invalidate_resolution_cache(child)
+            child.parent_changed(old_parent, self)
+            if old_parent is not None:
+                old_parent._children.remove(child)
+                old_parent.child_removed(child)
+
+        self._children = new
+        self.children_replaced(added, moved, removed)
+
     def parent_changed(self, old, new):
         """ A method invoked when the parent of the object changes.
 
@@ -286,6 +400,42 @@ class Object(Atom):
         """
         pass
 
+    def children_replaced(self, added, moved, removed):
+        """ A method invoked when the children were replaced at once.
+
+        This method is called by 'replace_children()' once the children
+        of the object have been updated. The default implementation calls
+        'child_removed()' for each removed child, and then 'child_added()'
+        or 'child_moved()' for each added or moved child in the order of
+        the children. Sublasses may reimplement this method to handle the
+        changes as a whole.
+
+        Parameters
+        ----------
+        added : list
+            The children added to this object, in order.
+
+        moved : list
+            The children moved in this object, in order.
+
+        removed : list
+            The children removed from this object, in their old order.
+
+        """
+        child_removed = self.child_removed
+        for child in removed:
+            child_removed(child)
+        if added or moved:
+            added = set(added)
+            moved = set(moved)
+            child_added = self.child_added
+            child_moved = self.child_moved
+            for child in self._children:
+                if child in added:
+                    child_added(child)
+                elif child in moved:
+                    child_moved(child)
+
     #--------------------------------------------------------------------------
     # Object Tree API
     #--------------------------------------------------------------------------
@@ -14,7 +14,13 @@ from .code_tracing import inject_tracing, inject_inversion
 from .expression_engine import HandlerPair
 from .standard_handlers import (
     StandardReadHandler, StandardWriteHandler, StandardTracedReadHandler,
-    StandardInvertedWriteHandler
+    StandardInvertedWriteHandler, StandardConstantReadHandler
+)
+
+
+#: The types of the values which can be shared between the instances.
+IMMUTABLE_TYPES = (
+    type(None), type(Ellipsis), bool, int, float, complex, str, bytes
 )
 
 
@@ -52,6 +58,49 @@ def optimize_locals(bytecode):
     bytecode.update_flags()
 
 
+def is_immutable(value):
+    """ Get whether a constant value can be shared between instances.
+
+    """
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_immutable(item) for item in value)
+    return isinstance(value, IMMUTABLE_TYPES)
+
+
+def constant_value(code):
+    """ Get the value of an expression involving only immutable literals.
+
+    The Python compiler folds such expressions (ie `'Save'`, `-1`,
+    `(0, 1)`, `2 ** 10`) into a single constant returned by the code.
+
+    Parameters
+    ----------
+    code : CodeType
+        The code object created by the Enaml compiler.
+
+    Returns
+    -------
+    result : tuple or None
+        A 1-tuple holding the value of the expression or None if the
+        expression is not a constant.
+
+    """
+    instrs = [
+        instr for instr in bc.Bytecode.from_code(code)
+        if isinstance(instr, bc.Instr) and instr.name not in ("RESUME", "NOP")
+    ]
+    names = [instr.name for instr in instrs]
+    # Python 3.14 loads the integers in range(256) using LOAD_SMALL_INT.
+    if names in (["LOAD_CONST", "RETURN_VALUE"],
+                 ["LOAD_SMALL_INT", "RETURN_VALUE"]):
+        value = instrs[0].arg
+    elif names == ["RETURN_CONST"]:
+        value = instrs[0].arg
+    else:
+        return None
+    return (value,) if is_immutable(value) else None
+
+
 def gen_simple(code, f_globals):
     """ Generate a simple function from a code object.
 
@@ -136,8 +185,9 @@ def op_simple(code, scope_key, f_globals):
     """ The default Enaml operator function for the `=` operator.
 
     This operator generates a simple function with optimized local
-    access and hooks it up to a StandardReadHandler. This operator
-    does not support write semantics.
+    access and hooks it up to a StandardReadHandler. Expressions with
+    a constant value are instead hooked up to a handler returning the
+    precomputed value. This operator does not support write semantics.
 
     Parameters
     ----------
@@ -153,11 +203,19 @@ def op_simple(code, scope_key, f_globals):
     Returns
     -------
     result : HandlerPair
-        A pair with the reader set to a StandardReadHandler.
+        A pair with the reader set to a StandardReadHandler, or to a
+        StandardConstantReadHandler if the expression only involves
+        immutable literals.
 
     """
     func = gen_simple(code, f_globals)
-    reader = StandardReadHandler(func=func, scope_key=scope_key)
+    constant = constant_value(code)
+    if constant is not None:
+        reader = StandardConstantReadHandler(
+            func=func, scope_key=scope_key, value=constant[0]
+        )
+    else:
+        reader = StandardReadHandler(func=func, scope_key=scope_key)
     return HandlerPair(reader=reader)
 
 
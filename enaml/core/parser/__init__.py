@@ -14,6 +14,12 @@ from pegen.tokenizer import Tokenizer
 
 from ..enaml_ast import Module
 from .enaml_parser import EnamlParser
+from .fast_python import parse_fast
+
+#: Whether to parse the pure Python regions of enaml sources using CPython
+#: parser by default. This can be enabled by setting the
+#: ENAML_FAST_PYTHON_PARSING environment variable to 1.
+FAST_PYTHON_PARSING = os.environ.get("ENAML_FAST_PYTHON_PARSING") == "1"
 
 
 def _parse(
@@ -52,6 +58,7 @@ def parse(
         Callable[[Callable[[], str]], Iterator[tokenize.TokenInfo]]
     ] = None,
     verbose: bool = False,
+    fast_python: Optional[bool] = None,
 ) -> Module:
     """Parse enaml source text.
 
@@ -60,9 +67,22 @@ def parse(
 
     Parameters
     ----------
-
+    fast_python : bool, optional
+        Whether to parse the top level runs of pure Python statements using
+        CPython builtin parser and only the enamldef and template blocks
+        using the enaml parser. This is much faster for sources containing
+        a lot of Python code. Defaults to FAST_PYTHON_PARSING. It is ignored
+        if a py_version is specified or in verbose mode.
 
     """
+    if fast_python is None:
+        fast_python = FAST_PYTHON_PARSING
+    if fast_python and py_version is None and not verbose:
+        try:
+            return parse_fast(source, filename, token_stream_factory)
+        except (SyntaxError, tokenize.TokenError):
+            # Parse again to report the error as the enaml parser does.
+            pass
     return _parse(
         io.StringIO(source), filename, py_version, token_stream_factory, verbose
     )
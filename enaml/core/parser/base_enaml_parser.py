@@ -7,7 +7,7 @@
 # --------------------------------------------------------------------------------------
 import ast
 import warnings
-from typing import Dict, Iterable, List, Type, Union
+from typing import Any, Dict, Iterable, List, Type, Union
 
 from .. import enaml_ast
 from .base_python_parser import BasePythonParser
@@ -46,6 +46,20 @@ class BaseEnamlParser(BasePythonParser):
         ast.GeneratorExp: "generator expressions",
     }
 
+    # Whether the memoization cache is released each time a top level item or
+    # an item of an enamldef, child or template body has been parsed. The
+    # parser never backtracks over such items so only the memo entries of the
+    # item being parsed are kept alive. The tokens and the ast of the whole
+    # file are still kept, so the peak memory still grows with the size of the
+    # file but much more slowly than with an unbounded cache.
+    BOUNDED_MEMO = True
+
+    def release_memo(self, node: Any) -> Any:
+        """Clear the memoization cache and return the parsed node."""
+        if self.BOUNDED_MEMO:
+            self._cache.clear()
+        return node
+
     def create_python_module(self, stmts: List[ast.AST]) -> enaml_ast.PythonModule:
         """Create a python from a list of Python ast node."""
         return enaml_ast.PythonModule(
@@ -49,19 +49,19 @@ class EnamlParser(Parser):
         # enaml_item: statement | enamldef | template
         mark = self._mark()
         if (
-            (statement := self.statement())
+            (a := self.statement())
         ):
-            return statement;
+            return self . release_memo ( a );
         self._reset(mark)
         if (
             (a := self.enamldef())
         ):
-            return [a];
+            return self . release_memo ( [a] );
         self._reset(mark)
         if (
             (a := self.template())
         ):
-            return [a];
+            return self . release_memo ( [a] );
         self._reset(mark)
         return None;
 
@@ -145,24 +145,24 @@ class EnamlParser(Parser):
         # enamldef_item: enamldef_simple_item | decl_funcdef | child_def | template_inst
         mark = self._mark()
         if (
-            (enamldef_simple_item := self.enamldef_simple_item())
+            (a := self.enamldef_simple_item())
         ):
-            return enamldef_simple_item;
+            return self . release_memo ( a );
         self._reset(mark)
         if (
-            (decl_funcdef := self.decl_funcdef())
+            (a := self.decl_funcdef())
         ):
-            return decl_funcdef;
+            return self . release_memo ( a );
         self._reset(mark)
         if (
-            (child_def := self.child_def())
+            (a := self.child_def())
         ):
-            return child_def;
+            return self . release_memo ( a );
         self._reset(mark)
         if (
-            (template_inst := self.template_inst())
+            (a := self.template_inst())
         ):
-            return template_inst;
+            return self . release_memo ( a );
         self._reset(mark)
         return None;
 
@@ -418,24 +418,24 @@ class EnamlParser(Parser):
         # child_def_item: child_def_simple_item | decl_funcdef | child_def | template_inst
         mark = self._mark()
         if (
-            (child_def_simple_item := self.child_def_simple_item())
+            (a := self.child_def_simple_item())
         ):
-            return child_def_simple_item;
+            return self . release_memo ( a );
         self._reset(mark)
         if (
-            (decl_funcdef := self.decl_funcdef())
+            (a := self.decl_funcdef())
         ):
-            return decl_funcdef;
+            return self . release_memo ( a );
         self._reset(mark)
         if (
-            (child_def := self.child_def())
+            (a := self.child_def())
         ):
-            return child_def;
+            return self . release_memo ( a );
         self._reset(mark)
         if (
-            (template_inst := self.template_inst())
+            (a := self.template_inst())
         ):
-            return template_inst;
+            return self . release_memo ( a );
         self._reset(mark)
         return None;
 
@@ -727,19 +727,19 @@ class EnamlParser(Parser):
         # template_item: template_simple_item | child_def | template_inst
         mark = self._mark()
         if (
-            (template_simple_item := self.template_simple_item())
+            (a := self.template_simple_item())
         ):
-            return template_simple_item;
+            return self . release_memo ( a );
         self._reset(mark)
         if (
-            (child_def := self.child_def())
+            (a := self.child_def())
         ):
-            return child_def;
+            return self . release_memo ( a );
         self._reset(mark)
         if (
-            (template_inst := self.template_inst())
+            (a := self.template_inst())
         ):
-            return template_inst;
+            return self . release_memo ( a );
         self._reset(mark)
         return None;
 
@@ -0,0 +1,163 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+# ------------------------------------------------------------------------------
+"""Fast path parsing of the pure Python regions of enaml sources.
+
+The top level statements of an enaml module are split into runs of Python
+statements and runs of enaml blocks (enamldef and template definitions and
+their pragmas). Python runs are parsed using CPython builtin parser while
+only enaml runs go through the PEG parser which is much slower.
+
+"""
+import ast
+import io
+import os
+import tokenize
+from typing import Callable, Iterator, List, Optional
+
+from pegen.tokenizer import Tokenizer
+
+from .. import enaml_ast
+from .enaml_parser import EnamlParser
+
+#: Keywords which starts a top level enaml block when followed by a name.
+ENAML_KEYWORDS = frozenset(("enamldef", "template", "pragma"))
+
+#: Token types ignored by the parser.
+IGNORED_TOKENS = (tokenize.NL, tokenize.COMMENT)
+
+
+def split_regions(tokens: List[tokenize.TokenInfo]) -> List[tuple]:
+    """Split a token list in regions of Python statements and enaml blocks.
+
+    Parameters
+    ----------
+    tokens : list
+        The full list of tokens of the module.
+
+    Returns
+    -------
+    regions : list
+        List of (is_enaml, token_index, lineno) tuples describing where each
+        region starts. A region extends up to the start of the next one.
+
+    """
+    regions: List[tuple] = []
+    depth = 0
+    line_start = True
+    pending = None
+    for index, tok in enumerate(tokens):
+        t = tok.type
+        if t in IGNORED_TOKENS or (
+            t == tokenize.ERRORTOKEN and tok.string.isspace()
+        ):
+            continue
+
+        # The kind of a line starting with an enaml keyword depends on the
+        # following token, in Python a name cannot follow those keywords.
+        if pending is not None:
+            is_enaml = t == tokenize.NAME
+            if not regions or regions[-1][0] is not is_enaml:
+                regions.append((is_enaml,) + pending)
+            pending = None
+
+        if t == tokenize.INDENT:
+            depth += 1
+            continue
+        elif t == tokenize.DEDENT:
+            depth -= 1
+            continue
+        elif t == tokenize.NEWLINE:
+            line_start = True
+            continue
+        elif t == tokenize.ENDMARKER:
+            break
+
+        if line_start:
+            line_start = False
+            if depth == 0:
+                if t == tokenize.NAME and tok.string in ENAML_KEYWORDS:
+                    pending = (index, tok.start[0])
+                elif not regions or regions[-1][0]:
+                    regions.append((False, index, tok.start[0]))
+
+    return regions
+
+
+def parse_fast(
+    source: str,
+    filename: str,
+    token_stream_factory: Optional[
+        Callable[[Callable[[], str]], Iterator[tokenize.TokenInfo]]
+    ] = None,
+) -> enaml_ast.Module:
+    """Parse enaml source text using CPython parser for pure Python regions.
+
+    Any error (be it a syntax error or an error of the tokenizer) is raised
+    as is. The caller should fall back on parsing the whole source using
+    the PEG parser to get the same error reporting as usual.
+
+    """
+    readline = io.StringIO(source).readline
+    if token_stream_factory:
+        tokens = list(token_stream_factory(readline))
+    else:
+        tokens = list(tokenize.generate_tokens(readline))
+
+    regions = split_regions(tokens)
+    lines = source.splitlines(keepends=True)
+    path = filename if os.path.isfile(filename) else None
+    body = []
+    for i, (is_enaml, start, lineno) in enumerate(regions):
+        if i + 1 < len(regions):
+            end, end_lineno = regions[i + 1][1:]
+        else:
+            end, end_lineno = len(tokens), len(lines) + 1
+
+        if is_enaml:
+            region_tokens = tokens[start:end]
+            if region_tokens[-1].type != tokenize.ENDMARKER:
+                pos = tokens[end].start
+                region_tokens.append(
+                    tokenize.TokenInfo(tokenize.ENDMARKER, "", pos, pos, "")
+                )
+            parser = EnamlParser(
+                Tokenizer(iter(region_tokens), path=path), filename=filename
+            )
+            module = parser.parse("start")
+            body.extend(module.body)
+
+        else:
+            # Pad the source so that the line numbers match the full source.
+            chunk = "\n" * (lineno - 1) + "".join(lines[lineno - 1:end_lineno - 1])
+            stmts = ast.parse(chunk, filename).body
+            body.append(
+                enaml_ast.PythonModule(
+                    ast=ast.Module(body=stmts, type_ignores=[]),
+                    lineno=stmts[0].lineno,
+                    col_offset=stmts[0].col_offset,
+                    end_lineno=stmts[-1].end_lineno,
+                    end_col_offset=stmts[-1].end_col_offset,
+                )
+            )
+
+    # Compute the module location as the PEG parser would.
+    significant = [t for t in tokens if t.type not in IGNORED_TOKENS]
+    first = significant[0]
+    for last in reversed(significant):
+        if last.type != tokenize.ENDMARKER and (
+            last.type < tokenize.NEWLINE or last.type > tokenize.DEDENT
+        ):
+            break
+
+    return enaml_ast.Module(
+        body=body,
+        lineno=first.start[0],
+        col_offset=first.start[1],
+        end_lineno=last.end[0],
+        end_col_offset=last.end[1],
+    )
@@ -106,3 +106,50 @@ class Pattern(Declarative):
 
         """
         raise NotImplementedError
+
+
+def hide_items(items):
+    """ Hide the items created by a pattern.
+
+    The items which have a `visible` attribute are hidden, the items of
+    the nested patterns being hidden recursively. The expressions bound
+    to the `visible` attribute of the items are suspended while they are
+    hidden.
+
+    Parameters
+    ----------
+    items : list
+        The items to hide.
+
+    Returns
+    -------
+    result : list
+        The (item, visible) pairs of the hidden items, to pass to
+        `restore_items` to show them again.
+
+    """
+    hidden = []
+    for item in items:
+        if isinstance(item, Pattern):
+            hidden.extend(hide_items(item.pattern_items()))
+        elif item.get_member('visible') is not None:
+            hidden.append((item, item.visible))
+            engine = item._d_engine
+            if engine is not None:
+                engine.suspend(item, 'visible')
+            item.visible = False
+    return hidden
+
+
+def restore_items(hidden):
+    """ Restore the visibility of items hidden by `hide_items`.
+
+    The items bound to a read expression take its current value, the
+    other items take the value they had before being hidden.
+
+    """
+    for item, visible in hidden:
+        if not item.is_destroyed:
+            engine = item._d_engine
+            if engine is None or not engine.resume(item, 'visible'):
+                item.visible = visible
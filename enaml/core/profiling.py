@@ -0,0 +1,184 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+import atexit
+import json
+import os
+import sys
+from time import perf_counter
+
+
+class Profiler(object):
+    """ The base class of the opt-in profilers of Enaml.
+
+    A profiler times nested sections of code and accumulates their time in
+    records. The time of a section is split between its 'own' time, which
+    excludes the time spent in the sections nested in it, and its
+    cumulative time.
+
+    Only one profiler of a given type is active at a time. It is enabled
+    using the enable class method or by setting the environment variable
+    given to setup_from_env before importing enaml. If the variable is set
+    to 1, a report is printed to stderr on exit, otherwise the value is
+    used as the path of a JSON file in which the records are dumped on
+    exit.
+
+    Subclasses must implement to_json, report_header and report_row.
+
+    """
+    #: The profiler of this type currently recording.
+    active = None
+
+    #: The prefix of the lines printed by the report.
+    REPORT_PREFIX = 'enaml profile'
+
+    def __init__(self):
+        """ Initialize the profiler.
+
+        """
+        #: Records by subclass specific keys, in recording order.
+        self.records = {}
+
+        #: Stack of [start, nested time] for running sections.
+        self._stack = []
+
+    @classmethod
+    def enable(cls):
+        """ Start recording with a profiler of this type.
+
+        Returns
+        -------
+        profiler : Profiler
+            The active profiler. If a profiler was already active, it is
+            returned.
+
+        """
+        if cls.active is None:
+            cls.active = cls()
+        return cls.active
+
+    @classmethod
+    def disable(cls):
+        """ Stop recording with the profiler of this type.
+
+        Returns
+        -------
+        profiler : Profiler or None
+            The profiler that was active if any.
+
+        """
+        profiler = cls.active
+        cls.active = None
+        return profiler
+
+    @classmethod
+    def setup_from_env(cls, name):
+        """ Enable a profiler if the given environment variable is set.
+
+        """
+        value = os.environ.get(name)
+        if not value:
+            return
+        profiler = cls.enable()
+        if value == '1':
+            atexit.register(profiler.report)
+        else:
+            atexit.register(profiler.dump_json, os.path.abspath(value))
+
+    def section(self, record, key):
+        """ Get a context manager timing a section of code.
+
+        Parameters
+        ----------
+        record : dict
+            The record in which to accumulate the time. Its 'cumulative'
+            entry is incremented by the total time of the section.
+
+        key : str
+            The entry of the record incremented by the own time of the
+            section.
+
+        """
+        return _ProfiledSection(self, record, key)
+
+    def report(self, sort, limit=None, file=None):
+        """ Print a table of the records.
+
+        Parameters
+        ----------
+        sort : str
+            The entry of the JSON records by which to sort them in
+            decreasing order.
+
+        limit : int, optional
+            The maximal number of records to report.
+
+        file : file-like, optional
+            The file to write to, defaults to sys.stderr.
+
+        """
+        file = file if file is not None else sys.stderr
+        rows = self.to_json()
+        rows.sort(key=lambda r: r[sort], reverse=True)
+        if limit is not None:
+            rows = rows[:limit]
+        prefix = self.REPORT_PREFIX
+        print('%s: %s' % (prefix, self.report_header()), file=file)
+        for row in rows:
+            print('%s: %s' % (prefix, self.report_row(row)), file=file)
+
+    def report_header(self):
+        """ Get the header line of the report.
+
+        """
+        raise NotImplementedError
+
+    def report_row(self, row):
+        """ Get the line of the report of a JSON record.
+
+        """
+        raise NotImplementedError
+
+    def to_json(self):
+        """ Get the records as a list of JSON serializable dictionaries.
+
+        """
+        raise NotImplementedError
+
+    def dump_json(self, path):
+        """ Dump the records in a JSON file.
+
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_json(), f, indent=2)
+
+
+class _ProfiledSection(object):
+    """ Context manager timing a section of code for a Profiler.
+
+    """
+    __slots__ = ('profiler', 'record', 'key', 'entry')
+
+    def __init__(self, profiler, record, key):
+        self.profiler = profiler
+        self.record = record
+        self.key = key
+
+    def __enter__(self):
+        self.entry = [perf_counter(), 0.0]
+        self.profiler._stack.append(self.entry)
+
+    def __exit__(self, *args):
+        stack = self.profiler._stack
+        stack.pop()
+        start, nested = self.entry
+        elapsed = perf_counter() - start
+        record = self.record
+        record[self.key] += elapsed - nested
+        record['cumulative'] += elapsed
+        if stack:
+            stack[-1][1] += elapsed
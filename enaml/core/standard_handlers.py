@@ -7,7 +7,7 @@
 #------------------------------------------------------------------------------
 from types import FunctionType
 
-from atom.api import Atom, Typed
+from atom.api import Atom, Typed, Value
 
 from .dynamicscope import DynamicScope
 from .expression_engine import ReadHandler, WriteHandler
@@ -64,6 +64,24 @@ class StandardReadHandler(ReadHandler, HandlerMixin):
         return call_func(func, (), {}, scope)
 
 
+class StandardConstantReadHandler(ReadHandler, HandlerMixin):
+    """ A read handler for an expression with a constant value.
+
+    This handler is used in conjunction with the standard '=' operator
+    when the expression only involves immutable literals. The value is
+    computed once and no scope is created for the instances.
+
+    """
+    #: The precomputed value of the expression.
+    value = Value()
+
+    def __call__(self, owner, name):
+        """ Return the precomputed expression value.
+
+        """
+        return self.value
+
+
 class StandardWriteHandler(WriteHandler, HandlerMixin):
     """ An expression write handler for simple write semantics.
 
@@ -5,6 +5,8 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
+import sys
+
 from atom.api import Atom, atomref
 
 from .alias import Alias
@@ -12,11 +14,30 @@ from .code_tracing import CodeTracer
 from .subscription_observer import SubscriptionObserver
 
 
+#: The interned storage keys of the tracers by attribute name.
+_trace_keys = {}
+
+
+def trace_key(name):
+    """ Get the key under which the subscription of an attribute is stored.
+
+    The keys are shared by all the objects so that they are only created
+    once for each attribute name.
+
+    """
+    key = _trace_keys.get(name)
+    if key is None:
+        key = _trace_keys[name] = sys.intern('_[%s|trace]' % name)
+    return key
+
+
 class StandardTracer(CodeTracer):
     """ A CodeTracer for tracing expressions which use Atom.
 
     This tracer maintains a running set of `traced_items` which are the
-    (obj, name) pairs of atom items discovered during tracing.
+    (atomref(obj), name) pairs of atom items discovered during tracing.
+    Weak references are used so that the dependencies kept between two
+    evaluations do not extend the lifetime of the traced objects.
 
     """
     __slots__ = ('owner', 'name', 'key', 'items')
@@ -27,14 +48,14 @@ class StandardTracer(CodeTracer):
         """
         self.owner = owner
         self.name = name
-        self.key = '_[%s|trace]' % name
+        self.key = trace_key(name)
         self.items = set()
 
     #--------------------------------------------------------------------------
     # Utility Methods
     #--------------------------------------------------------------------------
     def trace_atom(self, obj: Atom, name: str):
-        """ Add the atom object and name pair to the traced items.
+        """ Add the atom object reference and name pair to the traced items.
 
         Parameters
         ----------
@@ -46,7 +67,7 @@ class StandardTracer(CodeTracer):
 
         """
         if obj.get_member(name) is not None:
-            self.items.add((obj, name))
+            self.items.add((atomref(obj), name))
         else:
             alias = getattr(type(obj), name, None)
             if isinstance(alias, Alias):
@@ -57,26 +78,41 @@ class StandardTracer(CodeTracer):
     def finalize(self):
         """ Finalize the tracing process.
 
-        This method will discard the old observer and attach a new
-        observer to the traced dependencies.
+        This method will attach the observer of the expression to the
+        traced dependencies. The observer stores the dependencies it is
+        attached to and is kept in the storage of the owner. It is reused
+        as long as the dependencies do not change, otherwise it is
+        detached from the old dependencies and replaced.
 
         """
         owner = self.owner
-        name = self.name
         key = self.key
         storage = owner._d_storage
-
-        # invalidate the old observer so that it can be collected
+        items = self.items
         old_observer = storage.get(key)
         if old_observer is not None:
+            old_items = old_observer.items
+            # The old items are unique so this is a set equality test.
+            if len(items) == len(old_items) and items.issuperset(old_items):
+                return
+            # Dead objects have already released the observer. The old
+            # observer is invalidated in case a notification is in flight.
             old_observer.ref = None
-
-        # create a new observer and subscribe it to the dependencies
-        if self.items:
-            observer = SubscriptionObserver(owner, name)
+            for ref, d_name in old_items:
+                obj = ref()
+                if obj is not None:
+                    obj.unobserve(d_name, old_observer)
+            del storage[key]
+
+        # The dependencies are stored inline in the observer, which is
+        # much more compact than a separate container of pairs.
+        if items:
+            observer = SubscriptionObserver(owner, self.name, items)
             storage[key] = observer
-            for obj, d_name in self.items:
-                obj.observe(d_name, observer)
+            for ref, d_name in items:
+                obj = ref()
+                if obj is not None:
+                    obj.observe(d_name, observer)
 
     #--------------------------------------------------------------------------
     # CodeTracer Interface
@@ -5,14 +5,19 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
+from collections import OrderedDict, namedtuple
 from types import FunctionType
 
 from bytecode import CompilerFlags
-from atom.api import Atom, List, Str, Tuple, Typed
+from atom.api import Atom, Int, List, Str, Tuple, Typed, Value
 
 from .compiler_nodes import TemplateNode
 
 
+#: The statistics of the instantiation cache of a template.
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+
 class TemplateInstance(Atom):
     """ A class representing a template instantiation.
 
@@ -89,8 +94,27 @@ class Template(Atom):
     #: list is populated by the compiler.
     specializations = List(Specialization)
 
-    #: The cache of template instantiations.
-    cache = Typed(dict, ())
+    #: The cache of template instantiations, ordered from the least to
+    #: the most recently used.
+    cache = Typed(OrderedDict, ())
+
+    #: The maximum number of instantiations kept in the cache. None
+    #: means that the cache is unbounded.
+    cache_size = Value(1024)
+
+    #: The number of instantiations found in the cache.
+    cache_hits = Int()
+
+    #: The number of instantiations which were not found in the cache.
+    cache_misses = Int()
+
+    #: The specializations selected for the dispatch keys of arguments.
+    #: This is reset when a specialization is added.
+    _dispatch = Typed(dict, ())
+
+    #: For each parameter position, the (index, param) pairs of the
+    #: specializations whose parameter at that position is specialized.
+    _positional_params = List()
 
     def __repr__(self):
         """ A nice repr for objects created by the `template` keyword.
@@ -140,6 +164,69 @@ class Template(Atom):
         spec.func = func
         spec.paramspec = paramspec
         self.specializations.append(spec)
+        self._dispatch.clear()
+        self._positional_params = []
+
+    def dispatch_key(self, args):
+        """ Get the key identifying the specialization of arguments.
+
+        The specialization selected for arguments only depends on the
+        number of arguments, on the type arguments and on which
+        specialized parameters the other arguments are equal to, which
+        is captured by the key.
+
+        Parameters
+        ----------
+        args : tuple
+            The arguments of an instantiation.
+
+        Returns
+        -------
+        result : tuple
+            A hashable key which is the same for arguments matching the
+            same specialization.
+
+        """
+        positional = self._positional_params
+        if not positional:
+            for index, spec in enumerate(self.specializations):
+                for position, (_, param) in enumerate(spec.paramspec):
+                    if position == len(positional):
+                        positional.append([])
+                    if param is not None:
+                        positional[position].append((index, param))
+        key = [len(args)]
+        for arg, params in zip(args, positional):
+            if isinstance(arg, type):
+                key.append(arg)
+            else:
+                key.append(
+                    tuple(index for index, param in params if arg == param)
+                )
+        return tuple(key)
+
+    def cache_info(self):
+        """ Get the statistics of the instantiation cache.
+
+        Returns
+        -------
+        result : CacheInfo
+            The named tuple of the hits, misses, maximum size and
+            current size of the cache.
+
+        """
+        return CacheInfo(
+            self.cache_hits, self.cache_misses, self.cache_size,
+            len(self.cache)
+        )
+
+    def cache_clear(self):
+        """ Clear the instantiation cache and its statistics.
+
+        """
+        self.cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def get_specialization(self, args):
         """ Get the specialization for the given arguments.
@@ -234,14 +321,27 @@ class Template(Atom):
             The instantiated template.
 
         """
-        inst = self.cache.get(args)
+        cache = self.cache
+        inst = cache.get(args)
         if inst is not None:
+            cache.move_to_end(args)
+            self.cache_hits += 1
             return inst
-        spec = self.get_specialization(args)
+        self.cache_misses += 1
+        dispatch = self._dispatch
+        key = self.dispatch_key(args)
+        if key in dispatch:
+            spec = dispatch[key]
+        else:
+            spec = dispatch[key] = self.get_specialization(args)
         if spec is not None:
             inst = TemplateInstance()
             inst.node = spec.func(*args)
-            self.cache[args] = inst
+            cache[args] = inst
+            cache_size = self.cache_size
+            if cache_size is not None:
+                while len(cache) > cache_size:
+                    cache.popitem(last=False)
             return inst
         msg = 'no matching template specialization for arguments: %s'
         raise TypeError(msg % (args,))
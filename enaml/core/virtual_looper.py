@@ -0,0 +1,160 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from collections.abc import Sequence
+
+from atom.api import Int
+
+from .declarative import d_, observe
+from .looper import Looper, rebind_iteration
+
+
+class VirtualLooper(Looper):
+    """ A looper which only creates the items of a window of its iterable.
+
+    A `VirtualLooper` behaves as a `Looper` whose iterations are only
+    created for the items in the window starting at `window_start` and
+    extended by `overscan` items on each side. This allows to display
+    very large iterables, the window being typically bound to the scroll
+    position of the view.
+
+    When the window moves, the iterations which leave it are recycled for
+    the items entering it: their `loop.index` and `loop.item` are updated,
+    as well as the bindings of their items, instead of destroying them and
+    creating new ones. The bindings which depend on `loop` should hence
+    use the subscription operator ('<<') or be simple read bindings ('=').
+
+    To display the items in a `ScrollArea`, the window is bound to the
+    `scroll_position` and `viewport_size` of the area, and the scroll
+    widget reserves the size of the full iterable while each item is
+    positioned using its index. For items of a fixed height of 24 pixels::
+
+        ScrollArea: area:
+            Container: box:
+                constraints = [height == 24 * len(data)]
+                VirtualLooper:
+                    iterable = data
+                    window_start << area.scroll_position.y // 24
+                    window_size << area.viewport_size.height // 24 + 1
+                    Label:
+                        text << str(loop.item)
+                        constraints << [
+                            top == box.contents_top + 24 * loop.index,
+                            left == box.contents_left,
+                            height == 24,
+                        ]
+
+    """
+    #: The index of the first item of the visible window.
+    window_start = d_(Int(0))
+
+    #: The number of items in the visible window.
+    window_size = d_(Int(50))
+
+    #: The number of items created before and after the visible window,
+    #: so that small moves of the window do not have to create items.
+    overscan = d_(Int(10))
+
+    #--------------------------------------------------------------------------
+    # Observers
+    #--------------------------------------------------------------------------
+    @observe('window_start', 'window_size', 'overscan')
+    def _update_window(self, change):
+        """ Refresh the items when the window changes.
+
+        """
+        if change['type'] == 'update' and self.is_initialized:
+            self.refresh_items()
+
+    #--------------------------------------------------------------------------
+    # Pattern API
+    #--------------------------------------------------------------------------
+    def window_range(self, count):
+        """ Get the range of the indices of the created iterations.
+
+        Parameters
+        ----------
+        count : int
+            The number of items in the iterable.
+
+        Returns
+        -------
+        result : range
+            The indices of the items of the window and overscan.
+
+        """
+        start = max(0, min(self.window_start, count))
+        overscan = max(0, self.overscan)
+        stop = min(count, start + max(0, self.window_size) + overscan)
+        return range(max(0, start - overscan), stop)
+
+    def refresh_items(self):
+        """ Refresh the items of the pattern.
+
+        The iterations whose index is still in the window and whose key is
+        unchanged are kept as is, the other ones are recycled for the new
+        items of the window or destroyed if they are not needed anymore.
+
+        """
+        sequence = self.iterable
+        if sequence is None or not self.pattern_nodes:
+            sequence = ()
+        elif not isinstance(sequence, Sequence):
+            sequence = tuple(sequence)
+        indices = self.window_range(len(sequence))
+        key = self.key
+
+        kept = {}
+        released = []
+        for old_key, iter_data in self._iter_data:
+            index = iter_data.index
+            if (index in indices and index not in kept and
+                    (key(sequence[index]) if key is not None
+                     else sequence[index]) == old_key):
+                kept[index] = iter_data
+            else:
+                released.append(iter_data)
+
+        matches = [kept.get(index) for index in indices]
+
+        new_iter_data = []
+        new_iterations = []
+        for index, iter_data in zip(indices, matches):
+            item = sequence[index]
+            if iter_data is not None:
+                if iter_data.item is not item:
+                    rebind_iteration(iter_data, index, item)
+            elif released:
+                iter_data = released.pop()
+                rebind_iteration(iter_data, index, item)
+            else:
+                iter_data = self._acquire_iteration(index, item)
+            new_iter_data.append(
+                (key(item) if key is not None else item, iter_data)
+            )
+            new_iterations.append(iter_data)
+
+        for iter_data in released:
+            self._release_iteration(iter_data)
+
+        self._place_iterations(new_iterations)
+        self.items = [iter_data.nodes for iter_data in new_iterations]
+        self._iter_data = new_iter_data
+        self._bind_iterable_source()
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _on_iterable_operation(self, change):
+        """ Refresh the window on the operations on the iterable.
+
+        Since only the window is materialized a refresh is cheap.
+
+        """
+        if (change['type'] == 'container' and self.is_initialized and
+                change['value'] is self.iterable):
+            self.refresh_items()
@@ -363,6 +363,20 @@ class QtContainer(QtFrame, ProxyContainer):
         if isinstance(child, QtConstraintsWidget):
             del child.layout_container
 
+    def children_replaced(self, added, moved, removed):
+        """ Handle the children replaced event.
+
+        This handler will handle the removed and added children, and
+        ignore the moved ones. The order of the children only matters
+        for the layout, which the declaration will have requested once
+        for all the changes.
+
+        """
+        for child in removed:
+            self.child_removed(child)
+        for child in added:
+            self.child_added(child)
+
     #--------------------------------------------------------------------------
     # Layout API
     #--------------------------------------------------------------------------
@@ -507,6 +507,26 @@ class QtNotebook(QtConstraintsWidget, ProxyNotebook):
             finally:
                 self._guard &= ~CHANGE_GUARD
 
+    def _page_index(self, child):
+        """ Get the tab index at which to insert the widget of a page.
+
+        The index is the one following the tab of the closest preceding
+        page in the notebook. Placing the pages relative to their neighbour
+        keeps the tab order correct when only some of the pages are added
+        or moved, as long as they are handled in the declaration order.
+
+        """
+        widget = self.widget
+        index = 0
+        for dchild in self.children():
+            if dchild is child:
+                break
+            if isinstance(dchild, QtPage):
+                tab_index = widget.indexOf(dchild.widget)
+                if tab_index != -1:
+                    index = tab_index + 1
+        return index
+
     #--------------------------------------------------------------------------
     # Child Events
     #--------------------------------------------------------------------------
@@ -516,9 +536,7 @@ class QtNotebook(QtConstraintsWidget, ProxyNotebook):
         """
         super(QtNotebook, self).child_added(child)
         if isinstance(child, QtPage):
-            for index, dchild in enumerate(self.children()):
-                if child is dchild:
-                    self.widget.insertPage(index, child.widget)
+            self.widget.insertPage(self._page_index(child), child.widget)
 
     def child_removed(self, child):
         """ Handle the child removed event for a QtNotebook.
@@ -528,6 +546,33 @@ class QtNotebook(QtConstraintsWidget, ProxyNotebook):
         if isinstance(child, QtPage):
             self.widget.removePage(child.widget)
 
+    def children_replaced(self, added, moved, removed):
+        """ Handle the children replaced event for a QtNotebook.
+
+        The removed pages are removed from the notebook, and the tabs
+        are then synchronized with the declared pages in a single pass.
+
+        """
+        for child in removed:
+            self.child_removed(child)
+        widget = self.widget
+        added = set(added)
+        index = 0
+        for child in self.children():
+            if not isinstance(child, QtPage):
+                continue
+            page = child.widget
+            if child in added:
+                widget.insertPage(index, page)
+            else:
+                current = widget.indexOf(page)
+                if current == -1:
+                    continue
+                if current != index:
+                    widget.movePage(page, index)
+            if page.isOpen():
+                index += 1
+
     #--------------------------------------------------------------------------
     # Signal Handlers
     #--------------------------------------------------------------------------
@@ -555,9 +600,13 @@ class QtNotebook(QtConstraintsWidget, ProxyNotebook):
     #--------------------------------------------------------------------------
     def page_moved(self, child: QtPage):
         """Handle a page being moved QtNotebook."""
-        for index, dchild in enumerate(self.children()):
-            if child is dchild:
-                self.widget.movePage(child.widget, index)
+        widget = self.widget
+        current = widget.indexOf(child.widget)
+        if current != -1:
+            index = self._page_index(child)
+            if current < index:
+                index -= 1
+            widget.movePage(child.widget, index)
 
     def set_tab_style(self, style):
         """ Set the tab style for the tab bar in the widget.
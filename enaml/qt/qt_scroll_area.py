@@ -5,8 +5,9 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Typed, Value
+from atom.api import Int, Typed, Value
 
+from enaml.layout.geometry import Pos, Size
 from enaml.widgets.scroll_area import ProxyScrollArea
 
 from .QtCore import Qt, QEvent, QSize, QRect, QPoint, Signal
@@ -24,6 +25,10 @@ POLICIES = {
 }
 
 
+# Guard flags
+SCROLL_GUARD = 0x1
+
+
 class QCustomScrollArea(QScrollArea):
     """ A custom QScrollArea for use with the QtScrollArea.
 
@@ -35,6 +40,9 @@ class QCustomScrollArea(QScrollArea):
     #: the scroll area is no longer valid.
     layoutRequested = Signal()
 
+    #: A signal emitted when the viewport of the scroll area is resized.
+    viewportResized = Signal()
+
     #: A private internally cached size hint.
     _size_hint = QSize()
 
@@ -59,6 +67,18 @@ class QCustomScrollArea(QScrollArea):
             self.layoutRequested.emit()
         return res
 
+    def viewportEvent(self, event):
+        """ A custom event handler for the viewport.
+
+        This handler emits the viewportResized signal when the viewport
+        is resized.
+
+        """
+        res = super(QCustomScrollArea, self).viewportEvent(event)
+        if event.type() == QEvent.Resize:
+            self.viewportResized.emit()
+        return res
+
     def setWidget(self, widget):
         """ Set the widget for this scroll area.
 
@@ -118,6 +138,9 @@ class QtScrollArea(QtFrame, ProxyScrollArea):
     #: A private cache of the old size hint for the scroll area.
     _old_hint = Value()
 
+    #: Cyclic notification guard flags.
+    _guard = Int(0)
+
     #--------------------------------------------------------------------------
     # Initialization API
     #--------------------------------------------------------------------------
@@ -145,6 +168,11 @@ class QtScrollArea(QtFrame, ProxyScrollArea):
         widget = self.widget
         widget.setWidget(self.scroll_widget())
         widget.layoutRequested.connect(self.on_layout_requested)
+        widget.viewportResized.connect(self.on_viewport_resized)
+        widget.horizontalScrollBar().valueChanged.connect(self.on_scrolled)
+        widget.verticalScrollBar().valueChanged.connect(self.on_scrolled)
+        self.set_scroll_position(self.declaration.scroll_position)
+        self.on_viewport_resized()
 
     #--------------------------------------------------------------------------
     # Utility Methods
@@ -188,6 +216,28 @@ class QtScrollArea(QtFrame, ProxyScrollArea):
             self._old_hint = new_hint
             self.geometry_updated()
 
+    def on_scrolled(self):
+        """ Handle the `valueChanged` signal from the scroll bars.
+
+        """
+        if not self._guard & SCROLL_GUARD:
+            self._guard |= SCROLL_GUARD
+            try:
+                widget = self.widget
+                self.declaration.scroll_position = Pos(
+                    widget.horizontalScrollBar().value(),
+                    widget.verticalScrollBar().value(),
+                )
+            finally:
+                self._guard &= ~SCROLL_GUARD
+
+    def on_viewport_resized(self):
+        """ Handle the `viewportResized` signal from the QScrollArea.
+
+        """
+        size = self.widget.viewport().size()
+        self.declaration.viewport_size = Size(size.width(), size.height())
+
     #--------------------------------------------------------------------------
     # Overrides
     #--------------------------------------------------------------------------
@@ -220,3 +270,16 @@ class QtScrollArea(QtFrame, ProxyScrollArea):
 
         """
         self.widget.setWidgetResizable(resizable)
+
+    def set_scroll_position(self, position):
+        """ Set the position of the scroll widget in the viewport.
+
+        """
+        if not self._guard & SCROLL_GUARD:
+            self._guard |= SCROLL_GUARD
+            try:
+                widget = self.widget
+                widget.horizontalScrollBar().setValue(position.x)
+                widget.verticalScrollBar().setValue(position.y)
+            finally:
+                self._guard &= ~SCROLL_GUARD
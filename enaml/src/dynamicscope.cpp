@@ -64,8 +64,17 @@ namespace
 
 static PyObject* parent_str;
 static PyObject* dynamic_load_str;
+static PyObject* resolution_cache_str;
+static PyObject* resolution_stamp_str;
+static PyObject* parent_stamp_str;
+static PyObject* atomref;
+static PyTypeObject* CAtom;
 static PyObject* UserKeyError;
 
+// The generation of the object trees, incremented each time an object is
+// reparented, see invalidate_resolution_cache.
+static unsigned long long resolution_generation = 0;
+
 
 /*-----------------------------------------------------------------------------
 | Utilities
@@ -150,73 +159,214 @@ run_tracer( PyObject* tracer, PyObject* owner, PyObject* name, PyObject* value )
 }
 
 
+// Load the attribute from the object, without looking at its parents.
+// Returns null without an exception set if the object has no such attribute.
 PyObject*
-load_dynamic_attr( PyObject* obj, PyObject* name, PyObject* tracer=0 )
+load_attr( PyObject* obj, PyObject* name, PyObject* tracer )
 {
-    PyTypeObject* tp;
+    PyTypeObject* tp = Py_TYPE( obj );
     PyObject** dictptr;
     cppy::ptr descr;
     descrgetfunc descr_f;
-    cppy::ptr objptr( cppy::incref( obj ) );
 
-    // The body of this loop is PyObject_GenericGetAttr, modified to
+    // The body of this function is PyObject_GenericGetAttr, modified to
     // use smart pointers and _PyObject_GetDictPtr, and run a tracer.
-    while( objptr.get() != Py_None )
-    {
-        tp = Py_TYPE( objptr.get() );
 
-        // Data descriptor
-        descr_f = 0;
-        descr = cppy::xincref( _PyType_Lookup( tp, name ) );
-        if( descr )
+    // Data descriptor
+    descr_f = 0;
+    descr = cppy::xincref( _PyType_Lookup( tp, name ) );
+    if( descr )
+    {
+        descr_f = descr.type()->tp_descr_get;
+        if( descr_f && PyDescr_IsData( descr.get() ) )
         {
-            descr_f = descr.type()->tp_descr_get;
-            if( descr_f && PyDescr_IsData( descr.get() ) )
-            {
-                cppy::ptr res(
-                    descr_f( descr.get(), objptr.get(), pyobject_cast( tp ) )
-                );
-                if( !res )
-                    maybe_translate_key_error();
-                else if( tracer && !run_tracer( tracer, objptr.get(), name, res.get() ) )
-                    return 0;
-                return res.release();
-            }
+            cppy::ptr res( descr_f( descr.get(), obj, pyobject_cast( tp ) ) );
+            if( !res )
+                maybe_translate_key_error();
+            else if( tracer && !run_tracer( tracer, obj, name, res.get() ) )
+                return 0;
+            return res.release();
         }
+    }
 
-        // Instance dictionary
-        dictptr = _PyObject_GetDictPtr( objptr.get() );
-        if( dictptr && *dictptr )
+    // Instance dictionary
+    dictptr = _PyObject_GetDictPtr( obj );
+    if( dictptr && *dictptr )
+    {
+        PyObject* item = PyDict_GetItem( *dictptr, name );
+        if( item )
         {
-            PyObject* item = PyDict_GetItem( *dictptr, name );
-            if( item )
-            {
-                if( tracer && !run_tracer( tracer, objptr.get(), name, item ) )
-                    return 0;
-                return cppy::incref( item );
-            }
+            if( tracer && !run_tracer( tracer, obj, name, item ) )
+                return 0;
+            return cppy::incref( item );
         }
+    }
 
-        // Non-data descriptor
-        if( descr_f )
+    // Non-data descriptor
+    if( descr_f )
+    {
+        cppy::ptr res( descr_f( descr.get(), obj, pyobject_cast( tp ) ) );
+        if( !res )
+            maybe_translate_key_error();
+        else if( tracer && !run_tracer( tracer, obj, name, res.get() ) )
+            return 0;
+        return res.release();
+    }
+
+    // Non-readable descriptor
+    if( descr )
+    {
+        if( tracer && !run_tracer( tracer, obj, name, descr.get() ) )
+            return 0;
+        return descr.release();
+    }
+
+    return 0;
+}
+
+
+// Get a stamp stored in an attribute of the object. Returns -1 on error.
+int
+get_stamp( PyObject* obj, PyObject* name, unsigned long long* stamp )
+{
+    cppy::ptr value( PyObject_GetAttr( obj, name ) );
+    if( !value )
+        return -1;
+    *stamp = PyLong_AsUnsignedLongLong( value.get() );
+    if( *stamp == static_cast<unsigned long long>( -1 ) && PyErr_Occurred() )
+        return -1;
+    return 0;
+}
+
+
+// Set the stamp of the object to the current generation of the trees.
+// Returns -1 on error.
+int
+set_stamp( PyObject* obj, PyObject* name )
+{
+    cppy::ptr value( PyLong_FromUnsignedLongLong( resolution_generation ) );
+    if( !value )
+        return -1;
+    return PyObject_SetAttr( obj, name, value.get() );
+}
+
+
+// Check that neither the object nor one of its ancestors was reparented
+// since the resolution cache of the object was last validated. Only the
+// first access after a change of the trees walks the ancestors. Returns 1
+// if the cache is valid, 0 if it is stale and -1 on error.
+int
+check_resolution_stamp( PyObject* obj )
+{
+    unsigned long long validated;
+    if( get_stamp( obj, resolution_stamp_str, &validated ) < 0 )
+        return -1;
+    if( validated == resolution_generation )
+        return 1;
+    cppy::ptr objptr( cppy::incref( obj ) );
+    while( objptr.get() != Py_None )
+    {
+        unsigned long long reparented;
+        if( get_stamp( objptr.get(), parent_stamp_str, &reparented ) < 0 )
+            return -1;
+        if( reparented > validated )
+            return 0;
+        objptr = PyObject_GetAttr( objptr.get(), parent_str );
+        if( !objptr )
+            return -1;
+    }
+    if( set_stamp( obj, resolution_stamp_str ) < 0 )
+        return -1;
+    return 1;
+}
+
+
+// Get the cache mapping the names resolved on an ancestor of the object to
+// a reference to that ancestor. The cache is held by the object in its
+// '_resolution_cache' attribute, see enaml.core.object, so that it dies with
+// the object. It is replaced when the object or one of its ancestors was
+// reparented since it was last used. Returns a new reference, or null
+// without an exception set if the object does not support the cache.
+PyObject*
+get_resolution_cache( PyObject* obj )
+{
+    if( !PyObject_TypeCheck( obj, CAtom ) )
+        return 0;
+    cppy::ptr cache( PyObject_GetAttr( obj, resolution_cache_str ) );
+    if( !cache )
+    {
+        if( PyErr_ExceptionMatches( PyExc_AttributeError ) )
+            PyErr_Clear();
+        return 0;
+    }
+    if( PyDict_CheckExact( cache.get() ) )
+    {
+        int valid = check_resolution_stamp( obj );
+        if( valid < 0 )
+            return 0;
+        if( valid )
+            return cache.release();
+    }
+    cache = PyDict_New();
+    if( !cache )
+        return 0;
+    if( PyObject_SetAttr( obj, resolution_cache_str, cache.get() ) < 0 )
+        return 0;
+    if( set_stamp( obj, resolution_stamp_str ) < 0 )
+        return 0;
+    return cache.release();
+}
+
+
+PyObject*
+load_dynamic_attr( PyObject* obj, PyObject* name, PyObject* tracer=0 )
+{
+    PyObject* res = load_attr( obj, name, tracer );
+    if( res || PyErr_Occurred() )
+        return res;
+
+    // Look for the ancestor which resolved the name last time.
+    cppy::ptr cache( get_resolution_cache( obj ) );
+    if( !cache && PyErr_Occurred() )
+        return 0;
+    if( cache )
+    {
+        PyObject* ref = PyDict_GetItem( cache.get(), name );
+        if( ref )
         {
-            cppy::ptr res(
-                descr_f( descr.get(), objptr.get(), pyobject_cast( tp ) )
-            );
-            if( !res )
-                maybe_translate_key_error();
-            else if( tracer && !run_tracer( tracer, objptr.get(), name, res.get() ) )
+            cppy::ptr ancestor( PyObject_CallNoArgs( ref ) );
+            if( !ancestor )
                 return 0;
-            return res.release();
+            if( ancestor.get() != Py_None )
+            {
+                res = load_attr( ancestor.get(), name, tracer );
+                if( res || PyErr_Occurred() )
+                    return res;
+            }
         }
+    }
 
-        // Non-readable descriptor
-        if( descr )
+    // Walk up the parents until an object provides the name.
+    cppy::ptr objptr( PyObject_GetAttr( obj, parent_str ) );
+    if( !objptr )
+        return 0;
+    while( objptr.get() != Py_None )
+    {
+        res = load_attr( objptr.get(), name, tracer );
+        if( res )
         {
-            if( tracer && !run_tracer( tracer, objptr.get(), name, descr.get() ) )
-                return 0;
-            return descr.release();
+            // If evaluating the attribute reparented the object, the cache
+            // is stale and the entry is discarded with it on the next access.
+            if( cache )
+            {
+                cppy::ptr ref( PyObject_CallOneArg( atomref, objptr.get() ) );
+                if( !ref || PyDict_SetItem( cache.get(), name, ref.get() ) < 0 )
+                    PyErr_Clear();
+            }
+            return res;
         }
+        if( PyErr_Occurred() )
+            return 0;
 
         // Step up to the parent object
         objptr = PyObject_GetAttr( objptr.get(), parent_str );
@@ -888,6 +1038,37 @@ dynamicscope_modexec( PyObject *mod )
     {
         return -1;  // LCOV_EXCL_LINE (failed to create string)
     }
+    resolution_cache_str = PyUnicode_InternFromString( "_resolution_cache" );
+    if( !resolution_cache_str )
+    {
+        return -1;  // LCOV_EXCL_LINE (failed to create string)
+    }
+    resolution_stamp_str = PyUnicode_InternFromString( "_resolution_stamp" );
+    if( !resolution_stamp_str )
+    {
+        return -1;  // LCOV_EXCL_LINE (failed to create string)
+    }
+    parent_stamp_str = PyUnicode_InternFromString( "_parent_stamp" );
+    if( !parent_stamp_str )
+    {
+        return -1;  // LCOV_EXCL_LINE (failed to create string)
+    }
+    cppy::ptr atom_api( PyImport_ImportModule( "atom.api" ) );
+    if( !atom_api )
+    {
+        return -1;  // LCOV_EXCL_LINE (failed to import atom)
+    }
+    atomref = atom_api.getattr( "atomref" );
+    if( !atomref )
+    {
+        return -1;  // LCOV_EXCL_LINE (failed to get atomref)
+    }
+    cppy::ptr catom( atom_api.getattr( "CAtom" ) );
+    if( !catom || !PyType_Check( catom.get() ) )
+    {
+        return -1;  // LCOV_EXCL_LINE (failed to get CAtom)
+    }
+    CAtom = pytype_cast( catom.release() );
     UserKeyError = PyErr_NewException( "dynamicscope.UserKeyError", 0, 0 );
     if( !UserKeyError )
     {
@@ -918,8 +1099,23 @@ dynamicscope_modexec( PyObject *mod )
 }
 
 
+// Stamp an object whose parent changed with a new generation of the trees.
+// The resolution caches of its subtree are then lazily found stale on their
+// next access, see check_resolution_stamp.
+PyObject*
+invalidate_resolution_cache( PyObject* mod, PyObject* obj )
+{
+    ++resolution_generation;
+    if( set_stamp( obj, parent_stamp_str ) < 0 )
+        return 0;
+    Py_RETURN_NONE;
+}
+
+
 static PyMethodDef
 dynamicscope_methods[] = {
+    { "invalidate_resolution_cache", ( PyCFunction )invalidate_resolution_cache,
+      METH_O, "invalidate_resolution_cache(obj)" },
     { 0 }  // Sentinel
 };
 
@@ -26,12 +26,19 @@ static PyObject* atomref;
 static PyObject* d_engine_str;
 static PyObject* update_str;
 
+// The change being dispatched by a subscription observer. It is a borrowed
+// reference which is only valid while the engine update is running.
+static PyObject* current_change = 0;
+
 // POD struct - all member fields are considered private
 struct SubscriptionObserver
 {
-    PyObject_HEAD
+    PyObject_VAR_HEAD
     PyObject* ref;
     PyObject* name;
+    // The traced dependencies stored inline as flattened (atomref, name)
+    // pairs. The size of the object is twice the number of dependencies.
+    PyObject* items[1];
 
     static PyType_Spec TypeObject_Spec;
 
@@ -53,17 +60,39 @@ SubscriptionObserver_new( PyTypeObject* type, PyObject* args, PyObject* kwargs )
 {
     PyObject* owner;
     PyObject* name;
-    static char* kwlist[] = { "owner", "name", 0 };
-    if( !PyArg_ParseTupleAndKeywords( args, kwargs, "OU", kwlist, &owner, &name ) )
+    PyObject* items = 0;
+    static char* kwlist[] = { "owner", "name", "items", 0 };
+    if( !PyArg_ParseTupleAndKeywords( args, kwargs, "OU|O", kwlist, &owner, &name, &items ) )
+    {
+        return 0;
+    }
+    cppy::ptr seq( items ? PySequence_Fast( items, "items must be iterable" ) : PyTuple_New( 0 ) );
+    if( !seq )
     {
         return 0;
     }
-    cppy::ptr ptr( PyType_GenericNew( type, args, kwargs ) );
+    Py_ssize_t count = PySequence_Fast_GET_SIZE( seq.get() );
+    for( Py_ssize_t i = 0; i < count; ++i )
+    {
+        PyObject* item = PySequence_Fast_GET_ITEM( seq.get(), i );
+        if( !PyTuple_Check( item ) || PyTuple_GET_SIZE( item ) != 2 )
+        {
+            cppy::type_error( "items must be (atomref, name) pairs" );
+            return 0;
+        }
+    }
+    cppy::ptr ptr( PyType_GenericAlloc( type, 2 * count ) );
     if( !ptr )
     {
         return 0;
     }
     SubscriptionObserver* self = reinterpret_cast<SubscriptionObserver*>( ptr.get() );
+    for( Py_ssize_t i = 0; i < count; ++i )
+    {
+        PyObject* item = PySequence_Fast_GET_ITEM( seq.get(), i );
+        self->items[2 * i] = cppy::incref( PyTuple_GET_ITEM( item, 0 ) );
+        self->items[2 * i + 1] = cppy::incref( PyTuple_GET_ITEM( item, 1 ) );
+    }
 
     self->ref = PyObject_CallOneArg(atomref, owner);
     if( !self->ref )
@@ -80,6 +109,10 @@ SubscriptionObserver_clear( SubscriptionObserver* self )
 {
     Py_CLEAR( self->ref );
     Py_CLEAR( self->name );
+    for( Py_ssize_t i = 0; i < Py_SIZE( self ); ++i )
+    {
+        Py_CLEAR( self->items[i] );
+    }
 }
 
 
@@ -89,6 +122,10 @@ SubscriptionObserver_traverse( SubscriptionObserver* self, visitproc visit, void
     Py_VISIT(Py_TYPE(self));
     Py_VISIT( self->ref );
     // name does not need visited
+    for( Py_ssize_t i = 0; i < Py_SIZE( self ); ++i )
+    {
+        Py_VISIT( self->items[i] );
+    }
     return 0;
 }
 
@@ -118,6 +155,9 @@ SubscriptionObserver__bool__( SubscriptionObserver* self )
  *     engine = owner._d_engine
  *      if engine is not None:
  *         engine.update(owner, self.name)
+ *
+ * The change which triggered the update is available through current_change
+ * while the update runs.
  */
 PyObject*
 SubscriptionObserver_call( SubscriptionObserver* self, PyObject* args, PyObject* kwargs )
@@ -136,7 +176,11 @@ SubscriptionObserver_call( SubscriptionObserver* self, PyObject* args, PyObject*
         {
             PyObject* call_args[] = { engine.get(), owner.get(), self->name };
             size_t nargsf = 3 | PY_VECTORCALL_ARGUMENTS_OFFSET;
-            return PyObject_VectorcallMethod(update_str, call_args, nargsf, 0);
+            PyObject* previous = current_change;
+            current_change = PyTuple_GET_SIZE( args ) > 0 ? PyTuple_GET_ITEM( args, 0 ) : 0;
+            PyObject* res = PyObject_VectorcallMethod(update_str, call_args, nargsf, 0);
+            current_change = previous;
+            return res;
         }
     }
     else if ( r < 0 )
@@ -146,14 +190,17 @@ SubscriptionObserver_call( SubscriptionObserver* self, PyObject* args, PyObject*
 
 
 PyDoc_STRVAR(SubscriptionObserver__doc__,
-    "SubscriptionObserver(owner, name)\n\n"
+    "SubscriptionObserver(owner, name, items=())\n\n"
     "An observer object which manages a tracer subscription.\n"
     "Parameters\n"
     "----------\n"
     "owner : Declarative\n"
     "    The declarative owner of interest.\n\n"
     "name : string\n"
-    "    The name to which the operator is bound\n");
+    "    The name to which the operator is bound\n\n"
+    "items : iterable, optional\n"
+    "    The (atomref, name) pairs of the traced dependencies. They are\n"
+    "    stored inline and cannot be modified.\n");
 
 
 PyObject*
@@ -183,12 +230,36 @@ SubscriptionObserver_get_name( SubscriptionObserver* self, void* context )
 }
 
 
+PyObject*
+SubscriptionObserver_get_items( SubscriptionObserver* self, void* context )
+{
+    Py_ssize_t count = Py_SIZE( self ) / 2;
+    cppy::ptr items( PyTuple_New( count ) );
+    if( !items )
+    {
+        return 0;
+    }
+    for( Py_ssize_t i = 0; i < count; ++i )
+    {
+        PyObject* pair = PyTuple_Pack( 2, self->items[2 * i], self->items[2 * i + 1] );
+        if( !pair )
+        {
+            return 0;
+        }
+        PyTuple_SET_ITEM( items.get(), i, pair );
+    }
+    return items.release();
+}
+
+
 static PyGetSetDef
 SubscriptionObserver_getset[] = {
     { "ref", ( getter )SubscriptionObserver_get_ref, ( setter )SubscriptionObserver_set_ref,
       "Get and set the ref for the observer." },
     { "name", ( getter )SubscriptionObserver_get_name, 0,
       "Get the name for the observer." },
+    { "items", ( getter )SubscriptionObserver_get_items, 0,
+      "Get the (atomref, name) pairs of the traced dependencies." },
     { 0 } // sentinel
 };
 
@@ -216,8 +287,8 @@ PyTypeObject* SubscriptionObserver::TypeObject = NULL;
 
 PyType_Spec SubscriptionObserver::TypeObject_Spec = {
     "enaml.core.subscription_observer.SubscriptionObserver",     /* tp_name */
-    sizeof( SubscriptionObserver ),                              /* tp_basicsize */
-    0,                                                           /* tp_itemsize */
+    offsetof( SubscriptionObserver, items ),                     /* tp_basicsize */
+    sizeof( PyObject* ),                                         /* tp_itemsize */
     Py_TPFLAGS_DEFAULT
     |Py_TPFLAGS_BASETYPE
     |Py_TPFLAGS_HAVE_GC,                                         /* tp_flags */
@@ -293,8 +364,17 @@ namespace
     }
 
 
+    PyObject*
+    get_current_change( PyObject* mod, PyObject* args )
+    {
+        return cppy::incref( current_change ? current_change : Py_None );
+    }
+
+
     PyMethodDef
     subscription_observer_methods[] = {
+        { "current_change", get_current_change, METH_NOARGS,
+          "Get the change dispatched by the running subscription observer." },
         { 0 } // Sentinel
     };
 
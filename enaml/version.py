@@ -0,0 +1,14 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2013-2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+# --------------------------------------------------------------------------------------
+# This file is auto-generated by setuptools-scm do NOT edit it.
+
+# NOTE: version_info has been removed in 0.19.0.
+# Use packaging.version.parse(__version__) instead which provides a more robust
+# API.
+
+__version__ = "0.1.dev44+g52b467492.d20261017"
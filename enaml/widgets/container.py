@@ -94,7 +94,8 @@ class Container(Frame, ContentsConstrainableMixin):
         """
         # Request the relayout first so that the widget's updates are
         # disabled before the child is actually added.
-        if isinstance(child, ConstraintsWidget):
+        if (isinstance(child, ConstraintsWidget) and
+                not self.replacing_children):
             self.request_relayout()
         super(Container, self).child_added(child)
 
@@ -107,7 +108,8 @@ class Container(Frame, ContentsConstrainableMixin):
         """
         # Request the relayout first so that the widget's updates are
         # disabled before the child is actually moved.
-        if isinstance(child, ConstraintsWidget):
+        if (isinstance(child, ConstraintsWidget) and
+                not self.replacing_children):
             self.request_relayout()
         super(Container, self).child_moved(child)
 
@@ -120,10 +122,26 @@ class Container(Frame, ContentsConstrainableMixin):
         """
         # Request the relayout first so that the widget's updates are
         # disabled before the child is actually removed.
-        if isinstance(child, ConstraintsWidget):
+        if (isinstance(child, ConstraintsWidget) and
+                not self.replacing_children):
             self.request_relayout()
         super(Container, self).child_removed(child)
 
+    def children_replaced(self, added, moved, removed):
+        """ Handle the children replaced event on the container.
+
+        This event handler will request a single relayout if any of the
+        changed children is an instance of 'ConstraintsWidget'.
+
+        """
+        # Request the relayout first so that the widget's updates are
+        # disabled before the children are actually changed.
+        for children in (added, moved, removed):
+            if any(isinstance(c, ConstraintsWidget) for c in children):
+                self.request_relayout()
+                break
+        super(Container, self).children_replaced(added, moved, removed)
+
     #--------------------------------------------------------------------------
     # Observers
     #--------------------------------------------------------------------------
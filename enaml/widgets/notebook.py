@@ -86,7 +86,15 @@ class Notebook(ConstraintsWidget):
         return [c for c in self.children if isinstance(c, Page)]
 
     def child_moved(self, child):
-        if self.proxy_is_active and isinstance(child, Page) and child.proxy_is_active:
+        """ Handle the child moved event on the notebook.
+
+        This event handler will invoke the 'page_moved()' method on an
+        active proxy, unless the children are being replaced at once.
+
+        """
+        super(Notebook, self).child_moved(child)
+        if (self.proxy_is_active and not self.replacing_children and
+                isinstance(child, Page) and child.proxy_is_active):
             self.proxy.page_moved(child.proxy)
 
     #--------------------------------------------------------------------------
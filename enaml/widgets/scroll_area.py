@@ -5,9 +5,10 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Enum, Bool, Typed, ForwardTyped, set_default
+from atom.api import Enum, Bool, Coerced, Typed, ForwardTyped, set_default
 
 from enaml.core.declarative import d_, observe
+from enaml.layout.geometry import Pos, Size
 
 from .container import Container
 from .frame import Frame, ProxyFrame, Border
@@ -29,6 +30,9 @@ class ProxyScrollArea(ProxyFrame):
     def set_widget_resizable(self, resizable):
         raise NotImplementedError
 
+    def set_scroll_position(self, position):
+        raise NotImplementedError
+
 
 class ScrollArea(Frame):
     """ A Frame which displays a single child in a scrollable area.
@@ -46,6 +50,15 @@ class ScrollArea(Frame):
     #: need for scrollbars or to make use of extra space.
     widget_resizable = d_(Bool(True))
 
+    #: The position of the scroll widget displayed at the top left of the
+    #: viewport. This value is updated when the area is scrolled, and
+    #: setting it scrolls the area.
+    scroll_position = d_(Coerced(Pos, (0, 0)))
+
+    #: The size of the viewport displaying the scroll widget. This value
+    #: is updated by the toolkit and is read-only.
+    viewport_size = d_(Coerced(Size, (0, 0)), writable=False)
+
     #: A scroll area is free to expand in width and height by default.
     hug_width = set_default('ignore')
     hug_height = set_default('ignore')
@@ -77,7 +90,8 @@ class ScrollArea(Frame):
     #--------------------------------------------------------------------------
     # Observers
     #--------------------------------------------------------------------------
-    @observe('horizontal_policy', 'vertical_policy', 'widget_resizable')
+    @observe('horizontal_policy', 'vertical_policy', 'widget_resizable',
+             'scroll_position')
     def _update_proxy(self, change):
         """ An observer which sends state change to the proxy.
 
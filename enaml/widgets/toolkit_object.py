@@ -105,6 +105,19 @@ class ProxyToolkitObject(Atom):
         """
         pass
 
+    def child_moved(self, child):
+        """ Handle a child being moved in the object.
+
+        This method will only be called after the proxy tree is active
+        and the UI is running. The default implementation is a no-op.
+
+        Parameters
+        ----------
+        child : ProxyToolkitObject
+            The toolkit proxy child moved in the object.
+
+        """
+        pass
 
     def child_removed(self, child):
         """ Handle a child being removed from the object.
@@ -123,10 +136,46 @@ class ProxyToolkitObject(Atom):
         """
         pass
 
+    def children_replaced(self, added, moved, removed):
+        """ Handle the children of the object being replaced at once.
+
+        This method will only be called after the proxy tree is active
+        and the UI is running. The default implementation calls the
+        'child_removed()' method for each removed child, and then the
+        'child_added()' or 'child_moved()' method for each added or moved
+        child in the order of the children. Subclasses may reimplement
+        this method to handle the changes as a whole.
+
+        Parameters
+        ----------
+        added : list
+            The toolkit proxies added to the object, in order.
+
+        moved : list
+            The toolkit proxies moved in the object, in order.
+
+        removed : list
+            The toolkit proxies removed from the object.
+
+        """
+        for child in removed:
+            self.child_removed(child)
+        if added or moved:
+            added = set(added)
+            moved = set(moved)
+            for child in self.children():
+                if child in added:
+                    self.child_added(child)
+                elif child in moved:
+                    self.child_moved(child)
+
 
 #: A flag indicating that the object's proxy is ready for use.
 ACTIVE_PROXY_FLAG = next(flag_generator)
 
+#: A flag indicating that the children of the object are being replaced.
+REPLACING_CHILDREN_FLAG = next(flag_generator)
+
 
 class ToolkitObject(Declarative):
     """ The base class of all toolkit objects in Enaml.
@@ -145,6 +194,11 @@ class ToolkitObject(Declarative):
     #: True by external code after the proxy widget hierarchy is setup.
     proxy_is_active = flag_property(ACTIVE_PROXY_FLAG)
 
+    #: A property which gets and sets the replacing children flag. While
+    #: set, the per-child notifications are not forwarded to the proxy.
+    #: This should not be manipulated directly by user code.
+    replacing_children = flag_property(REPLACING_CHILDREN_FLAG)
+
     def initialize(self):
         """ A reimplemented initializer.
 
@@ -184,7 +238,20 @@ class ToolkitObject(Declarative):
         if isinstance(child, ToolkitObject) and self.proxy_is_active:
             if not child.proxy_is_active:
                 child.activate_proxy()
-            self.proxy.child_added(child.proxy)
+            if not self.replacing_children:
+                self.proxy.child_added(child.proxy)
+
+    def child_moved(self, child):
+        """ A reimplemented child moved event handler.
+
+        This handler will invoke the superclass handler and then invoke
+        the 'child_moved()' method on an active proxy.
+
+        """
+        super(ToolkitObject, self).child_moved(child)
+        if isinstance(child, ToolkitObject) and self.proxy_is_active:
+            if not self.replacing_children:
+                self.proxy.child_moved(child.proxy)
 
     def child_removed(self, child):
         """ A reimplemented child removed event handler.
@@ -197,7 +264,29 @@ class ToolkitObject(Declarative):
         """
         super(ToolkitObject, self).child_removed(child)
         if isinstance(child, ToolkitObject) and self.proxy_is_active:
-            self.proxy.child_removed(child.proxy)
+            if not self.replacing_children:
+                self.proxy.child_removed(child.proxy)
+
+    def children_replaced(self, added, moved, removed):
+        """ A reimplemented children replaced event handler.
+
+        This handler will invoke the superclass handler and then invoke
+        the 'children_replaced()' method on an active proxy once for all
+        the changes, instead of once per child.
+
+        """
+        self.replacing_children = True
+        try:
+            super(ToolkitObject, self).children_replaced(added, moved, removed)
+        finally:
+            self.replacing_children = False
+        if self.proxy_is_active:
+            added, moved, removed = (
+                [c.proxy for c in children if isinstance(c, ToolkitObject)]
+                for children in (added, moved, removed)
+            )
+            if added or moved or removed:
+                self.proxy.children_replaced(added, moved, removed)
 
     def activate_proxy(self):
         """ Activate the proxy object tree.
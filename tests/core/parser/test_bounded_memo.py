@@ -0,0 +1,71 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+import io
+import tokenize
+
+import pytest
+from pegen.tokenizer import Tokenizer
+
+from enaml.core.parser import parse
+from enaml.core.parser.base_enaml_parser import BaseEnamlParser
+from enaml.core.parser.enaml_parser import EnamlParser
+
+from .test_fast_python import SOURCE, dump
+
+
+class RecordingParser(EnamlParser):
+    """Parser recording the largest size reached by the memoization cache.
+
+    """
+    max_cache_size = 0
+
+    def release_memo(self, node):
+        self.max_cache_size = max(self.max_cache_size, len(self._cache))
+        return super().release_memo(node)
+
+
+def max_cache_size(source):
+    """Parse a source and return the largest size of the cache.
+
+    """
+    tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+    parser = RecordingParser(Tokenizer(tokens), filename='test.enaml')
+    assert parser.parse('start') is not None
+    return max(parser.max_cache_size, len(parser._cache))
+
+
+def test_bounded_memo_ast(monkeypatch):
+    """Test that releasing the memoization cache does not change the ast.
+
+    """
+    bounded = parse(SOURCE, 'test.enaml', fast_python=False)
+    monkeypatch.setattr(BaseEnamlParser, 'BOUNDED_MEMO', False)
+    unbounded = parse(SOURCE, 'test.enaml', fast_python=False)
+    assert dump(bounded) == dump(unbounded)
+
+
+def test_bounded_memo_size(monkeypatch):
+    """Test that the memoization cache does not grow with the source.
+
+    """
+    small = max_cache_size(SOURCE)
+    assert max_cache_size(SOURCE * 10) == small
+    monkeypatch.setattr(BaseEnamlParser, 'BOUNDED_MEMO', False)
+    assert max_cache_size(SOURCE * 10) > 5 * small
+
+
+@pytest.mark.parametrize('bounded', [True, False])
+def test_bounded_memo_errors(monkeypatch, bounded):
+    """Test that errors are reported identically with a bounded cache.
+
+    """
+    monkeypatch.setattr(BaseEnamlParser, 'BOUNDED_MEMO', bounded)
+    source = SOURCE + 'enamldef Main(Window):\n    Label\n        text = "a"\n'
+    with pytest.raises(SyntaxError) as e:
+        parse(source, 'test.enaml', fast_python=False)
+    assert e.value.lineno == SOURCE.count('\n') + 2
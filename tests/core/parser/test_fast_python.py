@@ -0,0 +1,117 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+import ast
+from textwrap import dedent
+
+import pytest
+
+from enaml.core import enaml_ast
+from enaml.core.parser import parse
+from enaml.core.parser.fast_python import split_regions, parse_fast
+
+
+SOURCE = dedent('''\
+    # A comment
+    from enaml.widgets.api import Window, Container, Label
+
+    template = 'not a template'
+    pragma = 1
+
+    def helper(x):
+        """ Mention of
+    enamldef Fake(Window):
+        in a docstring.
+        """
+        return [i for i in range(x)]
+
+    pragma foo
+    enamldef Main(Window):
+        attr value = helper(3)
+        Container:
+            Label:
+                text << str(value)
+    # Comment between blocks
+    enamldef Other(Main): pass
+
+    @staticmethod
+    def decorated(): \\
+        pass
+
+    template Tmpl(A):
+        Label:
+            text = A
+
+    x = (1,
+    2)
+    ''')
+
+
+def dump(node):
+    """Dump an enaml ast including the embedded Python ast.
+
+    """
+    if isinstance(node, enaml_ast.PythonModule):
+        return ast.dump(node.ast, include_attributes=True)
+    elif isinstance(node, enaml_ast.ASTNode):
+        fields = [dump(getattr(node, f)) for f in node._fields]
+        attrs = [getattr(node, a) for a in ('lineno', 'col_offset',
+                                            'end_lineno', 'end_col_offset')]
+        return (type(node).__name__, fields, attrs)
+    elif isinstance(node, ast.AST):
+        return ast.dump(node, include_attributes=True)
+    elif isinstance(node, list):
+        return [dump(n) for n in node]
+    elif hasattr(node, 'value') and hasattr(node, 'kind'):
+        return (node.kind, node.value)
+    return node
+
+
+def test_split_regions():
+    """Test identifying the Python and enaml regions of a module.
+
+    """
+    from enaml.core.parser.fast_python import tokenize, io
+    tokens = list(tokenize.generate_tokens(io.StringIO(SOURCE).readline))
+    regions = [(is_enaml, lineno)
+               for is_enaml, _, lineno in split_regions(tokens)]
+    assert regions == [(False, 2), (True, 14), (False, 23), (True, 27),
+                       (False, 31)]
+
+
+@pytest.mark.parametrize('source', [
+    SOURCE,
+    'import os\n',
+    'enamldef Main(Window):\n    pass\n',
+    '',
+    '# only a comment\n',
+])
+def test_fast_python_parsing(source):
+    """Test that the fast path produces the same ast as the enaml parser.
+
+    """
+    expected = parse(source, 'test.enaml', fast_python=False)
+    result = parse_fast(source, 'test.enaml')
+    assert dump(result) == dump(expected)
+    assert parse(source, 'test.enaml', fast_python=True) is not None
+
+
+@pytest.mark.parametrize('source, lineno', [
+    ('x = 1\ndef f(:\n    pass\nenamldef Main(Window):\n    pass\n', 2),
+    ('x = 1\nenamldef Main(Window):\n    Label\n        text = "a"\n', 3),
+])
+def test_fast_python_parsing_errors(source, lineno):
+    """Test that errors are reported as with the enaml parser.
+
+    """
+    with pytest.raises(SyntaxError) as expected:
+        parse(source, 'test.enaml', fast_python=False)
+    with pytest.raises(SyntaxError) as result:
+        parse(source, 'test.enaml', fast_python=True)
+    assert type(result.value) is type(expected.value)
+    assert result.value.lineno == expected.value.lineno == lineno
+    assert result.value.msg == expected.value.msg
@@ -0,0 +1,156 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from textwrap import dedent
+
+import pytest
+
+from enaml.core.api import batch_updates
+from utils import compile_source
+
+
+SOURCE = dedent("""\
+from enaml.core.api import Declarative
+
+calls = []
+
+def record(*values):
+    calls.append(values)
+    return sum(values)
+
+enamldef Main(Declarative):
+    attr a = 1
+    attr b = 2
+    attr total << record(a, b)
+    attr double << 2 * total
+    attr both << record(total, double)
+
+""")
+
+
+@pytest.fixture
+def main():
+    """Create a Main object and return it along the list of recorded calls.
+
+    """
+    namespace = {'__name__': 'test_batch_updates'}
+    Main = compile_source(SOURCE, 'Main', namespace=namespace)
+    main = Main()
+    assert main.both == 9
+    calls = namespace['calls']
+    del calls[:]
+    return main, calls
+
+
+def test_unbatched_updates(main):
+    """Test that without a batch each change triggers a re-evaluation.
+
+    """
+    main, calls = main
+    main.a = 2
+    main.b = 3
+    assert main.total == 5
+    assert [c for c in calls if c in ((2, 2), (2, 3))] == [(2, 2), (2, 3)]
+
+
+def test_batch_updates(main):
+    """Test that an expression is re-evaluated once at the end of a batch.
+
+    """
+    main, calls = main
+    with batch_updates():
+        main.a = 2
+        main.b = 3
+        assert main.total == 3
+        assert not calls
+    assert calls[0] == (2, 3)
+    assert main.total == 5
+    assert main.double == 10
+    assert main.both == 15
+    # both depends on total and double which are both updated: it is
+    # evaluated once, after both of them.
+    assert calls == [(2, 3), (5, 10)]
+
+
+def test_nested_batch_updates(main):
+    """Test that nested batches are flushed by the outermost one.
+
+    """
+    main, calls = main
+    with batch_updates():
+        with batch_updates():
+            main.a = 2
+        assert main.total == 3
+        main.b = 3
+    assert calls[0] == (2, 3)
+    assert main.both == 15
+
+
+def test_batch_updates_on_error(main):
+    """Test that the pending updates are performed when the batch fails.
+
+    """
+    main, calls = main
+    with pytest.raises(ValueError):
+        with batch_updates():
+            main.a = 2
+            raise ValueError()
+    assert main.total == 4
+    with batch_updates():
+        main.a = 3
+    assert main.total == 5
+
+
+def test_batch_updates_destroyed(main):
+    """Test that the updates of destroyed objects are discarded.
+
+    """
+    main, calls = main
+    with batch_updates():
+        main.a = 2
+        main.destroy()
+    assert not calls
+
+
+ORDER_SOURCE = dedent("""\
+from enaml.core.api import Declarative
+
+calls = []
+
+def record(*values):
+    calls.append(values)
+    return values
+
+enamldef Model(Declarative):
+    attr x = 0
+    attr y = 0
+
+enamldef Main(Declarative):
+    attr model = Model()
+    attr a << model.x * 10
+    attr b << record(a, model.y)
+
+""")
+
+
+def test_batch_updates_dependency_order():
+    """Test that the expressions are updated after their dependencies.
+
+    The expression invalidated first depends on one invalidated later, it
+    is nevertheless evaluated once and never sees a stale value.
+
+    """
+    namespace = {'__name__': 'test_batch_updates'}
+    main = compile_source(ORDER_SOURCE, 'Main', namespace=namespace)()
+    assert main.b == (0, 0)
+    calls = namespace['calls']
+    del calls[:]
+    with batch_updates():
+        main.model.y = 1
+        main.model.x = 1
+    assert calls == [(10, 1)]
+    assert main.b == (10, 1)
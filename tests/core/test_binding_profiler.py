@@ -0,0 +1,131 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+import io
+import json
+from textwrap import dedent
+
+import pytest
+
+from enaml.core.binding_profiler import (
+    BindingProfiler, enable_binding_profiler, disable_binding_profiler
+)
+from utils import compile_source
+
+
+SOURCE = dedent("""\
+from enaml.core.api import Declarative
+
+enamldef Main(Declarative):
+    attr a = 1
+    attr b = 2
+    attr notified = 0
+    attr total << a + b
+    total :: self.notified += 1
+    Declarative: child:
+        attr double << 2 * total
+""")
+
+
+@pytest.fixture
+def profiler():
+    """Enable a fresh binding profiler for the duration of a test.
+
+    """
+    disable_binding_profiler()
+    profiler = enable_binding_profiler()
+    try:
+        yield profiler
+    finally:
+        disable_binding_profiler()
+
+
+def get_record(profiler, attribute, kind):
+    """Get the record of a binding.
+
+    """
+    records = [r for r in profiler.to_json()
+               if r['attribute'] == attribute and r['kind'] == kind]
+    assert len(records) == 1
+    return records[0]
+
+
+def test_binding_profiler_records(profiler):
+    """Test the records created for the different kind of evaluations.
+
+    """
+    Main = compile_source(SOURCE, 'Main', filename='main.enaml')
+    main = Main()
+    child = main.children[0]
+    assert child.double == 6
+    main.a = 2
+    main.b = 3
+    assert child.double == 10
+
+    read = get_record(profiler, 'total', 'read')
+    assert read['count'] == 1
+    assert read['enamldef'] == 'Main'
+    assert read['operator'] == '<<'
+    assert read['file'] == 'main.enaml'
+    assert read['line'] == 7
+
+    update = get_record(profiler, 'total', 'update')
+    assert update['count'] == 2
+    assert update['triggers'] == [['Main.a', 1], ['Main.b', 1]]
+    # Updating total updates double and notifies the :: handler.
+    assert update['cumulative'] >= update['own']
+
+    # Bindings on children are attributed to the enamldef declaring them.
+    double = get_record(profiler, 'double', 'update')
+    assert double['enamldef'] == 'Main'
+    assert double['triggers'] == [['Main.total', 2]]
+
+    write = get_record(profiler, 'total', 'write')
+    assert write['operator'] == '::'
+    assert write['count'] == 2
+    assert main.notified == 2
+
+
+def test_binding_profiler_report(profiler, tmp_path):
+    """Test printing and dumping the records.
+
+    """
+    Main = compile_source(SOURCE, 'Main', filename='main.enaml')
+    main = Main()
+    main.children[0].double
+    main.a = 5
+
+    out = io.StringIO()
+    profiler.report(sort='count', limit=2, file=out)
+    assert len(out.getvalue().splitlines()) == 3
+
+    out = io.StringIO()
+    profiler.report(sort='cumulative', limit=None, file=out)
+    lines = out.getvalue().splitlines()
+    assert len(lines) == len(profiler.records) + 1
+    assert any('Main.total << main.enaml:7 <- Main.a' in line
+               for line in lines)
+
+    path = tmp_path / 'bindings.json'
+    profiler.dump_json(str(path))
+    with open(path) as f:
+        assert len(json.load(f)) == len(profiler.records)
+
+    profiler.clear()
+    assert not profiler.records
+
+
+def test_binding_profiler_disabled():
+    """Test that nothing is recorded when the profiler is disabled.
+
+    """
+    profiler = disable_binding_profiler()
+    assert BindingProfiler.active is None
+    Main = compile_source(SOURCE, 'Main')
+    Main().a = 3
+    if profiler is not None:
+        enable_binding_profiler()
@@ -0,0 +1,125 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+import importlib
+import os
+import sys
+
+import pytest
+
+from enaml.core.import_hooks import (EnamlBundleImporter, imports,
+                                     write_bundle)
+
+
+SOURCE =\
+"""
+from enaml.widgets.api import *
+
+VALUE = {value}
+
+enamldef Main(Window):
+
+    Field: fd:
+        name = 'content'
+
+"""
+
+
+@pytest.fixture()
+def bundle(tmpdir):
+    """Create a bundle containing a top-level module and a module from a
+    package and register it.
+
+    """
+    folder = str(tmpdir)
+    modules = []
+    for name, value in (('__enaml_bundle_top__', 1),
+                        ('__enaml_bundle_pkg__.view', 2)):
+        path = os.path.join(folder, name.replace('.', os.sep) + '.enaml')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(SOURCE.format(value=value))
+        modules.append((name, path))
+    with open(os.path.join(folder, '__enaml_bundle_pkg__', '__init__.py'),
+              'w'):
+        pass
+
+    bundle_path = os.path.join(folder, 'app.enamlbundle')
+    write_bundle(bundle_path, modules)
+    EnamlBundleImporter.add_bundle(bundle_path)
+    sys.path.append(folder)
+
+    yield bundle_path, dict(modules)
+
+    EnamlBundleImporter.remove_bundle(bundle_path)
+    sys.path.remove(folder)
+    for name in ('__enaml_bundle_top__', '__enaml_bundle_pkg__.view',
+                 '__enaml_bundle_pkg__'):
+        sys.modules.pop(name, None)
+
+
+def test_import_from_bundle(bundle):
+    """Test importing modules from a bundle without any source file.
+
+    """
+    bundle_path, modules = bundle
+    for path in modules.values():
+        os.remove(path)
+
+    with imports():
+        top = importlib.import_module('__enaml_bundle_top__')
+        view = importlib.import_module('__enaml_bundle_pkg__.view')
+
+    assert top.VALUE == 1
+    assert view.VALUE == 2
+    assert isinstance(top.__loader__, EnamlBundleImporter)
+    assert top.__file__ == modules['__enaml_bundle_top__']
+    assert top.__cached__ == bundle_path
+    assert top.Main.__name__ == 'Main'
+
+
+def test_bundle_check_source(bundle, monkeypatch):
+    """Test that modified sources are used when checking sources.
+
+    """
+    _, modules = bundle
+    with open(modules['__enaml_bundle_top__'], 'w') as f:
+        f.write(SOURCE.format(value=3))
+
+    with imports():
+        top = importlib.import_module('__enaml_bundle_top__')
+    assert top.VALUE == 1
+
+    del sys.modules['__enaml_bundle_top__']
+    monkeypatch.setattr(EnamlBundleImporter, 'check_source', True)
+    with imports():
+        top = importlib.import_module('__enaml_bundle_top__')
+    assert top.VALUE == 3
+
+
+def test_remove_bundle(bundle):
+    """Test that the modules of a removed bundle cannot be located.
+
+    """
+    bundle_path, _ = bundle
+    assert EnamlBundleImporter.locate_module('__enaml_bundle_top__')
+    EnamlBundleImporter.remove_bundle(bundle_path)
+    assert EnamlBundleImporter.locate_module('__enaml_bundle_top__') is None
+    # Removing twice is a no-op
+    EnamlBundleImporter.remove_bundle(bundle_path)
+
+
+def test_add_invalid_bundle(tmpdir):
+    """Test that registering an invalid bundle raises an ImportError.
+
+    """
+    for content in (b'', b'not a bundle' * 10):
+        path = os.path.join(str(tmpdir), 'invalid.enamlbundle')
+        with open(path, 'wb') as f:
+            f.write(content)
+        with pytest.raises(ImportError):
+            EnamlBundleImporter.add_bundle(path)
@@ -0,0 +1,127 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+import json
+from textwrap import dedent
+
+import pytest
+
+from enaml.core.binding_profiler import (
+    enable_binding_profiler, disable_binding_profiler
+)
+from enaml.core.dependency_graph import node_id, subscription_graph
+from utils import compile_source
+
+
+SOURCE = dedent("""\
+from enaml.core.api import Declarative
+
+enamldef Main(Declarative):
+    attr a = 1
+    attr b = 2
+    attr total << a + b
+    Declarative: child:
+        name = 'child'
+        attr double << 2 * total
+""")
+
+
+@pytest.fixture
+def main():
+    """Build a view tree with traced subscriptions.
+
+    """
+    disable_binding_profiler()
+    main = compile_source(SOURCE, 'Main')()
+    main.initialize()
+    yield main
+    disable_binding_profiler()
+
+
+def test_subscription_graph_edges(main):
+    """Test that the graph holds an edge by traced dependency.
+
+    """
+    child = main.children[0]
+    child.double
+    graph = subscription_graph(main)
+
+    expected = {
+        (node_id(main, 'a'), node_id(main, 'total')),
+        (node_id(main, 'b'), node_id(main, 'total')),
+        (node_id(main, 'total'), node_id(child, 'double')),
+    }
+    assert set(graph.edges) == expected
+    assert all(e['triggers'] == 0 for e in graph.edges.values())
+    assert graph.nodes[node_id(child, 'double')] == {
+        'type': 'Declarative', 'name': 'child', 'member': 'double'
+    }
+
+
+def test_subscription_graph_trigger_counts(main):
+    """Test that the edges hold the triggers counted by the profiler.
+
+    """
+    child = main.children[0]
+    child.double
+    enable_binding_profiler()
+    main.a = 3
+    main.a = 4
+    main.b = 5
+    graph = subscription_graph(main)
+
+    assert graph.edges[(node_id(main, 'a'), node_id(main, 'total'))] == {
+        'triggers': 2
+    }
+    assert graph.edges[(node_id(main, 'b'), node_id(main, 'total'))] == {
+        'triggers': 1
+    }
+    key = (node_id(main, 'total'), node_id(child, 'double'))
+    assert graph.edges[key] == {'triggers': 3}
+
+
+def test_subscription_graph_snapshot(main):
+    """Test that the graph reflects the dependencies of the last evaluation.
+
+    """
+    graph = subscription_graph(main)
+    assert (node_id(main, 'total'),
+            node_id(main.children[0], 'double')) not in graph.edges
+    main.children[0].double
+    graph = subscription_graph(main)
+    assert (node_id(main, 'total'),
+            node_id(main.children[0], 'double')) in graph.edges
+
+
+def test_subscription_graph_exports(main):
+    """Test the node-link and DOT exports.
+
+    """
+    main.children[0].double
+    graph = subscription_graph(main)
+
+    data = json.loads(json.dumps(graph.to_node_link()))
+    assert data['directed'] is True
+    assert {n['id'] for n in data['nodes']} == set(graph.nodes)
+    assert {(l['source'], l['target']) for l in data['links']} == set(graph.edges)
+
+    dot = graph.to_dot()
+    assert dot.startswith('digraph "subscriptions" {')
+    assert '"%s" -> "%s" [label="0"];' % (node_id(main, 'a'),
+                                         node_id(main, 'total')) in dot
+    assert 'label="Declarative(child).double"' in dot
+
+
+def test_subscription_graph_networkx(main):
+    """Test the conversion to a networkx graph.
+
+    """
+    networkx = pytest.importorskip('networkx')
+    main.children[0].double
+    graph = subscription_graph(main).to_networkx()
+    assert isinstance(graph, networkx.DiGraph)
+    assert graph.number_of_edges() == 3
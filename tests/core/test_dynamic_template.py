@@ -0,0 +1,105 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from textwrap import dedent
+
+from enaml.core.api import DynamicTemplate
+from utils import compile_source, items_of
+
+
+SOURCE = dedent("""\
+from enaml.core.api import Declarative, DynamicTemplate
+
+enamldef Item(Declarative):
+    attr text = ''
+    attr size = 0
+
+template Form(Count):
+    Item:
+        pass
+
+template Form(Count: 2):
+    Item:
+        pass
+    Item:
+        pass
+
+enamldef Main(Declarative): main:
+    attr count = 1
+    attr values = {}
+    attr tag_names = ('first',)
+    DynamicTemplate:
+        base = Form
+        args << (main.count,)
+        data << main.values
+        tags << main.tag_names
+""")
+
+
+def build():
+    """Create an initialized tree holding a dynamic template.
+
+    """
+    main = compile_source(SOURCE, 'Main')()
+    main.initialize()
+    dynamic = main.children[-1]
+    assert isinstance(dynamic, DynamicTemplate)
+    return main, dynamic
+
+
+def wait_refresh(enaml_qtbot, dynamic):
+    """Wait for the scheduled refresh of the dynamic template.
+
+    """
+    enaml_qtbot.waitUntil(lambda: dynamic._update_task is None)
+
+
+def test_dynamic_template_data_update(enaml_qtbot):
+    """Test that changing the data reuses the items.
+
+    """
+    main, dynamic = build()
+    item, = items_of(main, DynamicTemplate)
+    main.values = {'text': 'a'}
+    wait_refresh(enaml_qtbot, dynamic)
+    assert items_of(main, DynamicTemplate) == [item]
+    assert item.text == 'a'
+
+    main.values = {'text': 'b', 'size': 2}
+    wait_refresh(enaml_qtbot, dynamic)
+    assert items_of(main, DynamicTemplate) == [item]
+    assert (item.text, item.size) == ('b', 2)
+    assert dynamic.tagged.first is item
+
+    main.tag_names = ('other',)
+    wait_refresh(enaml_qtbot, dynamic)
+    assert items_of(main, DynamicTemplate) == [item]
+    assert dynamic.tagged.other is item
+
+
+def test_dynamic_template_rebuild(enaml_qtbot):
+    """Test that the items are rebuilt when the instantiation changes.
+
+    """
+    main, dynamic = build()
+    main.values = {'text': 'a'}
+    wait_refresh(enaml_qtbot, dynamic)
+    item, = items_of(main, DynamicTemplate)
+
+    # Removing a data key cannot be applied to the existing items.
+    main.values = {}
+    wait_refresh(enaml_qtbot, dynamic)
+    new, = items_of(main, DynamicTemplate)
+    assert new is not item and item.is_destroyed
+    assert new.text == ''
+
+    main.tag_names = ()
+    main.count = 2
+    wait_refresh(enaml_qtbot, dynamic)
+    items = items_of(main, DynamicTemplate)
+    assert len(items) == 2
+    assert new.is_destroyed
@@ -1,17 +1,18 @@
 #------------------------------------------------------------------------------
-# Copyright (c) 2018-2024, Nucleic Development Team.
+# Copyright (c) 2018-2025, Nucleic Development Team.
 #
 # Distributed under the terms of the Modified BSD License.
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
 import gc
-import sys
 from collections import Counter
 
 import pytest
 
+from atom.api import Value, atomref
 from atom.datastructures.api import sortedmap
+from enaml.core.declarative import Declarative
 from enaml.core.dynamicscope import UserKeyError, DynamicScope
 
 
@@ -427,3 +428,75 @@ def test_nonlocals_call(dynamicscope, nonlocals):
     with pytest.raises(ValueError):
         nonlocals(level=2)
 
+
+def test_dynamicscope_resolution_cache():
+    """Test that names resolved on an ancestor follow the tree changes.
+
+    """
+    class Provider(Declarative):
+        value = Value()
+
+    first = Provider(value=1)
+    second = Provider(value=2)
+    middle = Declarative(parent=first)
+    owner = Declarative(parent=middle)
+
+    def lookup():
+        scope = DynamicScope(owner, sortedmap(), {}, {})
+        return scope['value']
+
+    assert lookup() == 1
+    assert lookup() == 1
+    first.value = 3
+    assert lookup() == 3
+
+    # Reparenting through set_parent.
+    middle.set_parent(second)
+    assert lookup() == 2
+
+    # Reparenting through insert_children, shadowing the previous ancestor.
+    shadow = Provider(value=4, parent=second)
+    shadow.insert_children(None, [owner])
+    assert lookup() == 4
+
+    # Destroying the tree.
+    shadow.destroy()
+    with pytest.raises(KeyError):
+        lookup()
+
+
+def test_dynamicscope_resolution_cache_per_owner():
+    """Test that the resolution cache is held by the owner and only replaced
+    when the owner or one of its ancestors was reparented.
+
+    """
+    class Provider(Declarative):
+        value = Value()
+
+    root = Provider(value=1)
+    owner = Declarative(parent=Declarative(parent=root))
+    other = Declarative(parent=root)
+
+    def lookup(obj):
+        return DynamicScope(obj, sortedmap(), {}, {})['value']
+
+    assert lookup(owner) == lookup(other) == 1
+    cache = owner._resolution_cache
+    other_cache = other._resolution_cache
+    assert cache == {'value': atomref(root)}
+
+    # Reparenting an unrelated object keeps the cache of the owner.
+    Declarative().set_parent(root)
+    other.set_parent(Provider(value=2))
+    assert owner._resolution_cache is cache
+    assert other._resolution_cache is other_cache
+    assert lookup(owner) == 1
+    assert owner._resolution_cache is cache
+    assert lookup(other) == 2
+    assert other._resolution_cache is not other_cache
+
+    # Reparenting an ancestor lazily replaces the cache of the subtree.
+    owner.parent.set_parent(Provider(value=3))
+    assert owner._resolution_cache is cache
+    assert lookup(owner) == 3
+    assert owner._resolution_cache is not cache
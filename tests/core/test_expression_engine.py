@@ -0,0 +1,164 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from textwrap import dedent
+
+from enaml.core.expression_engine import ExpressionEngine, HandlerPair
+from utils import compile_source
+
+
+def test_engine_copy_shares_handlers():
+    """Test that copies share the handler sets until they are modified.
+
+    """
+    engine = ExpressionEngine()
+    first, second = HandlerPair(), HandlerPair()
+    engine.add_pair('a', first)
+    engine.add_pair('b', first)
+    copy = engine.copy()
+    assert copy._handlers is engine._handlers
+
+    copy.add_pair('a', second)
+    assert copy._handlers is not engine._handlers
+    assert copy._handlers['b'] is engine._handlers['b']
+    assert copy._handlers['a'].all_pairs == [first, second]
+    assert engine._handlers['a'].all_pairs == [first]
+
+    # The original engine must not modify the sets still shared.
+    engine.add_pair('b', second)
+    assert engine._handlers['b'].all_pairs == [first, second]
+    assert copy._handlers['b'].all_pairs == [first]
+
+    # Sets owned by an engine are modified in place.
+    handler = copy._handlers['a']
+    copy.add_pair('a', first)
+    assert copy._handlers['a'] is handler
+
+
+def test_engine_copy_of_copy():
+    """Test that a set modified before a copy is not modified by the copy.
+
+    """
+    engine = ExpressionEngine()
+    pair = HandlerPair()
+    engine.add_pair('a', pair)
+    copy = engine.copy()
+    copy.add_pair('a', pair)
+    other = copy.copy()
+    other.add_pair('a', pair)
+    assert len(engine._handlers['a'].all_pairs) == 1
+    assert len(copy._handlers['a'].all_pairs) == 2
+    assert len(other._handlers['a'].all_pairs) == 3
+
+
+def test_subclass_bindings_independent():
+    """Test that overriding a binding in a subclass leaves the base intact.
+
+    """
+    source = dedent("""\
+    from enaml.core.declarative import Declarative
+
+    enamldef Base(Declarative):
+        attr a = 1
+        attr b = 2
+        Declarative:
+            attr c = 3
+
+    enamldef Derived(Base):
+        a = 10
+
+    enamldef Main(Declarative):
+        Base:
+            pass
+        Derived:
+            pass
+    """)
+    main = compile_source(source, 'Main')()
+    base, derived = main.children
+    assert (base.a, base.b, base.children[0].c) == (1, 2, 3)
+    assert (derived.a, derived.b, derived.children[0].c) == (10, 2, 3)
+
+
+def test_engine_suspend_resume():
+    """Test that the expressions of a suspended attribute are not run.
+
+    """
+    source = dedent("""\
+    from enaml.core.declarative import Declarative
+
+    enamldef Main(Declarative): main:
+        attr source = 1
+        attr target = 0
+        attr value << main.source
+        attr synced := main.target
+    """)
+    main = compile_source(source, 'Main')()
+    assert main.value == 1
+    engine = main._d_engine
+    engine.suspend(main, 'value')
+    engine.suspend(main, 'synced')
+    main.source = 2
+    main.synced = 5
+    assert (main.value, main.target) == (1, 0)
+
+    assert engine.resume(main, 'value')
+    assert main.value == 2
+    assert engine.resume(main, 'synced')
+    assert main.synced == 0
+    main.synced = 6
+    assert main.target == 6
+    assert not engine.resume(main, 'unknown')
+
+
+def test_engine_suspend_while_running():
+    """Test that a suspension made by a running handler is kept.
+
+    """
+    source = dedent("""\
+    from enaml.core.declarative import Declarative
+
+    enamldef Main(Declarative): main:
+        attr source = 1
+        attr value << main.source
+        value ::
+            if change['value'] == 2:
+                main._d_engine.suspend(main, 'value')
+    """)
+    main = compile_source(source, 'Main')()
+    assert main.value == 1
+    main.source = 2
+    assert main.value == 2
+    main.source = 3
+    assert main.value == 2
+    assert main._d_engine.resume(main, 'value')
+    assert main.value == 3
+
+
+def test_engine_nested_suspend():
+    """Test that the expressions are resumed by the last resume call.
+
+    """
+    source = dedent("""\
+    from enaml.core.declarative import Declarative
+
+    enamldef Main(Declarative): main:
+        attr source = 1
+        attr value << main.source
+    """)
+    main = compile_source(source, 'Main')()
+    assert main.value == 1
+    engine = main._d_engine
+    engine.suspend(main, 'value')
+    engine.suspend(main, 'value')
+    main.source = 2
+    assert engine.resume(main, 'value')
+    assert main.value == 1
+    main.source = 3
+    assert main.value == 1
+    assert engine.resume(main, 'value')
+    assert main.value == 3
+    assert engine._suspended is None
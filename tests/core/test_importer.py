@@ -183,3 +183,184 @@ def test_importer_management(enaml_importer):
 
     with pytest.raises(TypeError):
         enaml_importer.add_importer(object)
+
+
+def test_directory_listing_cache(enaml_module):
+    """Test that directory listings are cached and properly invalidated.
+
+    """
+    name, folder, path = enaml_module
+    assert EnamlImporter.locate_module(name) is not None
+
+    # Add a new module without updating the directory modification time.
+    mtime = os.stat(folder).st_mtime_ns
+    other = name + '_other'
+    with open(os.path.join(folder, other + '.enaml'), 'w') as f:
+        f.write(SOURCE)
+    os.utime(folder, ns=(mtime, mtime))
+    assert EnamlImporter.locate_module(other) is None
+
+    # Invalidating the caches through importlib makes the module visible.
+    with imports():
+        importlib.invalidate_caches()
+    assert EnamlImporter.locate_module(other) is not None
+
+    # Any change to the directory modification time refreshes the listing.
+    os.remove(os.path.join(folder, other + '.enaml'))
+    os.utime(folder, ns=(mtime + 10**9, mtime + 10**9))
+    assert EnamlImporter.locate_module(other) is None
+
+
+def test_locate_cache_only_module(enaml_module):
+    """Test locating a module for which only the cache exists.
+
+    """
+    name, folder, path = enaml_module
+    with imports():
+        importlib.import_module(name)
+    del sys.modules[name]
+    os.remove(path)
+
+    importer = EnamlImporter.locate_module(name)
+    assert importer is not None
+    assert importer.file_info.src_path == path
+
+
+@pytest.mark.parametrize('mode', ['checked-hash', 'unchecked-hash'])
+def test_hash_based_cache(enaml_module, monkeypatch, mode):
+    """Test that hash based caches ignore the source modification time.
+
+    """
+    from py_compile import PycInvalidationMode
+    from enaml.core.import_hooks import (CACHE_HASH_BASED, CACHE_CHECK_SOURCE,
+                                         get_default_invalidation_mode)
+
+    monkeypatch.setenv('ENAML_CACHE_INVALIDATION_MODE', mode)
+    invalidation_mode = get_default_invalidation_mode()
+    assert invalidation_mode.name.lower().replace('_', '-') == mode
+    monkeypatch.setattr(EnamlImporter, 'invalidation_mode', invalidation_mode)
+
+    name, folder, path = enaml_module
+    with imports():
+        importlib.import_module(name)
+    del sys.modules[name]
+
+    importer = EnamlImporter.locate_module(name)
+    magic, flags, data = importer._get_magic_info(importer.file_info)
+    assert flags & CACHE_HASH_BASED
+    checked = invalidation_mode == PycInvalidationMode.CHECKED_HASH
+    assert bool(flags & CACHE_CHECK_SOURCE) is checked
+    assert data == importer.get_source_hash()
+
+    # Touching the source does not invalidate the cache
+    cache_path = importer.file_info.cache_path
+    cache_time = os.path.getmtime(cache_path)
+    os.utime(path, (cache_time + 10, cache_time + 10))
+    with imports():
+        importlib.import_module(name)
+    del sys.modules[name]
+    assert os.path.getmtime(cache_path) == cache_time
+
+    # Modifying the source only invalidates a checked cache
+    with open(path, 'a') as f:
+        f.write('\nVALUE = 1\n')
+    with imports():
+        mod = importlib.import_module(name)
+    assert hasattr(mod, 'VALUE') is checked
+
+
+def test_invalid_invalidation_mode(monkeypatch):
+    """Test that an invalid invalidation mode falls back to timestamps.
+
+    """
+    from py_compile import PycInvalidationMode
+    from enaml.core.import_hooks import get_default_invalidation_mode
+
+    monkeypatch.setenv('ENAML_CACHE_INVALIDATION_MODE', 'invalid')
+    with pytest.warns(RuntimeWarning):
+        mode = get_default_invalidation_mode()
+    assert mode == PycInvalidationMode.TIMESTAMP
+
+
+def test_import_profiler(enaml_module, tmpdir):
+    """Test recording the time spent in the phases of an import.
+
+    """
+    import json
+    from io import StringIO
+    from enaml.core.import_hooks import (ImportProfiler,
+                                         enable_import_profiler,
+                                         disable_import_profiler)
+
+    name, folder, path = enaml_module
+    profiler = enable_import_profiler()
+    try:
+        assert enable_import_profiler() is profiler
+        with imports():
+            importlib.import_module(name)
+        del sys.modules[name]
+        record = profiler.records.pop(path)
+        assert record['module'] == name
+        assert record['cache'] == 'miss'
+        for phase in ImportProfiler.PHASES:
+            if phase != 'cache_read':
+                assert record[phase] > 0
+        assert record['cumulative'] >= record['exec']
+
+        with imports():
+            importlib.import_module(name)
+    finally:
+        assert disable_import_profiler() is profiler
+    assert ImportProfiler.active is None
+
+    record = profiler.records[path]
+    assert record['cache'] == 'hit'
+    assert record['cache_read'] > 0 and record['parse'] == 0
+
+    out = StringIO()
+    profiler.report(sort='total', file=out)
+    lines = out.getvalue().splitlines()
+    assert 'cumulative' in lines[0]
+    assert any(line.endswith(name) for line in lines[1:])
+
+    json_path = os.path.join(str(tmpdir), 'profile.json')
+    profiler.dump_json(json_path)
+    with open(json_path) as f:
+        rows = json.load(f)
+    assert [r['path'] for r in rows] == list(profiler.records)
+    assert all('total' in r for r in rows)
+
+
+@pytest.fixture
+def cache_prefix(tmpdir):
+    """Write the cached files in a separate tree for the duration of a test.
+
+    """
+    from enaml.core.import_hooks import get_cache_prefix, set_cache_prefix
+
+    old = get_cache_prefix()
+    prefix = os.path.join(str(tmpdir), 'cache_prefix')
+    set_cache_prefix(prefix)
+    yield prefix
+    set_cache_prefix(old)
+
+
+def test_import_with_cache_prefix(enaml_module, cache_prefix):
+    """Test that the cache prefix is used to write and read cached files.
+
+    """
+    name, folder, path = enaml_module
+    with imports():
+        mod = importlib.import_module(name)
+    del sys.modules[name]
+
+    assert not os.path.exists(os.path.join(folder, '__enamlcache__'))
+    assert mod.__cached__.startswith(cache_prefix)
+    drive, tail = os.path.splitdrive(os.path.abspath(folder))
+    cache_dir = os.path.join(cache_prefix, tail.lstrip('\\/'))
+    assert os.path.dirname(mod.__cached__) == cache_dir
+    cache_time = os.path.getmtime(mod.__cached__)
+
+    with imports():
+        importlib.import_module(name)
+    assert os.path.getmtime(mod.__cached__) == cache_time
@@ -7,7 +7,7 @@
 #------------------------------------------------------------------------------
 import pytest
 from textwrap import dedent
-from utils import compile_source, wait_for_window_displayed
+from utils import compile_source, items_of, wait_for_window_displayed
 
 from enaml.core.api import Looper
 from enaml.widgets.api import Label
@@ -117,3 +117,410 @@ def test_looper_iterable():
 
     with pytest.raises(TypeError):
         looper.iterable = None
+
+
+RECONCILE_SOURCE = dedent("""\
+from atom.api import List
+from enaml.core.api import Declarative, Looper
+
+class Recorder(Declarative):
+
+    moved = List()
+
+    def child_moved(self, child):
+        super(Recorder, self).child_moved(child)
+        self.moved.append(child.value)
+
+enamldef Item(Declarative):
+    attr index
+    attr value
+
+enamldef Main(Recorder): main:
+    attr data = []
+    attr key = None
+    Looper:
+        iterable << main.data
+        key << main.key
+        Item:
+            index << loop.index
+            value << loop.item
+""")
+
+
+def build_looper_tree():
+    """Create an initialized tree with a looper recording moved children.
+
+    """
+    main = compile_source(RECONCILE_SOURCE, 'Main')()
+    main.initialize()
+    return main
+
+
+def test_looper_reuses_iterations():
+    """Test that the items of the kept values are not recreated.
+
+    """
+    main = build_looper_tree()
+    main.data = ['a', 'b', 'c', 'd']
+    old = dict((c.value, c) for c in items_of(main, Looper))
+    main.moved = []
+    main.data = ['d', 'a', 'e', 'c']
+    children = items_of(main, Looper)
+    assert [c.value for c in children] == ['d', 'a', 'e', 'c']
+    assert [c.index for c in children] == [0, 1, 2, 3]
+    assert all(old[c.value] is c for c in children if c.value != 'e')
+    assert old['b'].is_destroyed
+    # Only 'd' is out of order, 'a' and 'c' keep their place.
+    assert main.moved == ['d']
+
+
+def test_looper_duplicate_items():
+    """Test that duplicate items are matched in order.
+
+    """
+    main = build_looper_tree()
+    main.data = ['a', 'b', 'a']
+    first, _, second = items_of(main, Looper)
+    main.data = ['a', 'a']
+    children = items_of(main, Looper)
+    assert children == [first, second]
+    assert [c.index for c in children] == [0, 1]
+
+
+def test_looper_key_function():
+    """Test matching unhashable items using a key function.
+
+    """
+    main = build_looper_tree()
+    main.key = lambda item: item['id']
+    main.data = [{'id': 1, 'v': 'a'}, {'id': 2, 'v': 'b'}]
+    old = items_of(main, Looper)
+    main.data = [{'id': 2, 'v': 'c'}, {'id': 1, 'v': 'a'}]
+    children = items_of(main, Looper)
+    assert children == old[::-1]
+    assert [c.value['v'] for c in children] == ['c', 'a']
+
+
+KEY_SOURCE = dedent("""\
+from enaml.core.api import Declarative, Looper
+
+enamldef Item(Declarative):
+    attr value
+    attr label
+    attr legacy
+
+enamldef Main(Declarative): main:
+    attr data = []
+    Looper:
+        iterable << main.data
+        key = lambda item: item['id']
+        Item:
+            value << loop.item
+            label = str(loop_item)
+            legacy << str(loop_item)
+""")
+
+
+def test_looper_key_new_item():
+    """Test that an iteration matched to a new item object is rebound.
+
+    """
+    main = compile_source(KEY_SOURCE, 'Main')()
+    main.data = [{'id': 1, 'v': 'a'}, {'id': 2, 'v': 'b'}]
+    main.initialize()
+    old = items_of(main, Looper)
+    assert [c.legacy for c in old] == [str(d) for d in main.data]
+    main.data = [{'id': 2, 'v': 'c'}, {'id': 1, 'v': 'a'}]
+    children = items_of(main, Looper)
+    assert children == old[::-1]
+    assert [c.value for c in children] == main.data
+    assert [c.label for c in children] == [str(d) for d in main.data]
+    assert [c.legacy for c in children] == [str(d) for d in main.data]
+
+
+def test_looper_unhashable_items():
+    """Test that unhashable items are supported without a key function.
+
+    """
+    main = build_looper_tree()
+    main.data = [[1], [2], [3]]
+    old = items_of(main, Looper)
+    main.data = [[3], [1]]
+    assert items_of(main, Looper) == [old[2], old[0]]
+    assert old[1].is_destroyed
+
+
+CONTAINER_SOURCE = dedent("""\
+from atom.api import ContainerList
+from enaml.core.api import Declarative, Looper, d_
+
+class Model(Declarative):
+
+    data = d_(ContainerList())
+
+enamldef Item(Declarative):
+    attr index
+    attr value
+
+enamldef Main(Model): main:
+    Looper:
+        iterable << main.data
+        Item:
+            index << loop.index
+            value << loop.item
+""")
+
+
+OPERATIONS = {
+    'append': lambda data: data.append('x'),
+    'extend': lambda data: data.extend(['x', 'y']),
+    'iadd': lambda data: data.__iadd__(['x']),
+    'insert': lambda data: data.insert(1, 'x'),
+    'insert negative': lambda data: data.insert(-1, 'x'),
+    'insert out of range': lambda data: data.insert(10, 'x'),
+    'remove': lambda data: data.remove('b'),
+    'pop': lambda data: data.pop(),
+    'pop index': lambda data: data.pop(0),
+    'del': lambda data: data.__delitem__(-2),
+    'setitem': lambda data: data.__setitem__(1, 'x'),
+    'setitem slice': lambda data: data.__setitem__(slice(0, 2), ['x']),
+    'sort': lambda data: data.sort(reverse=True),
+}
+
+
+@pytest.mark.parametrize('operation', OPERATIONS)
+def test_looper_container_operations(operation):
+    """Test that the operations on a ContainerList update the iterations.
+
+    """
+    main = compile_source(CONTAINER_SOURCE, 'Main')()
+    main.data = ['a', 'b', 'c']
+    main.initialize()
+    old = {c.value: c for c in main.children if not isinstance(c, Looper)}
+    OPERATIONS[operation](main.data)
+    children = [c for c in main.children if not isinstance(c, Looper)]
+    assert [c.value for c in children] == list(main.data)
+    assert [c.index for c in children] == list(range(len(main.data)))
+    assert isinstance(main.children[-1], Looper)
+    looper = main.children[-1]
+    assert sum(looper.items, []) == children
+    if operation != 'setitem slice':
+        # Only the items of the affected values are created or destroyed.
+        for child in children:
+            if child.value in old:
+                assert child is old[child.value]
+        for value, child in old.items():
+            assert child.is_destroyed is (value not in main.data)
+
+
+def test_looper_container_source_change():
+    """Test that the looper stops observing a list which is not its iterable.
+
+    """
+    main = compile_source(CONTAINER_SOURCE, 'Main')()
+    main.data = ['a']
+    main.initialize()
+    looper = main.children[-1]
+    main.data = ['b', 'c']
+    main.data.append('d')
+    assert [c.value for c in main.children[:-1]] == ['b', 'c', 'd']
+    callback = looper._on_iterable_operation
+    assert main.has_observer('data', callback)
+    looper.destroy()
+    assert not main.has_observer('data', callback)
+
+
+def test_looper_container_equal_source():
+    """Test an operation on an equal list assigned to the source member.
+
+    """
+    main = compile_source(CONTAINER_SOURCE, 'Main')()
+    main.data = [100, 1, 101]
+    main.initialize()
+    main.data = [100, 1, 101]
+    main.data.pop()
+    children = [c for c in main.children if not isinstance(c, Looper)]
+    assert [c.value for c in children] == [100, 1]
+    assert [c.index for c in children] == [0, 1]
+    main.data.append(2)
+    children = [c for c in main.children if not isinstance(c, Looper)]
+    assert [c.value for c in children] == [100, 1, 2]
+
+
+POOL_SOURCE = dedent("""\
+from atom.api import Bool
+from enaml.core.api import Conditional, Declarative, Looper, d_
+
+class Visible(Declarative):
+
+    visible = d_(Bool(True))
+
+enamldef Item(Visible):
+    attr value
+    attr label
+    attr legacy
+
+enamldef Main(Declarative): main:
+    attr data = []
+    attr show = True
+    Looper:
+        iterable << main.data
+        pool_size = 2
+        Item:
+            value << loop.item
+            label = 'item %s' % loop.item
+            legacy << str(loop_item)
+    Conditional:
+        keep_alive = True
+        condition << main.show
+        Item:
+            value = 'conditional'
+""")
+
+
+def test_looper_pool():
+    """Test that released iterations are pooled and reused.
+
+    """
+    main = compile_source(POOL_SOURCE, 'Main')()
+    looper = main.children[0]
+    main.data = ['a', 'b', 'c']
+    main.initialize()
+    old = items_of(main, Looper)[:3]
+    assert [c.legacy for c in old] == ['a', 'b', 'c']
+
+    main.data = ['d']
+    active = sum(looper.items, [])
+    assert [(c.value, c.label) for c in active] == [('d', 'item d')]
+    # The subscriptions to the untraced legacy locals are updated too.
+    assert [c.legacy for c in active] == ['d']
+    # One iteration is rebound, the two other ones are pooled and hidden.
+    assert active[0] in old
+    assert len(looper._pool) == 2
+    pooled = [it.nodes[0] for it in looper._pool]
+    assert not any(c.visible or c.is_destroyed for c in pooled)
+    assert set(looper.pattern_items()) == set(old)
+
+    main.data = ['d', 'e', 'f', 'g']
+    active = sum(looper.items, [])
+    assert [(c.value, c.label) for c in active] == [
+        ('d', 'item d'), ('e', 'item e'), ('f', 'item f'), ('g', 'item g')
+    ]
+    assert [c.legacy for c in active] == ['d', 'e', 'f', 'g']
+    assert set(active[:3]) == set(old)
+    assert all(c.visible for c in active)
+    assert items_of(main, Looper)[:4] == active
+    assert looper._pool == []
+
+
+def test_conditional_keep_alive():
+    """Test that a kept alive conditional hides its items.
+
+    """
+    main = compile_source(POOL_SOURCE, 'Main')()
+    main.initialize()
+    conditional = main.children[-1]
+    item, = conditional.items
+    main.show = False
+    assert conditional.items == [item]
+    assert not item.visible and not item.is_destroyed
+    main.show = True
+    assert conditional.items == [item]
+    assert item.visible
+
+    main.show = False
+    conditional.keep_alive = False
+    assert item.is_destroyed
+    assert conditional.items == []
+    main.show = True
+    new, = conditional.items
+    assert new is not item and new.visible
+
+
+BOUND_VISIBLE_SOURCE = dedent("""\
+from atom.api import Bool
+from enaml.core.api import Conditional, Declarative, d_
+
+class Visible(Declarative):
+
+    visible = d_(Bool(True))
+
+enamldef Main(Declarative): main:
+    attr show = True
+    attr shown = True
+    attr synced = True
+    Conditional:
+        keep_alive = True
+        condition << main.show
+        Visible:
+            visible << main.shown
+        Visible:
+            visible := main.synced
+""")
+
+
+def test_conditional_keep_alive_bound_visible():
+    """Test that the bindings of a hidden item do not show it again.
+
+    """
+    main = compile_source(BOUND_VISIBLE_SOURCE, 'Main')()
+    main.initialize()
+    bound, synced = main.children[-1].items
+    main.show = False
+    assert not bound.visible and not synced.visible
+    # Hiding the items is not written back to the bound attribute.
+    assert main.synced
+
+    main.shown = False
+    main.shown = True
+    assert not bound.visible
+    main.shown = False
+    main.show = True
+    assert not bound.visible and synced.visible
+
+    main.shown = True
+    assert bound.visible
+    main.show = False
+    main.synced = False
+    main.show = True
+    assert bound.visible and not synced.visible
+
+
+NESTED_HIDDEN_SOURCE = dedent("""\
+from atom.api import Bool
+from enaml.core.api import Conditional, Declarative, Looper, d_
+
+class Visible(Declarative):
+
+    visible = d_(Bool(True))
+
+enamldef Main(Declarative): main:
+    attr data = ['a']
+    attr show = True
+    attr flag = True
+    Looper:
+        iterable << main.data
+        pool_size = 1
+        Conditional:
+            keep_alive = True
+            condition << main.show
+            Visible:
+                visible << main.flag
+""")
+
+
+def test_nested_hidden_bound_visible():
+    """Test an item hidden by a conditional and a pooled iteration.
+
+    """
+    main = compile_source(NESTED_HIDDEN_SOURCE, 'Main')()
+    main.initialize()
+    item, = [c for c in main.children if c.get_member('visible')]
+    main.show = False
+    main.data = []
+    assert not item.visible
+    # The conditional shows its items while the iteration is pooled.
+    main.show = True
+    assert not item.visible
+    main.data = ['b']
+    assert item.visible
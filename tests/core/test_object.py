@@ -0,0 +1,188 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the bulk manipulation of the children of an Object.
+
+"""
+import pytest
+from atom.api import List
+
+from enaml.core.object import Object, increasing_subsequence
+from enaml.widgets.toolkit_object import ProxyToolkitObject, ToolkitObject
+
+
+class Recorder(Object):
+
+    events = List()
+
+    def child_added(self, child):
+        self.events.append(('added', child.name))
+
+    def child_moved(self, child):
+        self.events.append(('moved', child.name))
+
+    def child_removed(self, child):
+        self.events.append(('removed', child.name))
+
+
+def make_children(parent, names):
+    children = [Object(name=name) for name in names]
+    for child in children:
+        child.set_parent(parent)
+    parent.events = []
+    return children
+
+
+@pytest.mark.parametrize('values, expected', [
+    ([], set()),
+    ([None, None], set()),
+    ([0, 1, 2], {0, 1, 2}),
+    ([2, None, 0, 1], {2, 3}),
+    ([3, 0, 1, 4, 2], {1, 2, 4}),
+])
+def test_increasing_subsequence(values, expected):
+    """Test computing the positions of a longest increasing subsequence.
+
+    """
+    assert increasing_subsequence(values) == expected
+
+
+def test_replace_children():
+    """Test adding, moving and removing children at once.
+
+    """
+    parent = Recorder()
+    a, b, c, d = make_children(parent, 'abcd')
+    e = Object(name='e')
+    parent.replace_children([b, e, d, a])
+
+    assert parent.children == [b, e, d, a]
+    assert c.parent is None
+    assert e.parent is parent
+    assert parent.events == [('removed', 'c'), ('added', 'e'), ('moved', 'a')]
+
+
+def test_replace_children_no_change():
+    """Test that replacing the children by the same ones is a no-op.
+
+    """
+    parent = Recorder()
+    children = make_children(parent, 'abc')
+    parent.replace_children(children)
+    assert parent.children == children
+    assert parent.events == []
+
+
+def test_replace_children_reparenting():
+    """Test that new children are removed from their old parent.
+
+    """
+    old_parent = Recorder()
+    a, b = make_children(old_parent, 'ab')
+    parent = Recorder()
+    parent.replace_children([b])
+
+    assert old_parent.children == [a]
+    assert old_parent.events == [('removed', 'b')]
+    assert b.parent is parent
+    assert parent.events == [('added', 'b')]
+
+
+@pytest.mark.parametrize('children, error', [
+    (lambda parent, child: [child, child], ValueError),
+    (lambda parent, child: [parent], ValueError),
+    (lambda parent, child: [child, 1], TypeError),
+])
+def test_replace_children_validation(children, error):
+    """Test that invalid children are rejected without modifying the tree.
+
+    """
+    parent = Recorder()
+    child, = make_children(parent, 'a')
+    with pytest.raises(error):
+        parent.replace_children(children(parent, child))
+    assert parent.children == [child]
+
+
+class RecordingProxy(ProxyToolkitObject):
+
+    events = List()
+
+    def child_added(self, child):
+        self.events.append(('added', child.declaration.name))
+
+    def child_removed(self, child):
+        self.events.append(('removed', child.declaration.name))
+
+    def children_replaced(self, added, moved, removed):
+        self.events.append((
+            'replaced',
+            [p.declaration.name for p in added],
+            [p.declaration.name for p in moved],
+            [p.declaration.name for p in removed],
+        ))
+
+
+def make_toolkit_object(name):
+    obj = ToolkitObject(name=name)
+    obj.proxy = RecordingProxy(declaration=obj)
+    obj.proxy_is_active = True
+    return obj
+
+
+def test_toolkit_object_children_replaced():
+    """Test that the proxy is notified once of all the changes.
+
+    """
+    parent = make_toolkit_object('parent')
+    a, b, c = [make_toolkit_object(name) for name in 'abc']
+    parent.insert_children(None, [a, b])
+    assert parent.proxy.events == [('added', 'a'), ('added', 'b')]
+
+    parent.proxy.events = []
+    parent.replace_children([b, c, a])
+    assert parent.proxy.events == [('replaced', ['c'], ['b'], [])]
+
+    parent.proxy.events = []
+    parent.replace_children([c])
+    assert parent.proxy.events == [('replaced', [], [], ['b', 'a'])]
+    assert not parent.replacing_children
+
+
+class DefaultProxy(ProxyToolkitObject):
+
+    events = List()
+
+    def child_added(self, child):
+        self.events.append(('added', child.declaration.name))
+
+    def child_moved(self, child):
+        self.events.append(('moved', child.declaration.name))
+
+    def child_removed(self, child):
+        self.events.append(('removed', child.declaration.name))
+
+
+def test_proxy_children_replaced_default():
+    """Test that the default proxy handler dispatches the changes in order.
+
+    """
+    parent = ToolkitObject(name='parent')
+    parent.proxy = DefaultProxy(declaration=parent)
+    parent.proxy_is_active = True
+    a, b, c, d = [make_toolkit_object(name) for name in 'abcd']
+    parent.insert_children(None, [a, b, c])
+
+    parent.proxy.events = []
+    parent.replace_children([c, d, b])
+    assert parent.proxy.events == [
+        ('removed', 'a'), ('moved', 'c'), ('added', 'd'),
+    ]
+
+    parent.proxy.events = []
+    parent.insert_children(None, [c])
+    assert parent.proxy.events == [('moved', 'c')]
@@ -336,4 +336,55 @@ def test_subscription_operator_walrus():
     assert label.text == '4'
     # This is the same behavior as everywhere else where access can use a bare name
     # but assignment needs a qualified name.
-    assert window.label2.text == '5'
\ No newline at end of file
+    assert window.label2.text == '5'
+
+
+CONSTANT_EXPRESSIONS = {
+    "'Save'": 'Save',
+    '0': 0,
+    '5': 5,
+    '-1': -1,
+    '2 ** 10': 1024,
+    '(0, (1.5, None))': (0, (1.5, None)),
+    'True': True,
+}
+
+
+@pytest.mark.parametrize('expr', CONSTANT_EXPRESSIONS)
+def test_simple_operator_constant(expr):
+    """Test that literal expressions are bound to a precomputed value.
+
+    """
+    from enaml.core.standard_handlers import StandardConstantReadHandler
+    source = dedent("""\
+    from enaml.core.declarative import Declarative
+
+    enamldef Main(Declarative):
+        attr value = %s
+    """) % expr
+    Main = compile_source(source, 'Main')
+    pair = Main.__node__.engine._handlers["value"].read_pair
+    assert isinstance(pair.reader, StandardConstantReadHandler)
+    assert Main().value == CONSTANT_EXPRESSIONS[expr]
+
+
+@pytest.mark.parametrize('expr', ['[1, 2]', '{1: 2}', '(1, [2])', 'name'])
+def test_simple_operator_not_constant(expr):
+    """Test that mutable or dynamic expressions are evaluated per instance.
+
+    """
+    from enaml.core.standard_handlers import StandardReadHandler
+    source = dedent("""\
+    from enaml.core.declarative import Declarative
+
+    enamldef Main(Declarative):
+        name = 'a'
+        attr value = %s
+    """) % expr
+    Main = compile_source(source, 'Main')
+    pair = Main.__node__.engine._handlers["value"].read_pair
+    assert isinstance(pair.reader, StandardReadHandler)
+    a, b = Main(), Main()
+    assert a.value == b.value
+    if expr != 'name':
+        assert a.value is not b.value
@@ -0,0 +1,102 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+import io
+import json
+import time
+
+from enaml.core.profiling import Profiler
+
+
+class SectionProfiler(Profiler):
+
+    active = None
+
+    REPORT_PREFIX = 'sections'
+
+    def record(self, name):
+        return self.records.setdefault(name, {
+            'name': name, 'own': 0.0, 'cumulative': 0.0
+        })
+
+    def report_header(self):
+        return 'name | own'
+
+    def report_row(self, row):
+        return '%s | %.3f' % (row['name'], row['own'])
+
+    def to_json(self):
+        return [dict(r) for r in self.records.values()]
+
+
+def test_profiler_nested_sections():
+    """Test that the own time of a section excludes its nested sections.
+
+    """
+    profiler = SectionProfiler()
+    outer = profiler.record('outer')
+    inner = profiler.record('inner')
+    with profiler.section(outer, 'own'):
+        with profiler.section(inner, 'own'):
+            time.sleep(0.02)
+    assert inner['own'] == inner['cumulative'] >= 0.02
+    assert outer['cumulative'] >= inner['cumulative']
+    assert outer['own'] < 0.02
+    assert not profiler._stack
+
+
+def test_profiler_enable_disable():
+    """Test that a single profiler of a type is active at a time.
+
+    """
+    profiler = SectionProfiler.enable()
+    try:
+        assert SectionProfiler.enable() is profiler
+        assert Profiler.active is None
+    finally:
+        assert SectionProfiler.disable() is profiler
+    assert SectionProfiler.active is None
+
+
+def test_profiler_report(tmp_path):
+    """Test the report and the JSON dump of a profiler.
+
+    """
+    profiler = SectionProfiler()
+    with profiler.section(profiler.record('a'), 'own'):
+        pass
+    with profiler.section(profiler.record('b'), 'own'):
+        time.sleep(0.01)
+
+    out = io.StringIO()
+    profiler.report('own', limit=1, file=out)
+    lines = out.getvalue().splitlines()
+    assert lines[0] == 'sections: name | own'
+    assert len(lines) == 2 and lines[1].startswith('sections: b |')
+
+    path = tmp_path / 'profile.json'
+    profiler.dump_json(str(path))
+    assert [r['name'] for r in json.loads(path.read_text())] == ['a', 'b']
+
+
+def test_profiler_setup_from_env(monkeypatch):
+    """Test enabling a profiler through an environment variable.
+
+    """
+    registered = []
+    monkeypatch.setattr('atexit.register', lambda *args: registered.append(args))
+    monkeypatch.delenv('ENAML_TEST_PROFILE', raising=False)
+    SectionProfiler.setup_from_env('ENAML_TEST_PROFILE')
+    assert SectionProfiler.active is None
+
+    monkeypatch.setenv('ENAML_TEST_PROFILE', '1')
+    try:
+        SectionProfiler.setup_from_env('ENAML_TEST_PROFILE')
+        profiler = SectionProfiler.active
+        assert registered == [(profiler.report,)]
+    finally:
+        SectionProfiler.disable()
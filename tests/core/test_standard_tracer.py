@@ -0,0 +1,120 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from textwrap import dedent
+
+from atom.api import atomref
+
+from enaml.core.standard_tracer import trace_key
+from utils import compile_source
+
+
+SOURCE = dedent("""\
+from atom.api import Atom, Int
+from enaml.core.api import Declarative
+
+class Model(Atom):
+    a = Int()
+    b = Int()
+    switch = Int()
+
+enamldef Main(Declarative):
+    attr model = Model()
+    attr value <<
+        if model.switch:
+            return model.a
+        return model.b
+
+""")
+
+
+def get_observer(main):
+    """Get the observer of Main.value.
+
+    """
+    return main._d_storage['_[value|trace]']
+
+
+def test_observer_reuse():
+    """Test that the observer is reused across evaluations.
+
+    """
+    main = compile_source(SOURCE, 'Main')()
+    model = main.model
+    assert main.value == 0
+    observer = get_observer(main)
+    assert {(r(), n) for r, n in observer.items} == {
+        (main, 'model'), (model, 'switch'), (model, 'b')
+    }
+
+    model.b = 1
+    assert main.value == 1
+    assert get_observer(main) is observer
+
+    # Switching branch replaces the observer.
+    model.switch = 1
+    assert main.value == 0
+    new_observer = get_observer(main)
+    assert new_observer is not observer
+    assert not observer
+    assert model.has_observer('a', new_observer)
+    assert not model.has_observer('b', new_observer)
+    assert model.has_observer('switch', new_observer)
+    assert not model.has_observer('switch', observer)
+
+    model.b = 2
+    assert main.value == 0
+    model.a = 3
+    assert main.value == 3
+
+
+def test_observer_object_change():
+    """Test that the observers are moved when a dependency object changes.
+
+    """
+    main = compile_source(SOURCE, 'Main')()
+    old = main.model
+    assert main.value == 0
+    main.model = new = type(old)(b=4)
+    assert main.value == 4
+    assert not old.has_observers('b')
+    assert not old.has_observers('switch')
+    assert new.has_observer('b', get_observer(main))
+
+    old.b = 5
+    assert main.value == 4
+    new.b = 6
+    assert main.value == 6
+
+
+def test_observer_releases_dependencies():
+    """Test that the traced dependencies do not keep objects alive.
+
+    """
+    main = compile_source(SOURCE, 'Main')()
+    Model = type(main.model)
+    assert main.value == 0
+    main.model = Model(b=1)
+    assert main.value == 1
+    ref = atomref(main.model)
+    main.model = Model(b=2)
+    assert main.value == 2
+    assert not ref
+    assert {r() for r, _ in get_observer(main).items} == {main, main.model}
+
+
+def test_trace_keys_shared():
+    """Test that the storage keys of the tracers are shared between objects.
+
+    """
+    Main = compile_source(SOURCE, 'Main')
+    a, b = Main(), Main()
+    assert a.value == b.value == 0
+    key_a = next(k for k in a._d_storage.keys() if isinstance(k, str))
+    key_b = next(k for k in b._d_storage.keys() if isinstance(k, str))
+    assert key_a == trace_key('value') == '_[value|trace]'
+    assert key_a is key_b
@@ -6,9 +6,9 @@
 # The full license is in the file LICENSE, distributed with this software.
 # ------------------------------------------------------------------------------
 import pytest
-from atom.api import Atom, Value
+from atom.api import Atom, Value, atomref
 from enaml.widgets.api import Label
-from enaml.core.subscription_observer import SubscriptionObserver
+from enaml.core.subscription_observer import SubscriptionObserver, current_change
 
 
 def test_subscription_observer_ref():
@@ -23,6 +23,21 @@ def test_subscription_observer_ref():
     assert not bool(observer)
 
 
+def test_subscription_observer_items():
+    label = Label()
+    observer = SubscriptionObserver(label, "text")
+    assert observer.items == ()
+    items = [(atomref(label), "text"), (atomref(label), "font")]
+    observer = SubscriptionObserver(label, "text", items)
+    assert observer.items == tuple(items)
+
+    with pytest.raises(TypeError):
+        SubscriptionObserver(label, "text", [(atomref(label),)])
+
+    with pytest.raises(TypeError):
+        SubscriptionObserver(label, "text", 1)
+
+
 def test_subscription_observer_new():
     label = Label()
     with pytest.raises(TypeError):
@@ -51,3 +66,25 @@ def test_subscription_observer_update():
     observer()
     assert engine.owner is owner
     assert engine.name is "text"
+
+
+def test_subscription_observer_current_change():
+    class Engine(Atom):
+        change = Value()
+
+        def update(self, owner, name):
+            self.change = current_change()
+
+    class Owner(Atom):
+        _d_engine = Value()
+
+    engine = Engine()
+    owner = Owner(_d_engine=engine)
+
+    observer = SubscriptionObserver(owner, "text")
+    change = {"type": "update", "name": "value"}
+    observer(change)
+    assert engine.change is change
+    assert current_change() is None
+    observer()
+    assert engine.change is None
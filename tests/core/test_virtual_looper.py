@@ -0,0 +1,173 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2025, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from textwrap import dedent
+
+from enaml.core.api import VirtualLooper
+from utils import compile_source, items_of
+
+
+SOURCE = dedent("""\
+from atom.api import ContainerList
+from enaml.core.api import Declarative, VirtualLooper, d_
+
+class Model(Declarative):
+
+    data = d_(ContainerList())
+
+enamldef Item(Declarative):
+    attr index
+    attr value
+    attr label
+
+enamldef Main(Model): main:
+    attr start = 0
+    VirtualLooper:
+        iterable << main.data
+        window_start << main.start
+        window_size = 5
+        overscan = 2
+        Item:
+            index << loop.index
+            value << loop.item
+            label = 'item %s' % loop_item
+""")
+
+
+def build(count=100):
+    """Create an initialized tree with a virtual looper over count items.
+
+    """
+    main = compile_source(SOURCE, 'Main')()
+    main.data = list(range(count))
+    main.initialize()
+    return main
+
+
+def check_window(main, indices):
+    """Check that the created items match the expected indices.
+
+    """
+    items = items_of(main, VirtualLooper)
+    assert [c.index for c in items] == list(indices)
+    assert [c.value for c in items] == [main.data[i] for i in indices]
+    assert [c.label for c in items] == ['item %s' % main.data[i]
+                                        for i in indices]
+
+
+def test_virtual_looper_window():
+    """Test that only the window and the overscan are created.
+
+    """
+    main = build()
+    check_window(main, range(0, 7))
+    main.start = 50
+    check_window(main, range(48, 57))
+    main.start = 98
+    check_window(main, range(96, 100))
+
+
+def test_virtual_looper_recycles_iterations():
+    """Test that moving the window recycles the iterations.
+
+    """
+    main = build()
+    main.start = 50
+    old = items_of(main, VirtualLooper)
+    main.start = 51
+    new = items_of(main, VirtualLooper)
+    check_window(main, range(49, 58))
+    # The items still in the window are kept in place and the released
+    # one is reused for the new item.
+    assert new[:-1] == old[1:]
+    assert new[-1] is old[0]
+    assert not any(c.is_destroyed for c in new)
+
+    main.start = 0
+    check_window(main, range(0, 7))
+    assert set(items_of(main, VirtualLooper)) < set(new)
+
+
+def test_virtual_looper_iterable_changes():
+    """Test the updates of the window on changes of the iterable.
+
+    """
+    main = build(10)
+    main.data.insert(0, -1)
+    check_window(main, range(0, 7))
+    main.data = list(range(3))
+    check_window(main, range(0, 3))
+    main.data = []
+    assert items_of(main, VirtualLooper) == []
+
+
+SCROLL_SOURCE = dedent("""\
+from enaml.core.api import VirtualLooper
+from enaml.widgets.api import Window, Container, ScrollArea, Label
+
+enamldef Main(Window):
+    alias area
+    alias box
+    alias looper
+    attr data = list(range(1000))
+    Container:
+        ScrollArea: area:
+            constraints = [height == 240, width == 200]
+            Container: box:
+                constraints = [height == 24 * len(data)]
+                VirtualLooper: looper:
+                    iterable = data
+                    window_start << area.scroll_position.y // 24
+                    window_size << area.viewport_size.height // 24 + 1
+                    overscan = 2
+                    Label:
+                        text << str(loop.item)
+                        constraints << [
+                            top == box.contents_top + 24 * loop.index,
+                            left == box.contents_left,
+                            height == 24,
+                        ]
+""")
+
+
+def test_virtual_looper_scroll_area(enaml_qtbot):
+    """Test a virtual looper whose window follows a scroll area.
+
+    """
+    from utils import wait_for_window_displayed
+
+    win = compile_source(SCROLL_SOURCE, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    looper = win.looper
+    enaml_qtbot.waitUntil(lambda: win.area.viewport_size.height > 200)
+    # The scroll widget reserves the height of all the items.
+    assert win.box.proxy.widget.height() >= 24 * 1000
+    window_size = looper.window_size
+    assert window_size == win.area.viewport_size.height // 24 + 1
+    assert len(looper.items) == window_size + 2
+
+    win.area.proxy.widget.verticalScrollBar().setValue(2400)
+    assert win.area.scroll_position.y == 2400
+    assert looper.window_start == 100
+    labels = sum(looper.items, [])
+    assert [int(label.text) for label in labels] == list(
+        range(98, 100 + window_size + 2)
+    )
+
+    def items_placed():
+        for label in labels:
+            top = label.proxy.widget.geometry().top()
+            assert top == labels[0].proxy.widget.geometry().top() + 24 * (
+                int(label.text) - 98
+            )
+
+    enaml_qtbot.waitUntil(items_placed)
+
+    win.area.scroll_position = (0, 4800)
+    assert win.area.proxy.widget.verticalScrollBar().value() == 4800
+    assert looper.window_start == 200
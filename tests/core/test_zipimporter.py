@@ -17,7 +17,9 @@ import pytest
 
 from enaml.core.parser import parse
 from enaml.core.enaml_compiler import EnamlCompiler
-from enaml.core.import_hooks import MAGIC_NUMBER, make_file_info, EnamlImporter
+from enaml.core.import_hooks import (CACHE_HEADER, MAGIC_NUMBER,
+                                     make_file_info, EnamlImporter,
+                                     EnamlZipImporter)
 from utils import wait_for_window_displayed
 
 
@@ -29,8 +31,8 @@ def generate_cache(path):
 
     #: Generate cache
     with open('tmp.enamlc', 'wb') as f:
-        f.write(MAGIC_NUMBER)
-        f.write(struct.pack('i', int(os.path.getmtime(path))))
+        ts = struct.pack('<LL', int(os.path.getmtime(path)), 0)
+        f.write(CACHE_HEADER.pack(MAGIC_NUMBER, 0, ts))
         marshal.dump(code, f)
     with open('tmp.enamlc', 'rb') as f:
         data = f.read()
@@ -67,10 +69,10 @@ def make_library(lib):
         #: Generate cache for splitter and notebook
         for src, dst in [
                 (os.path.join(root, 'splitter.enaml'),
-                 make_file_info('splitter.enaml').cache_path),
+                 make_file_info('splitter.enaml', False).cache_path),
                 (os.path.join(root, 'notebook.enaml'),
                  make_file_info('package/subpackage/'
-                                'notebook.enaml').cache_path)
+                                'notebook.enaml', False).cache_path)
                 ]:
             zf.writestr(dst, generate_cache(src),
                         compress_type=zipfile.ZIP_DEFLATED)
@@ -92,6 +94,8 @@ def zip_library():
     yield lib
 
     sys.path.remove(lib)
+    #: Close the archives kept open by the importer
+    EnamlZipImporter.invalidate_caches()
     #: Cleanup
     if os.path.exists(lib):
         os.remove(lib)
@@ -151,3 +155,33 @@ def test_zipimport_package_from_cache(enaml_qtbot, enaml_sleep, zip_library):
         #                                 notebook-enaml-py<ver>-cv<ver>.enamlc
         from package.subpackage import notebook
     assert_window_displays(enaml_qtbot, enaml_sleep, notebook.Main())
+
+
+def test_zipimport_archive_index(zip_library, monkeypatch):
+    """Test that the archive is opened only once to locate and load modules.
+
+    """
+    opened = []
+
+    class CountingZipFile(zipfile.ZipFile):
+
+        def __init__(self, *args, **kwargs):
+            opened.append(args[0])
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(EnamlZipImporter, 'supported_archives',
+                        {'.zip': CountingZipFile})
+    EnamlZipImporter.invalidate_caches()
+
+    for name in ('buttons', 'splitter'):
+        importer = EnamlZipImporter.locate_module(name)
+        assert importer is not None
+        code, _ = importer.get_code()
+    assert EnamlZipImporter.locate_module('missing') is None
+    assert opened == [zip_library]
+
+    # Modifying the archive invalidates the index
+    mtime = os.path.getmtime(zip_library)
+    os.utime(zip_library, (mtime + 1, mtime + 1))
+    assert EnamlZipImporter.locate_module('buttons') is not None
+    assert opened == [zip_library] * 2
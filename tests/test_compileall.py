@@ -73,3 +73,90 @@ def test_tutorials(enaml_run, tmpdir, tutorial):
         # Now run from cache
         mod = importlib.import_module(tutorial)
         mod.main()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_main_workers(tmpdir, monkeypatch, capsys, workers):
+    """Test compiling a directory using worker processes.
+
+    """
+    from enaml.compile_all import main
+    from enaml.core.import_hooks import make_file_info
+
+    dir_path = os.path.abspath(os.path.split(os.path.dirname(__file__))[0])
+    source = os.path.join(dir_path, 'examples', 'tutorial', 'employee')
+    example = os.path.join(tmpdir.strpath, 'employee')
+    shutil.copytree(source, example)
+    clean_cache(example)
+
+    monkeypatch.setattr('sys.argv', ['enaml-compileall', '-j', str(workers),
+                                     '--timings', example])
+    with pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 0
+
+    enaml_files = [f for f in os.listdir(example) if f.endswith('.enaml')]
+    for f in enaml_files:
+        file_info = make_file_info(os.path.join(example, f))
+        assert os.path.isfile(file_info.cache_path)
+    # No temporary file should be left behind
+    assert all(f.endswith('.enamlc')
+               for f in os.listdir(os.path.join(example, '__enamlcache__')))
+
+    out = capsys.readouterr().out
+    assert 'Compilation timings' in out
+    for f in enaml_files:
+        assert os.path.join(example, f) in out.split('timings')[-1]
+
+
+def test_main_invalidation_mode(tmpdir, monkeypatch):
+    """Test generating hash based cache files.
+
+    """
+    from enaml.compile_all import main
+    from enaml.core.import_hooks import (EnamlImporter, CACHE_HASH_BASED,
+                                         make_file_info)
+
+    path = os.path.join(tmpdir.strpath, 'view.enaml')
+    with open(path, 'w') as f:
+        f.write('enamldef Main(Object):\n    pass\n')
+
+    monkeypatch.setattr('sys.argv', ['enaml-compileall', '--invalidation-mode',
+                                     'checked-hash', path])
+    with pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 0
+
+    importer = EnamlImporter(make_file_info(path))
+    _, flags, data = importer._get_magic_info(importer.file_info)
+    assert flags & CACHE_HASH_BASED
+    assert data == importer.get_source_hash()
+
+
+def test_main_cache_prefix(tmpdir, monkeypatch):
+    """Test that the cache prefix is honoured.
+
+    """
+    from enaml.compile_all import main
+    from enaml.core.import_hooks import (make_file_info, get_cache_prefix,
+                                         set_cache_prefix)
+
+    path = os.path.join(tmpdir.strpath, 'src', 'view.enaml')
+    os.mkdir(os.path.dirname(path))
+    with open(path, 'w') as f:
+        f.write('enamldef Main(Object):\n    pass\n')
+
+    old = get_cache_prefix()
+    set_cache_prefix(os.path.join(tmpdir.strpath, 'cache'))
+    try:
+        monkeypatch.setattr('sys.argv', ['enaml-compileall', path])
+        with pytest.raises(SystemExit):
+            main()
+        cache_path = make_file_info(path).cache_path
+    finally:
+        set_cache_prefix(old)
+
+    assert cache_path.startswith(os.path.join(tmpdir.strpath, 'cache'))
+    assert os.path.isfile(cache_path)
+    assert not os.path.exists(os.path.join(tmpdir.strpath, 'src',
+                                           '__enamlcache__'))
@@ -70,3 +70,48 @@ def test_manual_reparenting(enaml_qtbot):
     wait_for_window_displayed(enaml_qtbot, win)
     win.selected_disp = 'C2'
     win.displayables['C2'].btn_clicked = True
+
+
+REPLACED_CHILDREN = \
+"""from enaml.widgets.api import Window, Container, Label
+
+enamldef Main(Window):
+
+    alias container
+
+    Container: container:
+        Label:
+            text = 'a'
+        Label:
+            text = 'b'
+        Label:
+            text = 'c'
+        Label:
+            text = 'd'
+"""
+
+
+def test_replace_children_layout_order(enaml_qtbot):
+    """Test that the widgets are laid out in the order of the new children.
+
+    """
+    from enaml.widgets.api import Label
+
+    win = compile_source(REPLACED_CHILDREN, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+
+    container = win.container
+    a, b, c, d = container.children
+    e = Label(text='e')
+    container.replace_children([d, e, b, a])
+
+    assert c.proxy.widget.parent() is None
+    widgets = [child.proxy.widget for child in container.children]
+    assert all(w.parent() is container.proxy.widget for w in widgets)
+
+    def laid_out_in_order():
+        tops = [w.geometry().top() for w in widgets]
+        assert tops == sorted(tops) and len(set(tops)) == 4
+
+    enaml_qtbot.waitUntil(laid_out_in_order)
@@ -910,3 +910,67 @@ def test_bad_instantiation_8():
     """)
     with pytest.raises(ValueError):
         compile_source(source, 'Main')
+
+
+#------------------------------------------------------------------------------
+# Template Caches
+#------------------------------------------------------------------------------
+CACHE_SOURCE = dedent("""\
+template Foo(Arg):
+    const kind = 'generic'
+
+template Foo(Arg: int):
+    const kind = 'int'
+
+template Foo(Arg: 1):
+    const kind = 'one'
+
+template Foo(Arg: object):
+    const kind = 'object'
+
+""")
+
+
+def test_dispatch_cache():
+    """Test that the specialization is resolved once per dispatch key.
+
+    """
+    Foo = compile_source(CACHE_SOURCE, 'Foo')
+    calls = []
+    get_specialization = Foo.get_specialization
+
+    class Tracking(type(Foo)):
+        def get_specialization(self, args):
+            calls.append(args)
+            return get_specialization(args)
+
+    Foo.__class__ = Tracking
+    assert Foo(1).kind == 'one'
+    assert Foo(2).kind == 'generic'
+    assert Foo(3).kind == 'generic'
+    assert Foo(bool).kind == 'int'
+    assert Foo(str).kind == 'object'
+    assert Foo(bytes).kind == 'object'
+    assert calls == [(1,), (2,), (bool,), (str,), (bytes,)]
+
+
+def test_instance_cache_lru():
+    """Test the bounded instance cache and its statistics.
+
+    """
+    Foo = compile_source(CACHE_SOURCE, 'Foo')
+    Foo.cache_size = 2
+    first = Foo(1)
+    assert Foo(1) is first
+    Foo(2)
+    Foo(1)
+    Foo(3)
+    assert list(Foo.cache) == [(1,), (3,)]
+    assert Foo(1) is first
+    assert Foo(2) is not None
+    info = Foo.cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (3, 4, 2, 2)
+
+    Foo.cache_clear()
+    assert Foo.cache_info() == (0, 0, 2, 0)
+    assert Foo(1) is not first
@@ -58,6 +58,16 @@ def compile_source(source, item, filename='<test>', namespace=None):
     return namespace[item]
 
 
+def items_of(parent, cls):
+    """Get the children of a parent which are not an instance of cls.
+
+    This is used to retrieve the items created by a pattern (Looper,
+    DynamicTemplate, ...) in the order of the children of its parent.
+
+    """
+    return [c for c in parent.children if not isinstance(c, cls)]
+
+
 def run_pending_tasks(qtbot, timeout=1000):
     """Run all enaml pending tasks.
 
@@ -6,8 +6,11 @@
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
 """Test the re-ordering of the Notebook tabs."""
+import itertools
 import random
 
+import pytest
+
 from utils import compile_source, wait_for_window_displayed
 
 
@@ -43,6 +46,7 @@ def get_qt_tab_order(qt_notebook):
     # Assumes QTabWidget-like API
     return [qt_notebook.tabText(i) for i in range(qt_notebook.count())]
 
+
 def test_tab_order_matches_declaration_after_reorder(enaml_qtbot, enaml_sleep):
 
     win = compile_source(SOURCE, "Main")()
@@ -56,3 +60,60 @@ def test_tab_order_matches_declaration_after_reorder(enaml_qtbot, enaml_sleep):
     enaml_qtbot.wait(enaml_sleep)
 
     assert win.tabs == get_qt_tab_order(win.notebook.proxy.widget)
+
+
+@pytest.mark.parametrize(
+    "order", list(itertools.permutations(range(4)))
+)
+def test_tab_order_matches_declaration_after_permutation(enaml_qtbot, order):
+
+    win = compile_source(SOURCE, "Main")()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+
+    new_order = [win.tabs[i] for i in order]
+    win.tabs = new_order
+
+    assert get_qt_tab_order(win.notebook.proxy.widget) == new_order
+
+
+PAGES = """
+from enaml.widgets.api import Window, Notebook, Page
+
+enamldef Main(Window):
+
+    alias notebook: nb
+
+    Notebook: nb:
+        Page:
+            title = 'a'
+        Page:
+            title = 'b'
+        Page:
+            title = 'c'
+        Page:
+            title = 'd'
+"""
+
+
+@pytest.mark.parametrize(
+    "order", list(itertools.permutations(range(4)))
+)
+def test_tab_order_after_replace_children(enaml_qtbot, order):
+
+    from enaml.widgets.api import Page
+
+    win = compile_source(PAGES, "Main")()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+
+    notebook = win.notebook
+    pages = notebook.children + [Page(title='e')]
+    # Drop one of the pages and add a new one.
+    new_pages = [pages[i + 1] for i in order]
+    notebook.replace_children(new_pages)
+
+    assert pages[0].proxy.widget.parent() is None
+    assert get_qt_tab_order(notebook.proxy.widget) == [
+        p.title for p in new_pages
+    ]